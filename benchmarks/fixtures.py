@@ -0,0 +1,210 @@
+import random
+import sqlite3
+import discord
+from enum import IntFlag, auto
+from typing import Any, Dict, Final, List, NamedTuple, Optional
+from discord.ext import commands
+from lib.basecog import BaseCog
+from lib.orderedcog import OrderedCog
+from lib.servercog import ServerCog, Probe
+from lib.database import Database
+
+SYNTHETIC_COG: Final[str] = "synthetic"
+
+
+class Sizes(NamedTuple):
+    users: int = 10000
+    channels: int = 1000
+    commands: int = 500
+    grants: int = 5
+    admins: int = 10
+
+
+def synthetic_commands(sizes: Sizes) -> List[str]:
+    return [f"synthetic-{index}" for index in range(sizes.commands)]
+
+
+def populate(db: Database, sizes: Sizes, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    command_names = synthetic_commands(sizes)
+    user_ids = range(1, sizes.users + 1)
+    channel_ids = range(10 ** 9, 10 ** 9 + sizes.channels)
+    script = db.statements
+    connection = sqlite3.connect(db.db_path)
+    try:
+        with connection:
+            connection.execute(script["insert_cog"], (SYNTHETIC_COG,))
+            cog_id = connection.execute(
+                script["select_cog_id"],
+                (SYNTHETIC_COG,)
+            ).fetchone()[0]
+            connection.executemany(
+                script["insert_command"],
+                [(name, cog_id) for name in command_names]
+            )
+            command_ids = {
+                name: connection.execute(
+                    script["select_command_id"],
+                    (name,)
+                ).fetchone()[0]
+                for name in command_names
+            }
+            for table, ids in (("user", user_ids), ("channel", channel_ids)):
+                connection.executemany(
+                    script[f"insert_{table}"],
+                    [(principal_id,) for principal_id in ids]
+                )
+                connection.executemany(
+                    script[f"insert_{table}_command"],
+                    [
+                        (principal_id, command_ids[name], cog_id)
+                        for principal_id in ids
+                        for name in rng.sample(command_names, sizes.grants)
+                    ]
+                )
+                connection.executemany(
+                    script[f"insert_{table}_cog"],
+                    [(principal_id, cog_id) for principal_id in ids]
+                )
+
+            connection.executemany(
+                script["insert_admin"],
+                [(user_id,) for user_id in user_ids[:sizes.admins]]
+            )
+    finally:
+        connection.close()
+
+
+def grant_perms(db: Database, cog_name: str, sizes: Sizes) -> None:
+    script = db.statements
+    connection = sqlite3.connect(db.db_path)
+    try:
+        with connection:
+            connection.execute(script["insert_cog"], (cog_name,))
+            cog_id = connection.execute(
+                script["select_cog_id"],
+                (cog_name,)
+            ).fetchone()[0]
+            connection.executemany(
+                script["insert_user_perm"],
+                [
+                    (user_id, cog_id, user_id % 3)
+                    for user_id in range(1, sizes.users + 1, 2)
+                ]
+            )
+            connection.executemany(
+                script["insert_channel_perm"],
+                [
+                    (channel_id, cog_id, channel_id % 2)
+                    for channel_id in range(
+                        10 ** 9,
+                        10 ** 9 + sizes.channels
+                    )
+                ]
+            )
+    finally:
+        connection.close()
+
+
+class FakeMessageable:
+    def __init__(self, object_id: int, name: str) -> None:
+        self.id = object_id
+        self.name = name
+        self.sent = 0
+
+    async def send(self, *args: Any, **kwargs: Any) -> None:
+        self.sent += 1
+
+
+class FakeWebhook:
+    async def delete(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
+class FakeChannel(FakeMessageable):
+    async def webhooks(self) -> List[FakeWebhook]:
+        return [FakeWebhook()]
+
+
+class FakeDM(discord.DMChannel):
+    def __init__(self, channel_id: int) -> None:
+        self.id = channel_id
+
+
+class FakeUser:
+    def __init__(self, user_id: int) -> None:
+        self.id = user_id
+        self.name = f"user-{user_id}"
+
+
+class FakeResolver:
+    def __init__(self) -> None:
+        self._channels: Dict[int, FakeChannel] = {}
+
+    async def user(self, user_id: int) -> FakeUser:
+        return FakeUser(user_id)
+
+    async def dm(self, user_id: int) -> FakeMessageable:
+        return FakeMessageable(user_id, f"dm-{user_id}")
+
+    async def channel(self, channel_id: int) -> FakeChannel:
+        channel = self._channels.get(channel_id)
+        if (channel is None):
+            channel = FakeChannel(channel_id, f"channel-{channel_id}")
+            self._channels[channel_id] = channel
+
+        return channel
+
+
+class FakeCommand:
+    def __init__(self, qualified_name: str) -> None:
+        self.qualified_name = qualified_name
+
+
+class FakeContext:
+    def __init__(
+            self,
+            bot: commands.Bot,
+            author_id: int,
+            channel: Any,
+            command: Any,
+            cog: Optional[commands.Cog] = None
+    ) -> None:
+        self.bot = bot
+        self.author = FakeUser(author_id)
+        self.channel = channel
+        self.command = command
+        self.cog = cog
+        self.sent = 0
+
+    async def send(self, *args: Any, **kwargs: Any) -> None:
+        self.sent += 1
+
+
+class BenchCog(BaseCog, name="bench"):
+    @commands.group(name="bench", invoke_without_command=True)
+    async def bench_group(self, ctx: commands.Context) -> None:
+        pass
+
+    @bench_group.command(name="ping")
+    async def bench_ping(self, ctx: commands.Context) -> None:
+        pass
+
+
+class BenchOrderedCog(OrderedCog, name="bench-ordered"):
+    @commands.command(name="bench-ordered")
+    async def bench_ordered(self, ctx: commands.Context) -> None:
+        pass
+
+
+class BenchServerCog(ServerCog, name="bench-server"):
+    class State(IntFlag):
+        ACTIVE = auto()
+        INACTIVE = auto()
+
+    def probes(self) -> Dict[str, Probe]:
+        return {}
+
+    @commands.command(name="bench-server")
+    async def bench_server(self, ctx: commands.Context) -> None:
+        pass
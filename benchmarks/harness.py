@@ -0,0 +1,61 @@
+import time
+import statistics
+from typing import Awaitable, Callable, List, NamedTuple
+
+Operation = Callable[[int], Awaitable[object]]
+
+
+class Result(NamedTuple):
+    name: str
+    iterations: int
+    ops_per_second: float
+    p50: float
+    p99: float
+    mean: float
+
+
+def percentile(samples: List[float], q: float) -> float:
+    ordered = sorted(samples)
+    index = min(int(round(q * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+async def measure(
+        name: str,
+        operation: Operation,
+        iterations: int,
+        warmup: int = 0
+) -> Result:
+    for iteration in range(warmup):
+        await operation(iteration)
+
+    samples: List[float] = []
+    start = time.perf_counter()
+    for iteration in range(iterations):
+        before = time.perf_counter()
+        await operation(iteration)
+        samples.append(time.perf_counter() - before)
+
+    elapsed = time.perf_counter() - start
+    return Result(
+        name,
+        iterations,
+        iterations / elapsed if elapsed else float("inf"),
+        percentile(samples, 0.5),
+        percentile(samples, 0.99),
+        statistics.fmean(samples)
+    )
+
+
+def report(results: List[Result]) -> str:
+    lines = [f"{'benchmark':<36} {'iterations':>10} {'ops/sec':>12} "
+             f"{'p50':>10} {'p99':>10} {'mean':>10}"]
+    for result in results:
+        lines.append(
+            f"{result.name:<36} {result.iterations:>10} "
+            f"{result.ops_per_second:>12.1f} "
+            f"{result.p50 * 1e6:>8.1f}us {result.p99 * 1e6:>8.1f}us "
+            f"{result.mean * 1e6:>8.1f}us"
+        )
+
+    return "\n".join(lines)
@@ -0,0 +1,257 @@
+import os
+import sys
+import json
+import random
+import asyncio
+import argparse
+import tempfile
+import discord
+from typing import Any, List
+from discord.ext import commands
+from lib.config import Config
+from lib.database import Database
+from lib.orderedcog import OrderedCog
+from lib.servercog import ServerCog
+from benchmarks.fixtures import (BenchCog, BenchOrderedCog, BenchServerCog,
+                                 FakeCommand, FakeContext, FakeDM,
+                                 FakeResolver, Sizes, grant_perms, populate,
+                                 synthetic_commands)
+from benchmarks.harness import Result, measure, report
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    defaults = Sizes()
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.run",
+        description="Benchmarks permission checks and database helpers "
+                    "against a synthetic database."
+    )
+    parser.add_argument("--users", type=int, default=defaults.users)
+    parser.add_argument("--channels", type=int, default=defaults.channels)
+    parser.add_argument("--commands", type=int, default=defaults.commands)
+    parser.add_argument("--grants", type=int, default=defaults.grants,
+                        help="commands granted to each user and channel")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--table-iterations", type=int, default=3,
+                        help="iterations of the print-*-table commands")
+    parser.add_argument("--write-iterations", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--db",
+                        help="keep the synthetic database here (must not "
+                             "exist yet)")
+    parser.add_argument("--json", help="also write results to this file")
+    parser.add_argument("--filter", default="",
+                        help="only run benchmarks containing this text")
+    return parser.parse_args(argv)
+
+
+async def run(args: argparse.Namespace, db_path: str) -> List[Result]:
+    os.environ.setdefault("BOT_CONFIG", "config/config.json")
+    os.environ.setdefault("BOT_CONSTANTS", "config/constants.json")
+    os.environ.setdefault("BOT_COGS", "config/cogs.json")
+    config = Config.load(os.environ["BOT_CONFIG"])
+    sizes = Sizes(args.users, args.channels, args.commands, args.grants)
+    db = Database(db_path, config.dir.sql, profile=config.database.profile)
+    db.configure()
+    db.migrate(config.dir.migrations)
+    populate(db, sizes, args.seed)
+    grant_perms(db, "bench-ordered", sizes)
+
+    rng = random.Random(args.seed)
+    command_names = synthetic_commands(sizes)
+    user_ids = list(range(1, sizes.users + 1))
+    channel_ids = list(range(10 ** 9, 10 ** 9 + sizes.channels))
+    resolver = FakeResolver()
+    bot = commands.Bot(command_prefix="!", intents=discord.Intents.none())
+    bot.db = db
+    bot.resolver = resolver
+    results: List[Result] = []
+    try:
+        async with bot:
+            base = BenchCog(bot)
+            ordered = BenchOrderedCog(bot)
+            server = BenchServerCog(bot)
+            for cog in (base, ordered, server):
+                await bot.add_cog(cog)
+
+            db_base = bot.get_cog("db-base")
+
+            async def cog_check_channel(_: int) -> Any:
+                ctx = FakeContext(
+                    bot,
+                    rng.choice(user_ids),
+                    await resolver.channel(rng.choice(channel_ids)),
+                    FakeCommand(rng.choice(command_names))
+                )
+                return await base.cog_check(ctx)
+
+            async def cog_check_dm(_: int) -> Any:
+                user_id = rng.choice(user_ids)
+                ctx = FakeContext(
+                    bot,
+                    user_id,
+                    FakeDM(user_id),
+                    FakeCommand(rng.choice(command_names))
+                )
+                return await base.cog_check(ctx)
+
+            perms_check = OrderedCog.assert_perms(1, 0).predicate
+
+            async def assert_perms(_: int) -> Any:
+                ctx = FakeContext(
+                    bot,
+                    rng.choice(user_ids[len(user_ids) // 100:]),
+                    await resolver.channel(rng.choice(channel_ids)),
+                    FakeCommand("bench-ordered"),
+                    ordered
+                )
+                try:
+                    return await perms_check(ctx)
+                except commands.CommandError:
+                    return False
+
+            state_check = ServerCog.assert_state(
+                BenchServerCog.State.ACTIVE
+            ).predicate
+
+            async def assert_state(_: int) -> Any:
+                ctx = FakeContext(
+                    bot,
+                    rng.choice(user_ids),
+                    await resolver.channel(rng.choice(channel_ids)),
+                    FakeCommand("bench-server"),
+                    server
+                )
+                try:
+                    return await state_check(ctx)
+                except commands.CommandError:
+                    return False
+
+            async def print_command_users(_: int) -> Any:
+                ctx = FakeContext(bot, 1, None, None, db_base)
+                await bot.get_command("db print-command-users")(
+                    ctx,
+                    command_name=rng.choice(command_names)
+                )
+
+            async def print_users_table(_: int) -> Any:
+                ctx = FakeContext(bot, 1, None, None, db_base)
+                await bot.get_command("db print-users-table")(ctx)
+
+            async def permit_delete_user(_: int) -> Any:
+                ctx = FakeContext(bot, 1, None, None, db_base)
+                user_id = rng.choice(user_ids)
+                await bot.get_command("db permit-user-command")(
+                    ctx,
+                    user_id,
+                    command_name="bench ping"
+                )
+                await bot.get_command("db delete-user-command")(
+                    ctx,
+                    user_id,
+                    command_name="bench ping"
+                )
+
+            async def permit_delete_channel(_: int) -> Any:
+                ctx = FakeContext(bot, 1, None, None, db_base)
+                channel_id = rng.choice(channel_ids)
+                await bot.get_command("db permit-channel-command")(
+                    ctx,
+                    channel_id,
+                    command_name="bench ping"
+                )
+                await bot.get_command("db delete-channel-command")(
+                    ctx,
+                    channel_id,
+                    command_name="bench ping"
+                )
+
+            async def delete_user(iteration: int) -> Any:
+                ctx = FakeContext(bot, 1, None, None, db_base)
+                await bot.get_command("db delete-user")(
+                    ctx,
+                    user_ids[-1 - iteration]
+                )
+
+            iterations = args.iterations
+            write_iterations = min(args.write_iterations, len(user_ids) // 2)
+            benchmarks = [
+                ("cog_check channel", cog_check_channel, iterations),
+                ("cog_check dm", cog_check_dm, iterations),
+                ("assert_perms", assert_perms, iterations),
+                ("assert_state", assert_state, iterations),
+                ("get_users", lambda _: base.get_users(), iterations),
+                ("get_channels", lambda _: base.get_channels(), iterations),
+                (
+                    "get_command_users",
+                    lambda _: base.get_command_users(
+                        rng.choice(command_names)
+                    ),
+                    iterations
+                ),
+                (
+                    "get_command_channels",
+                    lambda _: base.get_command_channels(
+                        rng.choice(command_names)
+                    ),
+                    iterations
+                ),
+                ("get_admins", lambda _: base.get_admins(), iterations),
+                (
+                    "get_user_perm",
+                    lambda _: ordered.get_user_perm(rng.choice(user_ids)),
+                    iterations
+                ),
+                (
+                    "get_channel_perm",
+                    lambda _: ordered.get_channel_perm(
+                        rng.choice(channel_ids)
+                    ),
+                    iterations
+                ),
+                ("get_state", lambda _: server.get_state(), iterations),
+                ("db print-command-users", print_command_users, iterations),
+                (
+                    "db print-users-table",
+                    print_users_table,
+                    args.table_iterations
+                ),
+                ("db permit/delete user", permit_delete_user,
+                 write_iterations),
+                ("db permit/delete channel", permit_delete_channel,
+                 write_iterations),
+                ("db delete-user", delete_user, write_iterations),
+            ]
+            for name, operation, count in benchmarks:
+                if (args.filter not in name or count <= 0):
+                    continue
+
+                result = await measure(name, operation, count, warmup=1)
+                results.append(result)
+
+            for cog in (server, ordered, base):
+                await bot.remove_cog(cog.qualified_name)
+    finally:
+        db.close()
+
+    return results
+
+
+def main(argv: List[str]) -> None:
+    args = parse_args(argv)
+    if (args.db and os.path.exists(args.db)):
+        sys.exit(f"{args.db} already exists, refusing to overwrite it.")
+
+    with tempfile.TemporaryDirectory() as directory:
+        db_path = args.db or os.path.join(directory, "bench.db")
+        results = asyncio.run(run(args, db_path))
+
+    print(report(results))
+    if (args.json):
+        with open(args.json, "w") as file:
+            json.dump([result._asdict() for result in results], file,
+                      indent=4)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,12 +1,18 @@
+import io
 import os
-import sqlite3
+import csv
+import asyncio
 import discord
 from discord.ext import commands
-from typing import List, Tuple, Final
+from typing import (Any, Dict, Final, List, Mapping, Optional, Sequence,
+                    Tuple, Union)
 from lib.basecog import BaseCog
-from lib.config import Config
+from lib.converters import Targets
+from lib.export import Names, send_records
+from lib.templates import Template
 
 DB_COOLDOWN: Final[float] = 5.0
+BULK_CONCURRENCY: Final[int] = 8
 
 
 class BaseCogDatabase(
@@ -25,8 +31,11 @@ class BaseCogDatabase(
     )
     @commands.cooldown(1, DB_COOLDOWN)
     async def db_group(self, ctx: commands.Context) -> None:
-        constants = Config.from_json(os.environ["BOT_CONSTANTS"])
-        await ctx.send(eval(constants.messages.servers.no_subcommand))
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
+        await ctx.send(constants.messages.servers.no_subcommand.format(
+            prefix=self.bot.command_prefix,
+            command=ctx.command
+        ))
 
     @db_group.command(
         name="print-users-table",
@@ -41,36 +50,12 @@ class BaseCogDatabase(
             ctx: commands.Context
     ) -> None:
         await ctx.send(f"Fetching Users table...")
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        db_path = os.environ["BOT_DB"]
-        with (
-            open(f"{sql_dir}/select_users_table.sql", "r")
-                as sql_select_users_table
-        ):
-            get_user_records = sql_select_users_table.read()
-
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        try:
-            db.execute("PRAGMA FOREIGN_KEYS = ON")
-            cursor = db.cursor()
-            cursor.execute(get_user_records)
-            user_records = cursor.fetchall()
-        finally:
-            db.close()
-
-        message = ""
-        message_limit = int(config.settings.message_limit)
-        for record in user_records:
-            user = await self.bot.fetch_user(record[0])
-            new_row = user.name + ' ' + str(record) + '\n'
-            if (len(message) + len(new_row) > message_limit):
-                await ctx.send(message)
-                message = ""
-
-            message += new_row
-
-        await ctx.send(message)
+        await send_records(
+            ctx,
+            "users",
+            self.bot.db.stream_records("select_users_table"),
+            Names(self.bot).users(keep_id=True)
+        )
 
     @db_group.command(
         name="print-channels-table",
@@ -85,36 +70,12 @@ class BaseCogDatabase(
             ctx: commands.Context
     ) -> None:
         await ctx.send(f"Fetching Channels table...")
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        db_path = os.environ["BOT_DB"]
-        with (
-            open(f"{sql_dir}/select_channels_table.sql", "r")
-                as sql_select_channels_table,
-        ):
-            get_channel_records = sql_select_channels_table.read()
-
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        try:
-            db.execute("PRAGMA FOREIGN_KEYS = ON")
-            cursor = db.cursor()
-            cursor.execute(get_channel_records)
-            channel_records = cursor.fetchall()
-        finally:
-            db.close()
-
-        message = ""
-        message_limit = config.settings.message_limit
-        for record in channel_records:
-            channel = await self.bot.fetch_channel(record[0])
-            new_row = '#' + channel.name + ' ' + str(record) + '\n'
-            if (len(message) + len(new_row) > message_limit):
-                await ctx.send(message)
-                message = ""
-
-            message += new_row
-
-        await ctx.send(message)
+        await send_records(
+            ctx,
+            "channels",
+            self.bot.db.stream_records("select_channels_table"),
+            Names(self.bot).channels(keep_id=True)
+        )
 
     @db_group.command(
         name="print-commands-table",
@@ -128,34 +89,11 @@ class BaseCogDatabase(
             ctx: commands.Context
     ) -> None:
         await ctx.send(f"Fetching Commands table...")
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        db_path = os.environ["BOT_DB"]
-        with (
-            open(f"{sql_dir}/select_commands_table.sql", "r")
-                as sql_select_commands_table,
-        ):
-            get_commands_records = sql_select_commands_table.read()
-
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        try:
-            db.execute("PRAGMA FOREIGN_KEYS = ON")
-            cursor = db.cursor()
-            cursor.execute(get_commands_records)
-            commands_records = cursor.fetchall()
-        finally:
-            db.close()
-        message = ""
-        message_limit = config.settings.message_limit
-        for record in commands_records:
-            new_row = str(record) + '\n'
-            if (len(message) + len(new_row) > message_limit):
-                await ctx.send(message)
-                message = ""
-
-            message += new_row
-
-        await ctx.send(message)
+        await send_records(
+            ctx,
+            "commands",
+            self.bot.db.stream_records("select_commands_table")
+        )
 
     @db_group.command(
         name="print-cogs-table",
@@ -169,35 +107,11 @@ class BaseCogDatabase(
             ctx: commands.Context
     ) -> None:
         await ctx.send(f"Fetching Cogs table...")
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        db_path = os.environ["BOT_DB"]
-        with (
-            open(f"{sql_dir}/select_cogs_table.sql", "r")
-                as sql_select_cogs_table,
-        ):
-            get_cogs_records = sql_select_cogs_table.read()
-
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        try:
-            db.execute("PRAGMA FOREIGN_KEYS = ON")
-            cursor = db.cursor()
-            cursor.execute(get_cogs_records)
-            cogs_records = cursor.fetchall()
-        finally:
-            db.close()
-
-        message = ""
-        message_limit = config.settings.message_limit
-        for record in cogs_records:
-            new_row = str(record) + '\n'
-            if (len(message) + len(new_row) > message_limit):
-                await ctx.send(message)
-                message = ""
-
-            message += new_row
-
-        await ctx.send(message)
+        await send_records(
+            ctx,
+            "cogs",
+            self.bot.db.stream_records("select_cogs_table")
+        )
 
     @db_group.command(
         name="print-user-cogs-table",
@@ -212,38 +126,12 @@ class BaseCogDatabase(
             ctx: commands.Context
     ) -> None:
         await ctx.send(f"Fetching UserCogs table...")
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        db_path = os.environ["BOT_DB"]
-        with (
-            open(f"{sql_dir}/select_user_cogs_table.sql", "r")
-                as sql_select_user_cogs_table,
-        ):
-            get_user_cogs_records = sql_select_user_cogs_table.read()
-
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        try:
-            db.execute("PRAGMA FOREIGN_KEYS = ON")
-            cursor = db.cursor()
-            cursor.execute(get_user_cogs_records)
-            user_cogs_records = cursor.fetchall()
-        finally:
-            db.close()
-
-        message = ""
-        message_limit = config.settings.message_limit
-        for record in user_cogs_records:
-            m_record = list(record)
-            user = await self.bot.fetch_user(record[0])
-            m_record[0] = user.name
-            new_row = str(tuple(m_record)) + '\n'
-            if (len(message) + len(new_row) > message_limit):
-                await ctx.send(message)
-                message = ""
-
-            message += new_row
-
-        await ctx.send(message)
+        await send_records(
+            ctx,
+            "user-cogs",
+            self.bot.db.stream_records("select_user_cogs_table"),
+            Names(self.bot).users()
+        )
 
     @db_group.command(
         name="print-channel-cogs-table",
@@ -258,38 +146,12 @@ class BaseCogDatabase(
             ctx: commands.Context
     ) -> None:
         await ctx.send(f"Fetching ChannelCogs table...")
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        db_path = os.environ["BOT_DB"]
-        with (
-            open(f"{sql_dir}/select_channel_cogs_table.sql", "r")
-                as sql_select_channel_cogs_table,
-        ):
-            get_channel_cogs_records = sql_select_channel_cogs_table.read()
-
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        try:
-            db.execute("PRAGMA FOREIGN_KEYS = ON")
-            cursor = db.cursor()
-            cursor.execute(get_channel_cogs_records)
-            channel_cogs_records = cursor.fetchall()
-        finally:
-            db.close()
-
-        message = ""
-        message_limit = config.settings.message_limit
-        for record in channel_cogs_records:
-            m_record = list(record)
-            channel = await self.bot.fetch_channel(record[0])
-            m_record[0] = "#" + channel.name
-            new_row = str(tuple(m_record)) + '\n'
-            if (len(message) + len(new_row) > message_limit):
-                await ctx.send(message)
-                message = ""
-
-            message += new_row
-
-        await ctx.send(message)
+        await send_records(
+            ctx,
+            "channel-cogs",
+            self.bot.db.stream_records("select_channel_cogs_table"),
+            Names(self.bot).channels()
+        )
 
     @db_group.command(
         name="print-user-commands-table",
@@ -304,38 +166,12 @@ class BaseCogDatabase(
             ctx: commands.Context
     ) -> None:
         await ctx.send(f"Fetching UserCommands table...")
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        db_path = os.environ["BOT_DB"]
-        with (
-            open(f"{sql_dir}/select_user_commands_table.sql", "r")
-                as sql_select_user_commands_table,
-        ):
-            get_user_commands_records = sql_select_user_commands_table.read()
-
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        try:
-            db.execute("PRAGMA FOREIGN_KEYS = ON")
-            cursor = db.cursor()
-            cursor.execute(get_user_commands_records)
-            user_command_records = cursor.fetchall()
-        finally:
-            db.close()
-
-        message = ""
-        message_limit = config.settings.message_limit
-        for record in user_command_records:
-            m_record = list(record)
-            user = await self.bot.fetch_user(record[0])
-            m_record[0] = user.name
-            new_row = str(tuple(m_record)) + '\n'
-            if (len(message) + len(new_row) > message_limit):
-                await ctx.send(message)
-                message = ""
-
-            message += new_row
-
-        await ctx.send(message)
+        await send_records(
+            ctx,
+            "user-commands",
+            self.bot.db.stream_records("select_user_commands_table"),
+            Names(self.bot).users()
+        )
 
     @db_group.command(
         name="print-channel-commands-table",
@@ -350,40 +186,12 @@ class BaseCogDatabase(
             ctx: commands.Context
     ) -> None:
         await ctx.send(f"Fetching ChannelCommands table...")
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        db_path = os.environ["BOT_DB"]
-        with (
-            open(f"{sql_dir}/select_channel_commands_table.sql", "r")
-                as sql_select_channel_commands_table,
-        ):
-            get_channel_commands_records = (
-                sql_select_channel_commands_table.read()
-            )
-
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        try:
-            db.execute("PRAGMA FOREIGN_KEYS = ON")
-            cursor = db.cursor()
-            cursor.execute(get_channel_commands_records)
-            channel_command_records = cursor.fetchall()
-        finally:
-            db.close()
-
-        message = ""
-        message_limit = config.settings.message_limit
-        for record in channel_command_records:
-            m_record = list(record)
-            channel = await self.bot.fetch_channel(record[0])
-            m_record[0] = "#" + channel.name
-            new_row = str(tuple(m_record)) + '\n'
-            if (len(message) + len(new_row) > message_limit):
-                await ctx.send(message)
-                message = ""
-
-            message += new_row
-
-        await ctx.send(message)
+        await send_records(
+            ctx,
+            "channel-commands",
+            self.bot.db.stream_records("select_channel_commands_table"),
+            Names(self.bot).channels()
+        )
 
     @db_group.command(
         name="print-command-users",
@@ -404,38 +212,15 @@ class BaseCogDatabase(
     ) -> None:
         await ctx.send(f"Fetching UserCommands records "
                        f"linked to {command_name}...")
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        db_path = os.environ["BOT_DB"]
-        with (
-            open(f"{sql_dir}/select_command_user_records.sql", "r")
-                as sql_select_command_user_records,
-        ):
-            get_command_users = sql_select_command_user_records.read()
-
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        try:
-            db.execute("PRAGMA FOREIGN_KEYS = ON")
-            cursor = db.cursor()
-            cursor.execute(get_command_users, (command_name,))
-            command_users = cursor.fetchall()
-        finally:
-            db.close()
-
-        message = ""
-        message_limit = config.settings.message_limit
-        for record in command_users:
-            m_record = list(record)
-            user = await self.bot.fetch_user(record[0])
-            m_record[0] = user.name
-            new_row = str(tuple(m_record)) + '\n'
-            if (len(message) + len(new_row) > message_limit):
-                await ctx.send(message)
-                message = ""
-
-            message += new_row
-
-        await ctx.send(message)
+        await send_records(
+            ctx,
+            "command-users",
+            self.bot.db.stream_records(
+                "select_command_user_records",
+                command_name
+            ),
+            Names(self.bot).users()
+        )
 
     @db_group.command(
         name="print-command-channels",
@@ -456,38 +241,15 @@ class BaseCogDatabase(
     ) -> None:
         await ctx.send(f"Fetching ChannelCommands records "
                        f"linked to {command_name}...")
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        db_path = os.environ["BOT_DB"]
-        with (
-            open(f"{sql_dir}/select_command_channel_records.sql", "r")
-                as sql_select_command_channel_records,
-        ):
-            get_command_channels = sql_select_command_channel_records.read()
-
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        try:
-            db.execute("PRAGMA FOREIGN_KEYS = ON")
-            cursor = db.cursor()
-            cursor.execute(get_command_channels, (command_name,))
-            command_channels = cursor.fetchall()
-        finally:
-            db.close()
-
-        message = ""
-        message_limit = config.settings.message_limit
-        for record in command_channels:
-            m_record = list(record)
-            channel = await self.bot.fetch_channel(record[0])
-            m_record[0] = "#" + channel.name
-            new_row = str(tuple(m_record)) + '\n'
-            if (len(message) + len(new_row) > message_limit):
-                await ctx.send(message)
-                message = ""
-
-            message += new_row
-
-        await ctx.send(message)
+        await send_records(
+            ctx,
+            "command-channels",
+            self.bot.db.stream_records(
+                "select_command_channel_records",
+                command_name
+            ),
+            Names(self.bot).channels()
+        )
 
     @db_group.command(
         name="permit-user-command",
@@ -508,55 +270,35 @@ class BaseCogDatabase(
                 description="Name of the command"
             )
     ) -> None:
-        constants = Config.from_json(os.environ["BOT_CONSTANTS"])
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
         try:
-            user = await self.bot.fetch_user(user_id)
-        except NotFound as e:
+            user = await self.bot.resolver.user(user_id)
+        except discord.NotFound:
             await ctx.send(constants.messages.invalid_user)
             return
 
         command = self.bot.get_command(command_name)
         if (command is None):
-            await ctx.send(constants.messages.invalid_channel)
+            await ctx.send(constants.messages.invalid_command)
             return
 
         await ctx.send(f"Permitting user {user.name} "
                        f"to use command {command_name}...")
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        db_path = os.environ["BOT_DB"]
-        with (
-            open(f"{sql_dir}/insert_user.sql", "r")
-            as sql_insert_user,
-            open(f"{sql_dir}/insert_user_command.sql", "r")
-            as sql_insert_user_command,
-            open(f"{sql_dir}/insert_user_cog.sql", "r")
-            as sql_insert_user_cog,
-        ):
-            add_user = sql_insert_user.read()
-            add_user_command = sql_insert_user_command.read()
-            add_cog_user = sql_insert_user_cog.read()
-
         cog_name = command.cog.qualified_name
-        user_commands: List[Tuple[int, str, str]] = []
-        user_commands.append((user_id, command_name, cog_name))
+        command_names: List[str] = [command_name]
         for parent in command.parents:
-            user_commands.append((user_id, parent.qualified_name, cog_name))
+            command_names.append(parent.qualified_name)
 
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        try:
-            db.execute("PRAGMA FOREIGN_KEYS = ON")
-            cursor = db.cursor()
-            cursor.execute(add_user, (user_id,))
-            if (cursor.rowcount):
-                user_dm = await user.create_dm()
-                await user_dm.send(eval(constants.messages.startup))
-
-            cursor.executemany(add_user_command, user_commands)
-            cursor.execute(add_cog_user, (user_id, cog_name))
-            db.commit()
-        finally:
-            db.close()
+        new_user = await self.bot.db.permit_user_commands(
+            user_id,
+            cog_name,
+            command_names
+        )
+        if (new_user):
+            user_dm = await self.bot.resolver.dm(user_id)
+            await user_dm.send(constants.messages.startup.format(
+                prefix=self.bot.command_prefix
+            ))
 
         await ctx.send(constants.messages.db_update)
 
@@ -579,10 +321,10 @@ class BaseCogDatabase(
                 description="Name of the command"
             )
     ) -> None:
-        constants = Config.from_json(os.environ["BOT_CONSTANTS"])
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
         try:
-            channel = await self.bot.fetch_channel(channel_id)
-        except NotFound as e:
+            channel = await self.bot.resolver.channel(channel_id)
+        except discord.NotFound:
             await ctx.send(constants.messages.invalid_channel)
             return
 
@@ -593,42 +335,21 @@ class BaseCogDatabase(
 
         await ctx.send(f"Permitting channel #{channel.name} "
                        f"to use command {command_name}...")
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        db_path = os.environ["BOT_DB"]
-        with (
-            open(f"{sql_dir}/insert_channel.sql", "r")
-            as sql_insert_channel,
-            open(f"{sql_dir}/insert_channel_command.sql", "r")
-            as sql_insert_channel_command,
-            open(f"{sql_dir}/insert_channel_cog.sql", "r")
-            as sql_insert_channel_cog,
-        ):
-            add_channel = sql_insert_channel.read()
-            add_channel_command = sql_insert_channel_command.read()
-            add_cog_channel = sql_insert_channel_cog.read()
-
         cog_name = command.cog.qualified_name
-        channel_commands: List[Tuple[int, str, str]] = []
-        channel_commands.append((channel_id, command_name, cog_name))
+        command_names: List[str] = [command_name]
         for parent in command.parents:
-            channel_commands.append(
-                (channel_id, parent.qualified_name, cog_name))
+            command_names.append(parent.qualified_name)
 
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        try:
-            db.execute("PRAGMA FOREIGN_KEYS = ON")
-            cursor = db.cursor()
-            cursor.execute(add_channel, (channel_id,))
-            if (cursor.rowcount):
-                await self.create_webhook(channel, cog_name)
-                await channel.send(eval(constants.messages.startup))
-
-            cursor.executemany(add_channel_command, channel_commands)
-            cursor.execute(add_cog_channel, (channel_id, cog_name))
-            db.commit()
-        finally:
-            db.close()
+        new_channel = await self.bot.db.permit_channel_commands(
+            channel_id,
+            cog_name,
+            command_names
+        )
+        if (new_channel):
+            await self.create_webhook(channel, cog_name)
+            await channel.send(constants.messages.startup.format(
+                prefix=self.bot.command_prefix
+            ))
 
         await ctx.send(constants.messages.db_update)
 
@@ -651,10 +372,10 @@ class BaseCogDatabase(
                 description="Name of the cog"
             )
     ) -> None:
-        constants = Config.from_json(os.environ["BOT_CONSTANTS"])
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
         try:
-            user = await self.bot.fetch_user(user_id)
-        except NotFound as e:
+            user = await self.bot.resolver.user(user_id)
+        except discord.NotFound:
             await ctx.send(constants.messages.invalid_user)
             return
 
@@ -666,42 +387,22 @@ class BaseCogDatabase(
 
         await ctx.send(f"Permitting user {user.name} to use commands in cog "
                        f"{cog_name}...")
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        db_path = os.environ["BOT_DB"]
-        with (
-            open(f"{sql_dir}/insert_user.sql", "r")
-            as sql_insert_user,
-            open(f"{sql_dir}/insert_user_command.sql", "r")
-            as sql_insert_user_command,
-            open(f"{sql_dir}/insert_user_cog.sql", "r")
-            as sql_insert_user_cog,
-        ):
-            add_user = sql_insert_user.read()
-            add_user_command = sql_insert_user_command.read()
-            add_cog_user = sql_insert_user_cog.read()
-
-        user_commands: List[Tuple[int, str, str]] = []
+        command_names: List[str] = []
         for command in cog.walk_commands():
-            user_commands.append((user_id, command.qualified_name, cog_name))
+            command_names.append(command.qualified_name)
             for parent in command.parents:
-                user_commands.append(
-                    (user_id, parent.qualified_name, cog_name))
+                command_names.append(parent.qualified_name)
 
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        try:
-            db.execute("PRAGMA FOREIGN_KEYS = ON")
-            cursor = db.cursor()
-            cursor.execute(add_user, (user_id,))
-            if (cursor.rowcount):
-                user_dm = await user.create_dm()
-                await user_dm.send(eval(constants.messages.startup))
-
-            cursor.executemany(add_user_command, user_commands)
-            cursor.execute(add_cog_user, (user_id, cog_name))
-            db.commit()
-        finally:
-            db.close()
+        new_user = await self.bot.db.permit_user_commands(
+            user_id,
+            cog_name,
+            command_names
+        )
+        if (new_user):
+            user_dm = await self.bot.resolver.dm(user_id)
+            await user_dm.send(constants.messages.startup.format(
+                prefix=self.bot.command_prefix
+            ))
 
         await ctx.send(constants.messages.db_update)
 
@@ -724,10 +425,10 @@ class BaseCogDatabase(
                 description="Name of the cog"
             )
     ) -> None:
-        constants = Config.from_json(os.environ["BOT_CONSTANTS"])
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
         try:
-            channel = await self.bot.fetch_channel(channel_id)
-        except NotFound as e:
+            channel = await self.bot.resolver.channel(channel_id)
+        except discord.NotFound:
             await ctx.send(constants.messages.invalid_channel)
             return
 
@@ -739,46 +440,320 @@ class BaseCogDatabase(
 
         await ctx.send(f"Permitting channel #{channel.name} to use commands "
                        f"in cog {cog_name}...")
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        db_path = os.environ["BOT_DB"]
-        with (
-            open(f"{sql_dir}/insert_channel.sql", "r")
-            as sql_insert_channel,
-            open(f"{sql_dir}/insert_channel_command.sql", "r")
-            as sql_insert_channel_command,
-            open(f"{sql_dir}/insert_channel_cog.sql", "r")
-            as sql_insert_channel_cog,
-        ):
-            add_channel = sql_insert_channel.read()
-            add_channel_command = sql_insert_channel_command.read()
-            add_cog_channel = sql_insert_channel_cog.read()
-
-        channel_commands: List[Tuple[int, str, str]] = []
+        command_names: List[str] = []
         for command in cog.walk_commands():
-            channel_commands.append(
-                (channel_id, command.qualified_name, cog_name))
+            command_names.append(command.qualified_name)
             for parent in command.parents:
-                channel_commands.append(
-                    (channel_id, parent.qualified_name, cog_name))
+                command_names.append(parent.qualified_name)
 
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        try:
-            db.execute("PRAGMA FOREIGN_KEYS = ON")
-            cursor = db.cursor()
-            cursor.execute(add_channel, (channel_id,))
-            if (cursor.rowcount):
-                await self.create_webhook(channel, cog_name)
-                await channel.send(eval(constants.messages.startup))
-
-            cursor.executemany(add_channel_command, channel_commands)
-            cursor.execute(add_cog_channel, (channel_id, cog_name))
-            db.commit()
-        finally:
-            db.close()
+        new_channel = await self.bot.db.permit_channel_commands(
+            channel_id,
+            cog_name,
+            command_names
+        )
+        if (new_channel):
+            await self.create_webhook(channel, cog_name)
+            await channel.send(constants.messages.startup.format(
+                prefix=self.bot.command_prefix
+            ))
 
         await ctx.send(constants.messages.db_update)
 
+    async def target_ids(
+            self,
+            ctx: commands.Context,
+            targets: Sequence[Union[int, discord.Role]]
+    ) -> List[int]:
+        target_ids: List[int] = []
+        for target in targets:
+            if (isinstance(target, discord.Role)):
+                target_ids.extend(member.id for member in target.members)
+            else:
+                target_ids.append(target)
+
+        for attachment in ctx.message.attachments:
+            if (not attachment.filename.lower().endswith(".csv")):
+                continue
+
+            data = (await attachment.read()).decode("utf-8", "replace")
+            for row in csv.reader(io.StringIO(data)):
+                if (row and row[0].strip().isdigit()):
+                    target_ids.append(int(row[0].strip()))
+
+        return list(dict.fromkeys(target_ids))
+
+    async def resolve_targets(
+            self,
+            kind: str,
+            target_ids: Sequence[int]
+    ) -> Tuple[Dict[int, Any], List[int]]:
+        semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+        resolve = getattr(self.bot.resolver, kind)
+
+        async def fetch(target_id: int) -> Any:
+            async with semaphore:
+                try:
+                    return await resolve(target_id)
+                except discord.HTTPException:
+                    return None
+
+        objects = await asyncio.gather(*map(fetch, target_ids))
+        resolved = {
+            target_id: obj
+            for target_id, obj in zip(target_ids, objects)
+            if obj is not None
+        }
+        invalid = [
+            target_id for target_id in target_ids
+            if target_id not in resolved
+        ]
+        return resolved, invalid
+
+    async def delete_webhooks(
+            self,
+            webhooks: Sequence[Tuple[int, Optional[str]]]
+    ) -> None:
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
+        for webhook_id, token in webhooks:
+            try:
+                if (token is None):
+                    webhook = await self.bot.fetch_webhook(webhook_id)
+                else:
+                    webhook = discord.Webhook.partial(
+                        webhook_id,
+                        token,
+                        client=self.bot
+                    )
+
+                await webhook.delete(
+                    reason=constants.messages.deleted_channel
+                )
+            except discord.NotFound:
+                pass
+
+    async def welcome(
+            self,
+            kind: str,
+            resolved: Mapping[int, Any],
+            new_ids: Sequence[int],
+            cog_names: Sequence[str]
+    ) -> None:
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
+        message = constants.messages.startup.format(
+            prefix=self.bot.command_prefix
+        )
+        semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+
+        async def greet(target_id: int) -> None:
+            async with semaphore:
+                try:
+                    if (kind == "user"):
+                        user_dm = await self.bot.resolver.dm(target_id)
+                        await user_dm.send(message)
+                        return
+
+                    channel = resolved[target_id]
+                    for cog_name in cog_names:
+                        await self.create_webhook(channel, cog_name)
+
+                    await channel.send(message)
+                except discord.HTTPException as e:
+                    print(f"Failed to welcome {kind} {target_id}: {e}")
+
+        await asyncio.gather(*map(greet, new_ids))
+
+    def command_grants(
+            self,
+            command_names: Sequence[str]
+    ) -> Tuple[Dict[str, List[str]], List[str]]:
+        grants: Dict[str, List[str]] = {}
+        invalid: List[str] = []
+        for command_name in command_names:
+            command = self.bot.get_command(command_name)
+            if (command is None or command.cog is None):
+                invalid.append(command_name)
+                continue
+
+            names = grants.setdefault(command.cog.qualified_name, [])
+            names.append(command.qualified_name)
+            for parent in command.parents:
+                names.append(parent.qualified_name)
+
+        return grants, invalid
+
+    def cog_grants(
+            self,
+            cog_names: Sequence[str]
+    ) -> Tuple[Dict[str, List[str]], List[str]]:
+        grants: Dict[str, List[str]] = {}
+        invalid: List[str] = []
+        for cog_name in cog_names:
+            cog = self.bot.get_cog(cog_name)
+            if (cog is None or
+                    not issubclass(type(cog), BaseCog)):
+                invalid.append(cog_name)
+                continue
+
+            names = grants.setdefault(cog_name, [])
+            for command in cog.walk_commands():
+                names.append(command.qualified_name)
+                for parent in command.parents:
+                    names.append(parent.qualified_name)
+
+        return grants, invalid
+
+    async def permit_many(
+            self,
+            ctx: commands.Context,
+            kind: str,
+            targets: Sequence[Union[int, discord.Role]],
+            grants: Mapping[str, Sequence[str]],
+            invalid_names: Sequence[str],
+            grant: str = "command"
+    ) -> None:
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
+        if (invalid_names or not grants):
+            invalid = (constants.messages.invalid_cog if grant == "cog"
+                       else constants.messages.invalid_command)
+            await ctx.send(f"{invalid} {', '.join(invalid_names)}")
+            return
+
+        target_ids = await self.target_ids(ctx, targets)
+        if (not target_ids):
+            await ctx.send(f"No {kind}s given.")
+            return
+
+        resolved, invalid_ids = await self.resolve_targets(kind, target_ids)
+        if (invalid_ids):
+            await ctx.send(f"Invalid {kind} IDs: "
+                           f"{', '.join(map(str, invalid_ids))}")
+            return
+
+        command_count = sum(len(set(names)) for names in grants.values())
+        await ctx.send(f"Permitting {len(target_ids)} {kind}s to use "
+                       f"{command_count} commands in "
+                       f"{', '.join(grants)}...")
+        permit = getattr(self.bot.db, f"permit_{kind}s_commands")
+        new_ids = await permit(target_ids, grants)
+        await self.welcome(kind, resolved, new_ids, list(grants))
+        await ctx.send(f"{constants.messages.db_update} Permitted "
+                       f"{len(target_ids)} {kind}s ({len(new_ids)} new).")
+
+    @db_group.command(
+        name="permit-users-commands",
+        brief="Permits many users to use the given commands.",
+        help="""
+            Permits every given user to use each of the given commands in a
+            single transaction. Users can be given as IDs, role mentions or
+            an attached CSV file with user IDs in its first column. Command
+            names are separated by commas. Nothing is written if any user or
+            command is invalid.
+            """
+    )
+    async def permit_users_commands(
+            self,
+            ctx: commands.Context,
+            targets: Targets = commands.parameter(
+                description="IDs of the users or mentions of roles"
+            ),
+            *,
+            command_names: str = commands.parameter(
+                description="Comma-separated names of the commands"
+            )
+    ) -> None:
+        grants, invalid = self.command_grants(
+            [name.strip() for name in command_names.split(",")]
+        )
+        await self.permit_many(ctx, "user", targets, grants, invalid)
+
+    @db_group.command(
+        name="permit-channels-commands",
+        brief="Permits many channels to use the given commands.",
+        help="""
+            Permits every given channel to use each of the given commands in
+            a single transaction. Channels can be given as IDs or an attached
+            CSV file with channel IDs in its first column. Command names are
+            separated by commas. Nothing is written if any channel or command
+            is invalid.
+            """
+    )
+    async def permit_channels_commands(
+            self,
+            ctx: commands.Context,
+            channel_ids: commands.Greedy[int] = commands.parameter(
+                description="IDs of the channels"
+            ),
+            *,
+            command_names: str = commands.parameter(
+                description="Comma-separated names of the commands"
+            )
+    ) -> None:
+        grants, invalid = self.command_grants(
+            [name.strip() for name in command_names.split(",")]
+        )
+        await self.permit_many(ctx, "channel", channel_ids, grants, invalid)
+
+    @db_group.command(
+        name="permit-users-cogs",
+        brief="Permits many users access to all commands in the given cogs.",
+        help="""
+            Permits every given user to use all commands in each of the given
+            cogs in a single transaction. Users can be given as IDs, role
+            mentions or an attached CSV file with user IDs in its first
+            column. Cog names are separated by commas and must be subclasses
+            of BaseCog.
+            """
+    )
+    async def permit_users_cogs(
+            self,
+            ctx: commands.Context,
+            targets: Targets = commands.parameter(
+                description="IDs of the users or mentions of roles"
+            ),
+            *,
+            cog_names: str = commands.parameter(
+                description="Comma-separated names of the cogs"
+            )
+    ) -> None:
+        grants, invalid = self.cog_grants(
+            [name.strip() for name in cog_names.split(",")]
+        )
+        await self.permit_many(ctx, "user", targets, grants, invalid, "cog")
+
+    @db_group.command(
+        name="permit-channels-cogs",
+        brief="Permits many channels access to all commands in the given "
+              "cogs.",
+        help="""
+            Permits every given channel to use all commands in each of the
+            given cogs in a single transaction. Channels can be given as IDs
+            or an attached CSV file with channel IDs in its first column. Cog
+            names are separated by commas and must be subclasses of BaseCog.
+            """
+    )
+    async def permit_channels_cogs(
+            self,
+            ctx: commands.Context,
+            channel_ids: commands.Greedy[int] = commands.parameter(
+                description="IDs of the channels"
+            ),
+            *,
+            cog_names: str = commands.parameter(
+                description="Comma-separated names of the cogs"
+            )
+    ) -> None:
+        grants, invalid = self.cog_grants(
+            [name.strip() for name in cog_names.split(",")]
+        )
+        await self.permit_many(
+            ctx,
+            "channel",
+            channel_ids,
+            grants,
+            invalid,
+            "cog"
+        )
+
     @db_group.command(
         name="delete-user",
         brief="Removes a user.",
@@ -793,28 +768,12 @@ class BaseCogDatabase(
                 description="ID of the user"
             )
     ) -> None:
-        user = await self.bot.fetch_user(user_id)
+        user = await self.bot.resolver.user(user_id)
         username = user.name
         await ctx.send(f"Deleting user {username} from database...")
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        db_path = os.environ["BOT_DB"]
-        with (
-            open(f"{sql_dir}/delete_user.sql", "r")
-                as sql_delete_user,
-        ):
-            delete_user = sql_delete_user.read()
-
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        try:
-            db.execute("PRAGMA FOREIGN_KEYS = ON")
-            cursor = db.cursor()
-            cursor.execute(delete_user, (user_id,))
-            db.commit()
-        finally:
-            db.close()
-
-        constants = Config.from_json(os.environ["BOT_CONSTANTS"])
+        await self.bot.db.delete_user(user_id)
+
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
         await ctx.send(constants.messages.db_update)
 
     @db_group.command(
@@ -831,31 +790,14 @@ class BaseCogDatabase(
                 description="ID of the channel"
             )
     ) -> None:
-        channel = await self.bot.fetch_channel(channel_id)
-        webhooks = await channel.webhooks()
-        constants = Config.from_json(os.environ["BOT_CONSTANTS"])
-        await webhooks[0].delete(reason=constants.messages.deleted_channel)
+        channel = await self.bot.resolver.channel(channel_id)
         channel_name = channel.name
         await ctx.send(f"Deleting channel {channel_name} from database...")
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        db_path = os.environ["BOT_DB"]
-        with (
-            open(f"{sql_dir}/delete_channel.sql", "r")
-                as sql_delete_channel,
-        ):
-            delete_channel = sql_delete_channel.read()
-
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        try:
-            db.execute("PRAGMA FOREIGN_KEYS = ON")
-            cursor = db.cursor()
-            cursor.execute(delete_channel, (channel_id,))
-            db.commit()
-        finally:
-            db.close()
+        webhooks = await self.bot.db.delete_channel(channel_id)
+        await self.delete_webhooks(webhooks)
 
-        await ctx.send(constants.messages.update_db)
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
+        await ctx.send(constants.messages.db_update)
 
     @db_group.command(
         name="delete-cog",
@@ -873,29 +815,13 @@ class BaseCogDatabase(
                 description="Name of the cog"
             )
     ) -> None:
-        constants = Config.from_json(os.environ["BOT_CONSTANTS"])
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
         cog = self.bot.get_cog(cog_name)
         if (cog is not None):
-            self.bot.remove_cog(cog_name)
+            await self.bot.remove_cog(cog_name)
 
         await ctx.send(f"Deleting cog {cog_name} from database...")
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        db_path = os.environ["BOT_DB"]
-        with (
-            open(f"{sql_dir}/delete_cog.sql", "r")
-                as sql_delete_cog,
-        ):
-            delete_cog = sql_delete_cog.read()
-
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        try:
-            db.execute("PRAGMA FOREIGN_KEYS = ON")
-            cursor = db.cursor()
-            cursor.execute(delete_cog, (cog_name,))
-            db.commit()
-        finally:
-            db.close()
+        await self.bot.db.delete_cog(cog_name)
 
         await ctx.send(constants.messages.db_update)
 
@@ -919,55 +845,16 @@ class BaseCogDatabase(
                 description="Name of the command"
             )
     ) -> None:
-        user = await self.bot.fetch_user(user_id)
+        user = await self.bot.resolver.user(user_id)
         username = user.name
-        command = self.bot.get_command(command_name)
         await ctx.send(f"Deleting user {username} from "
                        f"command {command_name}...")
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        db_path = os.environ["BOT_DB"]
-        with (
-            open(f"{sql_dir}/select_user_commands_like.sql", "r")
-            as sql_select_user_commands_like,
-            open(f"{sql_dir}/delete_orphan_users.sql", "r")
-            as sql_delete_orphan_users,
-            open(f"{sql_dir}/delete_orphan_user_cogs.sql", "r")
-            as sql_delete_orphan_user_cogs,
-            open(f"{sql_dir}/delete_user_command.sql", "r")
-            as sql_delete_user_command,
-        ):
-            select_commands_like = sql_select_user_commands_like.read()
-            delete_user_command_records = sql_delete_user_command.read()
-            delete_orphan_user_cogs = sql_delete_orphan_user_cogs.read()
-            delete_orphan_users = sql_delete_orphan_users.read()
-
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        try:
-            db.execute("PRAGMA FOREIGN_KEYS = ON")
-            cursor = db.cursor()
-            cursor.execute(
-                delete_user_command_records,
-                (user_id, command_name)
-            )
-            for parent in command.parents:
-                cursor.execute(select_commands_like,
-                               (f"{parent.qualified_name}%",))
-                command_name_records = cursor.fetchall()
-                if (len(command_name_records) == 1):
-                    cursor.execute(
-                        delete_user_command_records,
-                        (user_id, parent.qualified_name)
-                    )
-                else:
-                    break
-
-            cursor.execute(delete_orphan_user_cogs)
-            cursor.execute(delete_orphan_users)
-            db.commit()
-        finally:
-            db.close()
+        await self.bot.db.delete_user_command(
+            user_id,
+            command_name
+        )
 
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
         await ctx.send(constants.messages.db_update)
 
     @db_group.command(
@@ -990,71 +877,17 @@ class BaseCogDatabase(
                 description="Name of the command"
             )
     ) -> None:
-        channel = await self.bot.fetch_channel(channel_id)
+        channel = await self.bot.resolver.channel(channel_id)
         channel_name = channel.name
-        command = self.bot.get_command(command_name)
         await ctx.send(f"Deleting channel #{channel_name} "
                        f"from command {command_name}...")
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        db_path = os.environ["BOT_DB"]
-        with (
-            open(f"{sql_dir}/select_channel_commands_like.sql", "r")
-            as sql_select_channel_commands_like,
-            open(f"{sql_dir}/delete_channel_command.sql", "r")
-            as sql_delete_channel_command,
-            open(f"{sql_dir}/delete_orphan_channel_cogs.sql", "r")
-            as sql_delete_orphan_channel_cogs,
-            open(f"{sql_dir}/select_orphan_channels.sql", "r")
-            as sql_select_orphan_channels,
-            open(f"{sql_dir}/delete_orphan_channels.sql", "r")
-            as sql_delete_orphan_channels,
-        ):
-            select_commands_like = sql_select_channel_commands_like.read()
-            delete_channel_command_records = sql_delete_channel_command.read()
-            delete_orphan_channel_cogs = sql_delete_orphan_channel_cogs.read()
-            get_orphan_channels = sql_select_orphan_channels.read()
-            delete_orphan_channels = sql_delete_orphan_channels.read()
-
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        try:
-            db.execute("PRAGMA FOREIGN_KEYS = ON")
-            cursor = db.cursor()
-            cursor.execute(
-                delete_channel_command_records,
-                (channel_id, command_name)
-            )
-            for parent in command.parents:
-                cursor.execute(select_commands_like,
-                               (f"{parent.qualified_name}%",))
-                command_name_records = cursor.fetchall()
-                if (len(command_name_records) == 1):
-                    cursor.execute(
-                        delete_channel_command_records,
-                        (channel_id, parent.qualified_name)
-                    )
-                else:
-                    break
-
-            cursor.execute(delete_orphan_channel_cogs)
-            cursor.execute(get_orphan_channels)
-            channel_records = cursor.fetchall()
-
-            def pull_singleton(x):
-                return x[0]
-
-            channel_ids = list(map(pull_singleton, channel_records))
-            cursor.execute(delete_orphan_channels)
-            db.commit()
-        finally:
-            db.close()
-
-        constants = Config.from_json(os.environ["BOT_CONSTANTS"])
-        for channel_id in channel_ids:
-            channel = await self.bot.fetch_channel(channel_id)
-            webhooks = await channel.webhooks()
-            await webhooks[0].delete(reason=constants.messages.deleted_channel)
+        webhooks = await self.bot.db.delete_channel_command(
+            channel_id,
+            command_name
+        )
+        await self.delete_webhooks(webhooks)
 
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
         await ctx.send(constants.messages.db_update)
 
     @db_group.command(
@@ -1075,37 +908,13 @@ class BaseCogDatabase(
                 description="Name of the cog"
             )
     ) -> None:
-        user = await self.bot.fetch_user(user_id)
+        user = await self.bot.resolver.user(user_id)
         username = user.name
         cog = self.bot.get_cog(cog_name)
         await ctx.send(f"Deleting user {username} from cog {cog_name}...")
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        db_path = os.environ["BOT_DB"]
-        with (
-            open(f"{sql_dir}/delete_user_cog.sql", "r")
-            as sql_delete_user_cog,
-            open(f"{sql_dir}/delete_orphan_user_cogs.sql", "r")
-            as sql_delete_orphan_user_cogs,
-            open(f"{sql_dir}/delete_orphan_users.sql", "r")
-            as sql_delete_orphan_users,
-        ):
-            delete_user_cog = sql_delete_user_cog.read()
-            delete_orphan_user_cogs = sql_delete_orphan_user_cogs.read()
-            delete_orphan_users = sql_delete_orphan_users.read()
-
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        try:
-            db.execute("PRAGMA FOREIGN_KEYS = ON")
-            cursor = db.cursor()
-            cursor.execute(delete_user_cog, (user_id, cog_name))
-            cursor.execute(delete_orphan_user_cogs)
-            cursor.execute(delete_orphan_users)
-            db.commit()
-        finally:
-            db.close()
-
-        constants = Config.from_json(os.environ["BOT_CONSTANTS"])
+        await self.bot.db.delete_user_cog(user_id, cog_name)
+
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
         await ctx.send(constants.messages.db_update)
 
     @db_group.command(
@@ -1126,62 +935,29 @@ class BaseCogDatabase(
                 description="Name of the cog"
             )
     ) -> None:
-        channel = await self.bot.fetch_channel(channel_id)
+        channel = await self.bot.resolver.channel(channel_id)
         channel_name = channel.name
         cog = self.bot.get_cog(cog_name)
         await ctx.send(
             f"Deleting channel {channel_name} from cog {cog_name}..."
         )
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        db_path = os.environ["BOT_DB"]
-        with (
-            open(f"{sql_dir}/delete_channel_cog.sql", "r")
-            as sql_delete_channel_cog,
-            open(f"{sql_dir}/delete_orphan_channel_cogs.sql", "r")
-            as sql_delete_orphan_channel_cogs,
-            open(f"{sql_dir}/select_orphan_channels.sql", "r")
-            as sql_select_orphan_channels,
-            open(f"{sql_dir}/delete_orphan_channels.sql", "r")
-            as sql_delete_orphan_channels,
-        ):
-            delete_channel_cog = sql_delete_channel_cog.read()
-            delete_orphan_channel_cogs = sql_delete_orphan_channel_cogs.read()
-            get_orphan_channels = sql_select_orphan_channels.read()
-            delete_orphan_channels = sql_delete_orphan_channels.read()
-
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        try:
-            db.execute("PRAGMA FOREIGN_KEYS = ON")
-            cursor = db.cursor()
-            cursor.execute(delete_channel_cog, (channel_id, cog_name))
-            cursor.execute(delete_orphan_channel_cogs)
-            cursor.execute(get_orphan_channels)
-            channel_records = cursor.fetchall()
-
-            def pull_singleton(x):
-                return x[0]
-
-            channel_ids = list(map(pull_singleton, channel_records))
-            cursor.execute(delete_orphan_channels)
-            db.commit()
-        finally:
-            db.close()
-
-        constants = Config.from_json(os.environ["BOT_CONSTANTS"])
-        for channel_id in channel_ids:
-            channel = await self.bot.fetch_channel(channel_id)
-            webhooks = await channel.webhooks()
-            await webhooks[0].delete(reason=constants.messages.deleted_channel)
+        webhooks = await self.bot.db.delete_channel_cog(
+            channel_id,
+            cog_name
+        )
+        await self.delete_webhooks(webhooks)
 
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
         await ctx.send(constants.messages.db_update)
 
     @db_group.command(
         name="delete-command",
-        brief="Removes a command.",
+        brief="Removes a command and its subcommands.",
         help="""
-            Removes the given command. This will simply remove the record from
-            the database, it does not disable the command.
+            Removes the given command and all of its subcommands from the
+            database, along with every user and channel grant for them.
+            Parent commands left without granted subcommands are revoked too.
+            This does not disable the commands.
             """
     )
     async def delete_command(
@@ -1193,59 +969,22 @@ class BaseCogDatabase(
             )
     ) -> None:
         await ctx.send(f"Removing command {command_name}...")
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        db_path = os.environ["BOT_DB"]
-        with (
-            open(f"{sql_dir}/delete_command.sql", "r")
-            as sql_delete_command,
-            open(f"{sql_dir}/delete_orphan_users.sql", "r")
-            as sql_delete_orphan_users,
-            open(f"{sql_dir}/select_orphan_channels.sql", "r")
-            as sql_select_orphan_channels,
-            open(f"{sql_dir}/delete_orphan_channels.sql", "r")
-            as sql_delete_orphan_channels,
-        ):
-            delete_command_record = sql_delete_command.read()
-            delete_orphan_users = sql_delete_orphan_users.read()
-            get_orphan_channels = sql_select_orphan_channels.read()
-            delete_orphan_channels = sql_delete_orphan_channels.read()
-
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        try:
-            db.execute("PRAGMA FOREIGN_KEYS = ON")
-            cursor = db.cursor()
-            cursor.execute(delete_command_record, (command_name,))
-            cursor.execute(delete_orphan_users)
-            cursor.execute(get_orphan_channels)
-            channel_records = cursor.fetchall()
-
-            def pull_singleton(x):
-                return x[0]
-
-            channel_ids = list(map(pull_singleton, channel_records))
-            cursor.execute(delete_orphan_channels)
-            db.commit()
-        finally:
-            db.close()
-
-        constants = Config.from_json(os.environ["BOT_CONSTANTS"])
-        for channel_id in channel_ids:
-            channel = await self.bot.fetch_channel(channel_id)
-            webhooks = await channel.webhooks()
-            await webhooks[0].delete(reason=constants.messages.deleted_channel)
+        webhooks = await self.bot.db.delete_command(command_name)
+        await self.delete_webhooks(webhooks)
 
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
         await ctx.send(constants.messages.db_update)
 
     async def cog_load(self) -> None:
-        self.register_commands()
+        await self.register_rows()
+        await self.register_commands()
         await self.create_webhooks()
-        constants = Config.from_json(os.environ["BOT_CONSTANTS"])
-        print(eval(constants.messages.loaded_cog))
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
+        print(constants.messages.loaded_cog.format(cog=self.qualified_name))
 
     async def cog_unload(self) -> None:
-        constants = Config.from_json(os.environ["BOT_CONSTANTS"])
-        print(eval(constants.messages.unloaded_cog))
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
+        print(constants.messages.unloaded_cog.format(cog=self.qualified_name))
 
 
 async def setup(bot) -> None:
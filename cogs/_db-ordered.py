@@ -1,10 +1,12 @@
 import os
-import sqlite3
 import discord
 from discord.ext import commands
+from typing import Sequence, Union
 from lib.basecog import BaseCog
 from lib.orderedcog import OrderedCog
-from lib.config import Config
+from lib.converters import Targets
+from lib.export import Names, send_records
+from lib.templates import Template
 
 
 class OrderedCogDatabase(
@@ -29,38 +31,12 @@ class OrderedCogDatabase(
             ctx: commands.Context
     ) -> None:
         await ctx.send(f"Fetching UserPerms table...")
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        db_path = os.environ["BOT_DB"]
-        with (
-            open(f"{sql_dir}/select_user_perms_table.sql", "r")
-                as sql_select_user_perms_table,
-        ):
-            get_user_perms_records = sql_select_user_perms_table.read()
-
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        try:
-            db.execute("PRAGMA FOREIGN_KEYS = ON")
-            cursor = db.cursor()
-            cursor.execute(get_user_perms_records)
-            user_perms_records = cursor.fetchall()
-        finally:
-            db.close()
-
-        message = ""
-        message_limit = config.settings.message_limit
-        for record in user_perms_records:
-            m_record = list(record)
-            user = await self.bot.fetch_user(record[0])
-            m_record[0] = user.name
-            new_row = str(tuple(m_record)) + '\n'
-            if (len(message) + len(new_row) > message_limit):
-                await ctx.send(message)
-                message = ""
-
-            message += new_row
-
-        await ctx.send(message)
+        await send_records(
+            ctx,
+            "user-perms",
+            self.bot.db.stream_records("select_user_perms_table"),
+            Names(self.bot).users()
+        )
 
     @commands.command(
         name="print-channel-perms-table",
@@ -75,38 +51,12 @@ class OrderedCogDatabase(
             ctx: commands.Context
     ) -> None:
         await ctx.send(f"Fetching ChannelPerms table...")
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        db_path = os.environ["BOT_DB"]
-        with (
-            open(f"{sql_dir}/select_channel_perms_table.sql", "r")
-                as sql_select_channel_perms_table,
-        ):
-            get_channel_perms_records = sql_select_channel_perms_table.read()
-
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        try:
-            db.execute("PRAGMA FOREIGN_KEYS = ON")
-            cursor = db.cursor()
-            cursor.execute(get_channel_perms_records)
-            channel_perms_records = cursor.fetchall()
-        finally:
-            db.close()
-
-        message = ""
-        message_limit = config.settings.message_limit
-        for record in channel_perms_records:
-            m_record = list(record)
-            channel = await self.bot.fetch_channel(record[0])
-            m_record[0] = '#' + channel.name
-            new_row = str(tuple(m_record)) + '\n'
-            if (len(message) + len(new_row) > message_limit):
-                await ctx.send(message)
-                message = ""
-
-            message += new_row
-
-        await ctx.send(message)
+        await send_records(
+            ctx,
+            "channel-perms",
+            self.bot.db.stream_records("select_channel_perms_table"),
+            Names(self.bot).channels()
+        )
 
     @commands.command(
         name="print-cog-user-perms",
@@ -131,38 +81,15 @@ class OrderedCogDatabase(
             return
 
         await ctx.send(f"Fetching UserPerms records linked to {cog_name}...")
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        db_path = os.environ["BOT_DB"]
-        with (
-            open(f"{sql_dir}/select_cog_user_perm_records.sql", "r")
-                as sql_select_cog_user_perm_records,
-        ):
-            get_cog_users = sql_select_cog_user_perm_records.read()
-
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        try:
-            db.execute("PRAGMA FOREIGN_KEYS = ON")
-            cursor = db.cursor()
-            cursor.execute(get_cog_users, (cog_name,))
-            cog_user_records = cursor.fetchall()
-        finally:
-            db.close()
-
-        message = ""
-        message_limit = config.settings.message_limit
-        for record in cog_user_records:
-            m_record = list(record)
-            user = await self.bot.fetch_user(record[0])
-            m_record[0] = user.name
-            new_row = str(tuple(m_record)) + '\n'
-            if (len(message) + len(new_row) > message_limit):
-                await ctx.send(message)
-                message = ""
-
-            message += new_row
-
-        await ctx.send(message)
+        await send_records(
+            ctx,
+            "cog-user-perms",
+            self.bot.db.stream_records(
+                "select_cog_user_perm_records",
+                cog_name
+            ),
+            Names(self.bot).users()
+        )
 
     @commands.command(
         name="print-cog-channel-perms",
@@ -190,38 +117,15 @@ class OrderedCogDatabase(
         await ctx.send(
             f"Fetching ChannelPerms records linked to {cog_name}..."
         )
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        db_path = os.environ["BOT_DB"]
-        with (
-            open(f"{sql_dir}/select_cog_channel_perm_records.sql", "r")
-                as sql_select_cog_channel_perm_records,
-        ):
-            get_cog_channels = sql_select_cog_channel_perm_records.read()
-
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        try:
-            db.execute("PRAGMA FOREIGN_KEYS = ON")
-            cursor = db.cursor()
-            cursor.execute(get_cog_channels, (cog_name,))
-            cog_channel_records = cursor.fetchall()
-        finally:
-            db.close()
-
-        message = ""
-        message_limit = config.settings.message_limit
-        for record in cog_channel_records:
-            m_record = list(record)
-            channel = await self.bot.fetch_channel(record[0])
-            m_record[0] = '#' + channel.name
-            new_row = str(tuple(m_record)) + '\n'
-            if (len(message) + len(new_row) > message_limit):
-                await ctx.send(message)
-                message = ""
-
-            message += new_row
-
-        await ctx.send(message)
+        await send_records(
+            ctx,
+            "cog-channel-perms",
+            self.bot.db.stream_records(
+                "select_cog_channel_perm_records",
+                cog_name
+            ),
+            Names(self.bot).channels()
+        )
 
     @commands.command(
         name="set-user-perm",
@@ -255,41 +159,25 @@ class OrderedCogDatabase(
             return
 
         try:
-            user = await self.bot.fetch_user(user_id)
-        except NotFound as e:
+            user = await self.bot.resolver.user(user_id)
+        except discord.NotFound:
             await ctx.send("Invalid User ID.")
             return
 
         await ctx.send(f"Setting permission {permission} "
                        f"for user {user.name} "
                        f"in cog {cog_name}...")
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        db_path = os.environ["BOT_DB"]
-        with (
-            open(f"{sql_dir}/insert_user.sql", "r")
-            as sql_insert_user,
-            open(f"{sql_dir}/insert_user_perm.sql", "r")
-            as sql_insert_user_perm,
-        ):
-            add_user = sql_insert_user.read()
-            set_user_permission = sql_insert_user_perm.read()
-
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        try:
-            db.execute("PRAGMA FOREIGN_KEYS = ON")
-            cursor = db.cursor()
-            cursor.execute(add_user, (user_id,))
-            constants = Config.from_json(os.environ["BOT_CONSTANTS"])
-            if (cursor.rowcount):
-                user_dm = await user.create_dm()
-                await user_dm.send(eval(constants.messages.startup))
-
-            cursor.execute(
-                set_user_permission, (user_id, cog_name, permission))
-            db.commit()
-        finally:
-            db.close()
+        new_user = await self.bot.db.set_user_perm(
+            user_id,
+            cog_name,
+            permission
+        )
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
+        if (new_user):
+            user_dm = await self.bot.resolver.dm(user_id)
+            await user_dm.send(constants.messages.startup.format(
+                prefix=self.bot.command_prefix
+            ))
 
         await ctx.send(constants.messages.db_update)
 
@@ -326,44 +214,131 @@ class OrderedCogDatabase(
             return
 
         try:
-            channel = await self.bot.fetch_channel(channel_id)
-        except NotFound as e:
+            channel = await self.bot.resolver.channel(channel_id)
+        except discord.NotFound:
             await ctx.send("Invalid Channel ID.")
             return
 
         await ctx.send(f"Setting permission {permission} "
                        f"for channel #{channel.name} "
                        f"in cog {cog_name}...")
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        db_path = os.environ["BOT_DB"]
-        with (
-            open(f"{sql_dir}/insert_channel.sql", "r")
-            as sql_insert_channel,
-            open(f"{sql_dir}/insert_channel_perm.sql", "r")
-            as sql_insert_channel_perm,
-        ):
-            add_channel = sql_insert_channel.read()
-            set_channel_permission = sql_insert_channel_perm.read()
-
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        try:
-            db.execute("PRAGMA FOREIGN_KEYS = ON")
-            cursor = db.cursor()
-            cursor.execute(add_channel, (channel_id,))
-            constants = Config.from_json(os.environ["BOT_CONSTANTS"])
-            if (cursor.rowcount):
-                self.cog.create_webhook(channel)
-                await channel.send(eval(constants.messages.startup))
-
-            cursor.execute(set_channel_permission,
-                           (channel_id, cog_name, permission))
-            db.commit()
-        finally:
-            db.close()
+        new_channel = await self.bot.db.set_channel_perm(
+            channel_id,
+            cog_name,
+            permission
+        )
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
+        if (new_channel):
+            await self.db_cog.create_webhook(channel, cog_name)
+            await channel.send(constants.messages.startup.format(
+                prefix=self.bot.command_prefix
+            ))
 
         await ctx.send(constants.messages.db_update)
 
+    async def set_perms(
+            self,
+            ctx: commands.Context,
+            kind: str,
+            targets: Sequence[Union[int, discord.Role]],
+            cog_names: str,
+            permission: int
+    ) -> None:
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
+        names = [name.strip() for name in cog_names.split(",")]
+        invalid_names = [
+            name for name in names
+            if not issubclass(type(self.bot.get_cog(name)), OrderedCog)
+        ]
+        if (invalid_names):
+            await ctx.send(f"{constants.messages.invalid_cog} "
+                           f"{', '.join(invalid_names)}")
+            return
+
+        target_ids = await self.db_cog.target_ids(ctx, targets)
+        if (not target_ids):
+            await ctx.send(f"No {kind}s given.")
+            return
+
+        resolved, invalid_ids = await self.db_cog.resolve_targets(
+            kind,
+            target_ids
+        )
+        if (invalid_ids):
+            await ctx.send(f"Invalid {kind} IDs: "
+                           f"{', '.join(map(str, invalid_ids))}")
+            return
+
+        await ctx.send(f"Setting permission {permission} "
+                       f"for {len(target_ids)} {kind}s "
+                       f"in cogs {', '.join(names)}...")
+        set_perms = getattr(self.bot.db, f"set_{kind}s_perm")
+        new_ids = await set_perms(target_ids, names, permission)
+        await self.db_cog.welcome(kind, resolved, new_ids, names)
+        await ctx.send(f"{constants.messages.db_update} Set permission "
+                       f"{permission} for {len(target_ids)} {kind}s "
+                       f"({len(new_ids)} new).")
+
+    @commands.command(
+        name="set-users-perm",
+        brief="Sets the permission of many users for the given cogs.",
+        help="""
+            Sets the permission of every given user for each of the given
+            cogs in a single transaction. Users can be given as IDs, role
+            mentions or an attached CSV file with user IDs in its first
+            column. Cog names are separated by commas and must be subclasses
+            of OrderedCog. Nothing is written if any user or cog is invalid.
+            """
+    )
+    async def set_users_perm(
+            self,
+            ctx: commands.Context,
+            targets: Targets = commands.parameter(
+                description="IDs of the users or mentions of roles"
+            ),
+            cog_names: str = commands.parameter(
+                description="Comma-separated names of the cogs"
+            ),
+            permission: int = commands.parameter(
+                description="Permission level of the users",
+                default=0
+            )
+    ) -> None:
+        await self.set_perms(ctx, "user", targets, cog_names, permission)
+
+    @commands.command(
+        name="set-channels-perm",
+        brief="Sets the permission of many channels for the given cogs.",
+        help="""
+            Sets the permission of every given channel for each of the given
+            cogs in a single transaction. Channels can be given as IDs or an
+            attached CSV file with channel IDs in its first column. Cog names
+            are separated by commas and must be subclasses of OrderedCog.
+            Nothing is written if any channel or cog is invalid.
+            """
+    )
+    async def set_channels_perm(
+            self,
+            ctx: commands.Context,
+            channel_ids: commands.Greedy[int] = commands.parameter(
+                description="IDs of the channels"
+            ),
+            cog_names: str = commands.parameter(
+                description="Comma-separated names of the cogs"
+            ),
+            permission: int = commands.parameter(
+                description="Permission level of the channels",
+                default=0
+            )
+    ) -> None:
+        await self.set_perms(
+            ctx,
+            "channel",
+            channel_ids,
+            cog_names,
+            permission
+        )
+
     @commands.command(
         name="remove-user-perm",
         brief="Removes the users permission level.",
@@ -382,30 +357,14 @@ class OrderedCogDatabase(
                 description="ID of the user"
             )
     ) -> None:
-        user = await self.bot.fetch_user(user_id)
+        user = await self.bot.resolver.user(user_id)
         username = user.name
         await ctx.send(
             f"Removing record of user {username} and cog {cog_name}..."
         )
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        db_path = os.environ["BOT_DB"]
-        with (
-            open(f"{sql_dir}/delete_user_cog_perm.sql", "r")
-                as sql_delete_user_cog_perm,
-        ):
-            delete_user_cog_perm = sql_delete_user_cog_perm.read()
-
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        try:
-            db.execute("PRAGMA FOREIGN_KEYS = ON")
-            cursor = db.cursor()
-            cursor.execute(delete_user_cog_perm, (user_id, cog_name))
-            db.commit()
-        finally:
-            db.close()
-
-        constants = Config.from_json(os.environ["BOT_CONSTANTS"])
+        await self.bot.db.remove_user_perm(user_id, cog_name)
+
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
         await ctx.send(constants.messages.db_update)
 
     @commands.command(
@@ -426,32 +385,17 @@ class OrderedCogDatabase(
                 description="ID of the channel"
             )
     ) -> None:
-        channel = await self.bot.fetch_channel(channel_id)
+        channel = await self.bot.resolver.channel(channel_id)
         channelname = channel.name
         await ctx.send(f"Removing record of channel {channelname} and cog "
                        f"{cog_name}...")
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        db_path = os.environ["BOT_DB"]
-        with (
-            open(f"{sql_dir}/delete_channel_cog_perm.sql", "r")
-                as sql_delete_channel_cog_perm,
-        ):
-            delete_channel_cog_perm = sql_delete_channel_cog_perm.read()
-
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        try:
-            db.execute("PRAGMA FOREIGN_KEYS = ON")
-            cursor = db.cursor()
-            cursor.execute(delete_channel_cog_perm, (channel_id, cog_name))
-            db.commit()
-        finally:
-            db.close()
-
-        constants = Config.from_json(os.environ["BOT_CONSTANTS"])
+        await self.bot.db.remove_channel_perm(channel_id, cog_name)
+
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
         await ctx.send(constants.messages.db_update)
 
     async def cog_load(self) -> None:
+        await self.register_rows()
         for command in self.walk_commands():
             command_copy = command.copy()
             command_copy.enabled = True
@@ -463,17 +407,17 @@ class OrderedCogDatabase(
 
             command.enabled = False
 
-        self.db_cog.register_commands()
+        await self.db_cog.register_commands()
         await self.db_cog.create_webhooks()
-        constants = Config.from_json(os.environ["BOT_CONSTANTS"])
-        print(eval(constants.messages.loaded_cog))
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
+        print(constants.messages.loaded_cog.format(cog=self.qualified_name))
 
     def cog_unload(self) -> None:
         for command in self.walk_commands():
             self.db_cog.db_group.remove_command(command.name)
 
-        constants = Config.from_json(os.environ["BOT_CONSTANTS"])
-        print(eval(constants.messages.unloaded_cog))
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
+        print(constants.messages.unloaded_cog.format(cog=self.qualified_name))
 
 
 async def setup(bot) -> None:
@@ -1,10 +1,30 @@
 import os
-import sqlite3
 import discord
 from discord.ext import tasks, commands
+from typing import List
 from lib.basecog import BaseCog
 from lib.servercog import ServerCog
-from lib.config import Config
+from lib.export import Converter, Row, send_records
+from lib.templates import Template
+
+
+class StateConverter(Converter):
+    def __init__(self, bot: commands.Bot) -> None:
+        self.bot = bot
+
+    async def __call__(self, rows: List[Row]) -> List[Row]:
+        converted: List[Row] = []
+        for record in rows:
+            m_record = list(record)
+            server_cog = self.bot.get_cog(record[0])
+            if (server_cog is None):
+                m_record[1] = "NULL"
+            else:
+                m_record[1] = server_cog.State(record[1]).name
+
+            converted.append(tuple(m_record))
+
+        return converted
 
 
 class ServerCogDatabase(
@@ -26,42 +46,12 @@ class ServerCogDatabase(
     )
     async def print_servers_table(self, ctx: commands.Context) -> None:
         await ctx.send(f"Fetching Servers table...")
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        db_path = os.environ["BOT_DB"]
-        with (
-            open(f"{sql_dir}/select_servers_table.sql", "r")
-                as sql_select_servers_table,
-        ):
-            get_server_records = sql_select_servers_table.read()
-
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        try:
-            db.execute("PRAGMA FOREIGN_KEYS = ON")
-            cursor = db.cursor()
-            cursor.execute(get_server_records)
-            server_records = cursor.fetchall()
-        finally:
-            db.close()
-
-        message = ""
-        message_limit = config.settings.message_limit
-        for record in server_records:
-            m_record = list(record)
-            server_cog = self.bot.get_cog(record[0])
-            if (server_cog is None):
-                m_record[1] = "NULL"
-            else:
-                m_record[1] = server_cog.State(record[1]).name
-
-            new_row = str(tuple(m_record)) + '\n'
-            if (len(message) + len(new_row) > message_limit):
-                await ctx.send(message)
-                message = ""
-
-            message += new_row
-
-        await ctx.send(message)
+        await send_records(
+            ctx,
+            "servers",
+            self.bot.db.stream_records("select_servers_table"),
+            StateConverter(self.bot)
+        )
 
     @commands.command(
         name="delete-server",
@@ -84,28 +74,13 @@ class ServerCogDatabase(
             await self.bot.remove_cog(server_name)
 
         await ctx.send(f"Removing server {server_name}...")
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        db_path = os.environ["BOT_DB"]
-        with (
-            open(f"{sql_dir}/delete_server.sql", "r")
-                as sql_delete_server,
-        ):
-            delete_server_record = sql_delete_server.read()
-
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        try:
-            db.execute("PRAGMA FOREIGN_KEYS = ON")
-            cursor = db.cursor()
-            cursor.execute(delete_server_record, (server_name,))
-            db.commit()
-        finally:
-            db.close()
-
-        constants = Config.from_json(os.environ["BOT_CONSTANTS"])
+        await self.bot.db.delete_server(server_name)
+
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
         await ctx.send(constants.messages.db_update)
 
     async def cog_load(self) -> None:
+        await self.register_rows()
         for command in self.walk_commands():
             command_copy = command.copy()
             command_copy.enabled = True
@@ -117,17 +92,17 @@ class ServerCogDatabase(
 
             command.enabled = False
 
-        self.db_cog.register_commands()
+        await self.db_cog.register_commands()
         await self.db_cog.create_webhooks()
-        constants = Config.from_json(os.environ["BOT_CONSTANTS"])
-        print(eval(constants.messages.loaded_cog))
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
+        print(constants.messages.loaded_cog.format(cog=self.qualified_name))
 
     async def cog_unload(self) -> None:
         for command in self.walk_commands():
             self.db_cog.db_group.remove_command(command.name)
 
-        constants = Config.from_json(os.environ["BOT_CONSTANTS"])
-        print(eval(constants.messages.unloaded_cog))
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
+        print(constants.messages.unloaded_cog.format(cog=self.qualified_name))
 
 
 async def setup(bot) -> None:
@@ -1,16 +1,21 @@
 import os
+import io
+import time
 import asyncio
 import functools
+import urllib.parse
 import discord
 import yt_dlp
 import subprocess
-import asyncio
 from collections import deque
 from discord.ext import commands
-from typing import Final, Dict, Any, Self, Deque
+from typing import (Final, Dict, Any, Self, Deque, Union, Callable, List,
+                    Optional)
 from discord import FFmpegPCMAudio
 from lib.orderedcog import OrderedCog
 from lib.config import Config
+from lib.templates import Template
+from lib.metrics import metrics, timed, create_subprocess_exec
 
 
 class YTDLPSource(discord.PCMVolumeTransformer):
@@ -51,6 +56,7 @@ class YTDLPSource(discord.PCMVolumeTransformer):
         self.url = data.get("url")
 
     @staticmethod
+    @timed("ytdlp_seconds")
     async def _fetch_data(
             search: str,
             *,
@@ -71,9 +77,25 @@ class YTDLPSource(discord.PCMVolumeTransformer):
         return data
 
     @classmethod
-    async def _stream_from_data(cls, data: Union[str, io.BufferedIOBase]):
+    def _open(cls, data: Dict[str, Any]) -> discord.FFmpegPCMAudio:
         source = discord.FFmpegPCMAudio(data['url'], **cls.FFMPEG_OPTS)
         source.read()
+        return source
+
+    @classmethod
+    async def _stream_from_data(
+            cls,
+            data: Union[str, io.BufferedIOBase],
+            *,
+            loop=None
+    ):
+        loop = loop or asyncio.get_event_loop()
+        metrics.inc("ffmpeg_streams_total")
+        with metrics.timer("ffmpeg_start_seconds"):
+            source = await loop.run_in_executor(
+                None,
+                functools.partial(cls._open, data)
+            )
 
         return cls(source, data=data)
 
@@ -86,7 +108,7 @@ class YTDLPSource(discord.PCMVolumeTransformer):
     ) -> Self:
         data = cls._fetch_data(search, loop=loop, download=True)
         source = cls.ytdlp.prepare_filename(data)
-        convert_to_raw_PCM = await asyncio.create_subprocess_exec(
+        convert_to_raw_PCM = await create_subprocess_exec(
             'ffmpeg',
             '-i', source,
             '-f', 's16le',
@@ -103,6 +125,137 @@ class YTDLPSource(discord.PCMVolumeTransformer):
             )
 
 
+class Prefetcher:
+    def __init__(self, settings: "Audio.GuildSettings") -> None:
+        self.settings = settings
+        self.channel: Optional[discord.abc.Messageable] = None
+        self.warm: Optional[YTDLPSource] = None
+        self._lock = asyncio.Lock()
+        self._changed = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def expires(data: Dict[str, Any], max_age: float) -> float:
+        query = urllib.parse.parse_qs(
+            urllib.parse.urlparse(data.get('url') or '').query
+        )
+        if ('expire' in query):
+            return float(query['expire'][0])
+
+        return data.get('epoch', time.time()) + max_age
+
+    def upcoming(self) -> List[Dict[str, Any]]:
+        queue = list(self.settings.data_queue)
+        if (self.settings.loop):
+            return queue[:1]
+
+        if (self.settings.rotate):
+            return queue[1:] + queue[:1]
+
+        return queue[1:]
+
+    def poke(self) -> None:
+        if (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._run())
+
+        self._changed.set()
+
+    def discard(self) -> None:
+        if (self.warm is not None):
+            self.warm.cleanup()
+            self.warm = None
+
+    def close(self) -> None:
+        if (self._task is not None):
+            self._task.cancel()
+            self._task = None
+
+        self.discard()
+
+    async def source(self, data: Dict[str, Any]) -> YTDLPSource:
+        async with self._lock:
+            warm, self.warm = self.warm, None
+            if (warm is not None and warm.data is data and
+                    warm.url == data.get('url')):
+                metrics.inc("audio_prefetch_total", outcome="hit")
+                return warm
+
+            if (warm is not None):
+                warm.cleanup()
+
+        metrics.inc("audio_prefetch_total", outcome="miss")
+        cog_config = Config.load(os.environ["BOT_COGS"]).audio
+        if (self.expires(data, cog_config.stream_max_age) - time.time() <
+                cog_config.refresh_margin):
+            await self._refresh(data)
+
+        return await YTDLPSource._stream_from_data(data)
+
+    async def _run(self) -> None:
+        while (True):
+            self._changed.clear()
+            try:
+                await self._prefetch()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Audio prefetch failed: {e}")
+
+            cog_config = Config.load(os.environ["BOT_COGS"]).audio
+            timeout = (cog_config.prefetch_interval
+                       if self.settings.data_queue else None)
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _refresh(self, data: Dict[str, Any]) -> bool:
+        search = data.get('webpage_url') or data.get('original_url')
+        try:
+            fresh = await YTDLPSource._fetch_data(search)
+        except yt_dlp.utils.DownloadError:
+            fresh = None
+
+        if (fresh is None or not fresh.get('url')):
+            return False
+
+        metrics.inc("audio_stream_refresh_total")
+        data.update(fresh)
+        return True
+
+    def _drop(self, data: Dict[str, Any]) -> None:
+        queue = self.settings.data_queue
+        for index in range(1, len(queue)):
+            if (queue[index] is data):
+                del queue[index]
+                break
+        else:
+            return
+
+        if (self.channel is not None):
+            asyncio.create_task(self.channel.send(
+                f"Skipped {data.get('title')}: no longer available."
+            ))
+
+    async def _prefetch(self) -> None:
+        cog_config = Config.load(os.environ["BOT_COGS"]).audio
+        for data in self.upcoming()[:cog_config.prefetch_depth]:
+            if (self.expires(data, cog_config.stream_max_age) - time.time() <
+                    cog_config.refresh_margin and
+                    not await self._refresh(data)):
+                self._drop(data)
+
+        async with self._lock:
+            upcoming = self.upcoming()[:1]
+            if (self.warm is not None and
+                    (not upcoming or self.warm.data is not upcoming[0] or
+                     self.warm.url != upcoming[0].get('url'))):
+                self.discard()
+
+            if (upcoming and self.warm is None):
+                self.warm = await YTDLPSource._stream_from_data(upcoming[0])
+
+
 class Audio(OrderedCog, description=f"Plays audio."):
     class GuildSettings:
         def __init__(self, bot: commands.Bot):
@@ -116,6 +269,7 @@ class Audio(OrderedCog, description=f"Plays audio."):
                 __empty())
             self.data_queue: Deque[Union[str, io.BufferedIOBase]] = deque()
             self.lock: asyncio.Lock = asyncio.Lock()
+            self.prefetcher: Prefetcher = Prefetcher(self)
 
     def __init__(self, bot: commands.Bot) -> None:
         super().__init__(bot)
@@ -140,6 +294,7 @@ class Audio(OrderedCog, description=f"Plays audio."):
                 settings.loop = False
                 settings.rotate = False
                 settings.data_queue.clear()
+                settings.prefetcher.poke()
         else:
 
             def voice_to_id(x):
@@ -154,7 +309,7 @@ class Audio(OrderedCog, description=f"Plays audio."):
                 if (len(target_channel.members) == 1):
                     voice_client = voice_clients[bot_voice_ids.index(
                         target_channel.id)]
-                    cog_config = Config.from_json(os.environ["BOT_COGS"]).audio
+                    cog_config = Config.load(os.environ["BOT_COGS"]).audio
                     settings.voice_client_timeout = self.bot.loop.create_task(
                         self.timeout_callback(
                             voice_client,
@@ -230,8 +385,11 @@ class Audio(OrderedCog, description=f"Plays audio."):
         invoke_without_command=True
     )
     async def audio_group(self, ctx: commands.Context):
-        constants = Config.from_json(os.environ["BOT_CONSTANTS"])
-        await ctx.send(eval(constants.messages.servers.no_subcommand))
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
+        await ctx.send(constants.messages.servers.no_subcommand.format(
+            prefix=self.bot.command_prefix,
+            command=ctx.command
+        ))
 
     @audio_group.group(
         name="yt",
@@ -244,8 +402,11 @@ class Audio(OrderedCog, description=f"Plays audio."):
     )
     @OrderedCog.assert_perms(user_perm=0, channel_perm=0)
     async def yt_group(self, ctx: commands.Context):
-        constants = Config.from_json(os.environ["BOT_CONSTANTS"])
-        await ctx.send(eval(constants.messages.servers.no_subcommand))
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
+        await ctx.send(constants.messages.servers.no_subcommand.format(
+            prefix=self.bot.command_prefix,
+            command=ctx.command
+        ))
 
     @yt_group.command(
         name="play",
@@ -259,7 +420,7 @@ class Audio(OrderedCog, description=f"Plays audio."):
     async def yt_play(self, ctx: commands.Context, *, search: str) -> None:
         channel = ctx.author.voice.channel
         settings = self.guild_settings[ctx.guild.id]
-        cog_config = Config.from_json(os.environ["BOT_COGS"]).audio
+        cog_config = Config.load(os.environ["BOT_COGS"]).audio
 
         async def after_callback() -> None:
             if (not settings.loop):
@@ -270,9 +431,10 @@ class Audio(OrderedCog, description=f"Plays audio."):
 
             if (settings.data_queue):
                 settings.voice_client_timeout.cancel()
-                stream = await YTDLPSource._stream_from_data(
+                stream = await settings.prefetcher.source(
                     settings.data_queue[0]
                 )
+                settings.prefetcher.poke()
                 ctx.voice_client.play(
                     stream,
                     after=(lambda e:
@@ -308,10 +470,11 @@ class Audio(OrderedCog, description=f"Plays audio."):
                     raise YTDLPSource.YTDLPError("No matches found.")
 
                 settings.data_queue.append(data)
+                settings.prefetcher.channel = ctx.channel
 
             if (not (ctx.voice_client.is_playing() or
                      ctx.voice_client.is_paused())):
-                stream = await YTDLPSource._stream_from_data(
+                stream = await settings.prefetcher.source(
                     settings.data_queue[0]
                 )
                 ctx.voice_client.play(
@@ -323,11 +486,13 @@ class Audio(OrderedCog, description=f"Plays audio."):
             else:
                 await ctx.send(f"Queued: {data.get('title')}")
 
+            settings.prefetcher.poke()
+
     @yt_play.error
     async def catch_play_interrupt(self, ctx: commands.Context, error) -> None:
         settings = self.guild_settings[ctx.guild.id]
         if (not settings.data_queue):
-            cog_config = Config.from_json(os.environ["BOT_COGS"]).audio
+            cog_config = Config.load(os.environ["BOT_COGS"]).audio
             settings.voice_client_timeout = self.bot.loop.create_task(
                 self.timeout_callback(
                     ctx.voice_client,
@@ -377,7 +542,7 @@ class Audio(OrderedCog, description=f"Plays audio."):
         else:
             ctx.voice_client.pause()
             await ctx.send("Paused the audio.")
-            cog_config = Config.from_json(os.environ["BOT_COGS"]).audio
+            cog_config = Config.load(os.environ["BOT_COGS"]).audio
             settings.voice_client_timeout = self.bot.loop.create_task(
                 self.timeout_callback(
                     ctx.voice_client,
@@ -427,6 +592,7 @@ class Audio(OrderedCog, description=f"Plays audio."):
             for i in range(tskip):
                 settings.data_queue.popleft()
 
+        settings.prefetcher.poke()
         ctx.voice_client.stop()
         await ctx.send("Stopped the next %i audio(s)." % (skip))
         settings.loop = old_loop
@@ -442,6 +608,7 @@ class Audio(OrderedCog, description=f"Plays audio."):
     async def audio_loop(self, ctx: commands.Context) -> None:
         settings = self.guild_settings[ctx.guild.id]
         settings.loop = not settings.loop
+        settings.prefetcher.poke()
         await ctx.send(
             "Set loop -> " + ("true" if settings.loop else "false")
         )
@@ -457,21 +624,43 @@ class Audio(OrderedCog, description=f"Plays audio."):
     async def audio_rotate(self, ctx: commands.Context) -> None:
         settings = self.guild_settings[ctx.guild.id]
         settings.rotate = not settings.rotate
+        settings.prefetcher.poke()
         await ctx.send(
             "Set rotate -> " + ("true" if settings.rotate else "false")
         )
 
+    def reset_settings(self, guild: discord.Guild) -> None:
+        settings = self.guild_settings.get(guild.id)
+        if (settings is not None):
+            settings.prefetcher.close()
+
+        self.guild_settings[guild.id] = self.GuildSettings(self.bot)
+
     @commands.Cog.listener()
     async def on_ready(self) -> None:
         for guild in self.bot.guilds:
-            self.guild_settings[guild.id] = self.GuildSettings(self.bot)
+            self.reset_settings(guild)
+
+    def queue_depth(self) -> int:
+        return sum(
+            len(settings.data_queue)
+            for settings in self.guild_settings.values()
+        )
 
     async def cog_load(self) -> None:
         for guild in self.bot.guilds:
-            self.guild_settings[guild.id] = self.GuildSettings(self.bot)
+            self.reset_settings(guild)
 
+        metrics.collect("audio_queue_depth", self.queue_depth)
         await super().cog_load()
 
+    async def cog_unload(self) -> None:
+        for settings in self.guild_settings.values():
+            settings.prefetcher.close()
+
+        metrics.discard("audio_queue_depth")
+        await super().cog_unload()
+
 
 async def setup(bot: commands.Bot) -> None:
     await bot.add_cog(Audio(bot))
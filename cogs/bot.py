@@ -5,6 +5,8 @@ from typing import Final
 from discord.ext import tasks, commands
 from lib.basecog import BaseCog
 from lib.config import Config
+from lib.templates import Template
+from lib.metrics import metrics
 
 GROUP_COOLDOWN: Final[float] = 5.0
 
@@ -26,8 +28,11 @@ class BotControls(
     )
     @commands.cooldown(1, GROUP_COOLDOWN, commands.BucketType.default)
     async def control_group(self, ctx: commands.Context) -> None:
-        constants = Config.from_json(os.environ["BOT_CONSTANTS"])
-        await ctx.send(eval(constants.messages.servers.no_subcommand))
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
+        await ctx.send(constants.messages.servers.no_subcommand.format(
+            prefix=self.bot.command_prefix,
+            command=ctx.command
+        ))
 
     @control_group.command(
         name="load-extension",
@@ -83,15 +88,52 @@ class BotControls(
         print(f"Reloaded extension {extension_name}")
         await ctx.send(f"Reloaded extension {extension_name}.")
 
+    @control_group.command(
+        name="reload-config",
+        brief="Reloads the config files",
+        help="""
+            Drops the cached config, constants and cogs files so they
+            are read from disk again on next use.
+            """
+    )
+    async def reload_config(self, ctx: commands.Context) -> None:
+        Config.reload()
+        print("Reloaded config files")
+        await ctx.send("Reloaded config files.")
+
+    @control_group.command(
+        name="metrics",
+        brief="Shows latency and resource metrics",
+        help="""
+            Shows latency percentiles of commands, database calls,
+            probes and subprocesses along with counters and gauges
+            such as event loop lag and open voice clients.
+            """
+    )
+    async def show_metrics(self, ctx: commands.Context) -> None:
+        config = Config.load(os.environ["BOT_CONFIG"])
+        limit = config.settings.message_limit - len("```\n```")
+        chunk = ""
+        for line in metrics.summary():
+            if (len(chunk) + len(line) + 1 > limit):
+                await ctx.send(f"```\n{chunk}```")
+                chunk = ""
+
+            chunk += line + "\n"
+
+        if (chunk):
+            await ctx.send(f"```\n{chunk}```")
+
     async def cog_load(self) -> None:
-        self.register_commands()
+        await self.register_rows()
+        await self.register_commands()
         await self.create_webhooks()
-        constants = Config.from_json(os.environ["BOT_CONSTANTS"])
-        print(eval(constants.messages.loaded_cog))
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
+        print(constants.messages.loaded_cog.format(cog=self.qualified_name))
 
     async def cog_unload(self) -> None:
-        constants = Config.from_json(os.environ["BOT_CONSTANTS"])
-        print(eval(constants.messages.unloaded_cog))
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
+        print(constants.messages.unloaded_cog.format(cog=self.qualified_name))
 
 
 async def setup(bot: commands.Bot) -> None:
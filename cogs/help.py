@@ -1,10 +1,6 @@
-import os
-import sys
-import sqlite3
 import discord
 from typing import Mapping, Optional, Any, List, Sequence
 from discord.ext import commands
-from lib.config import Config
 
 
 class Help(commands.DefaultHelpCommand):
@@ -68,45 +64,12 @@ class HelpCog(commands.Cog):
         bot.help_command = self._help_command
 
         async def predicate(ctx: commands.Context) -> bool:
-            config = Config.from_json(os.environ["BOT_CONFIG"])
-            sql_dir = config.dir.sql
-            db_path = os.environ["BOT_DB"]
-            db = sqlite3.connect(db_path, check_same_thread=False)
-            db.execute("PRAGMA FOREIGN_KEYS = ON")
-            cursor = db.cursor()
-
-            def pull_singleton(x):
-                return x[0]
-
             if isinstance(ctx.channel, discord.channel.DMChannel):
-                with (
-                    open(f"{sql_dir}/select_users_table.sql", "r")
-                    as sql_select_users_table,
-                    open(f"{sql_dir}/select_admins_table.sql", "r")
-                    as sql_select_admins_table,
-                ):
-                    get_users = sql_select_users_table.read()
-                    get_admins = sql_select_admins_table.read()
-
-                cursor.execute(get_users)
-                user_records = cursor.fetchall()
-                cursor.execute(get_admins)
-                admin_records = cursor.fetchall()
-                db.close()
-                users = tuple(map(pull_singleton, user_records))
-                admins = tuple(map(pull_singleton, admin_records))
+                users = await ctx.bot.db.get_all_users()
+                admins = await ctx.bot.db.get_admins()
                 return ((ctx.author.id in users) or (ctx.author.id in admins))
             else:
-                with (
-                    open(f"{sql_dir}/select_channels_table.sql", "r")
-                        as sql_select_channels_table,
-                ):
-                    get_channels = sql_select_channels_table.read()
-
-                cursor.execute(get_channels)
-                channel_records = cursor.fetchall()
-                db.close()
-                channels = tuple(map(pull_singleton, channel_records))
+                channels = await ctx.bot.db.get_all_channels()
                 return ctx.channel.id in channels
 
         bot.help_command.add_check(predicate)
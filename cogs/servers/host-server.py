@@ -4,14 +4,15 @@ import subprocess
 import asyncio
 import discord
 from enum import IntFlag, auto
-from typing import Final
-from discord.ext import tasks, commands
-from lib.servercog import ServerCog
+from typing import Dict, Final, FrozenSet, Optional
+from discord.ext import commands
+from lib.servercog import ServerCog, Probe
 from lib.config import Config
+from lib.templates import Template
+from lib.metrics import create_subprocess_exec
 
 SERVER_NAME: Final[str] = "host-server"
 STATE_COOLDOWN: Final[float] = 60.0
-CHECK_STATE_TIME: Final[float] = 30.0
 
 
 class HostServer(
@@ -25,18 +26,43 @@ class HostServer(
 
     state_cooldown = commands.cooldown(1, STATE_COOLDOWN)
 
+    def __init__(self, bot: commands.Bot) -> None:
+        super().__init__(bot)
+        self.watched_webhooks: Dict[int, int] = {}
+        self.subscribed_channels: FrozenSet[int] = frozenset()
+        self._watch_version: Optional[int] = None
+
+    async def _refresh_watch(self) -> None:
+        self._watch_version = self.bot.db.channels_version()
+        self.subscribed_channels = frozenset(await self.get_channels())
+        watched_webhooks: Dict[int, int] = {}
+        for channel_id in sorted(self.subscribed_channels):
+            record = await self.bot.db.get_webhook(
+                channel_id,
+                self.qualified_name
+            )
+            if (record is not None):
+                watched_webhooks[channel_id] = record[0]
+                break
+
+        self.watched_webhooks = watched_webhooks
+
+    @commands.Cog.listener()
+    async def on_webhooks_update(self, channel: discord.abc.GuildChannel):
+        if (channel.id in self.subscribed_channels):
+            self._watch_version = None
+
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message) -> None:
-        server_channels = await super().get_channels()
-        if (server_channels and message.channel.id == server_channels[0]):
-            channel = await self.bot.fetch_channel(server_channels[0])
-            webhooks = await channel.webhooks()
-            if (message.author.id == webhooks[0].id):
-                server_users = await super().get_users()
-                for user_id in server_users:
-                    user = await self.bot.fetch_user(user_id)
-                    user_dm = await user.create_dm()
-                    await user_dm.send(message.content)
+        if (message.webhook_id is None):
+            return
+
+        if (self._watch_version != self.bot.db.channels_version()):
+            await self._refresh_watch()
+
+        if (self.watched_webhooks.get(message.channel.id) ==
+                message.webhook_id):
+            await super().notify(message.content, channels=False)
 
     @commands.group(
         name=SERVER_NAME,
@@ -47,8 +73,11 @@ class HostServer(
         invoke_without_command=True
     )
     async def host_group(self, ctx: commands.Context):
-        constants = Config.from_json(os.environ["BOT_CONSTANTS"])
-        await ctx.send(eval(constants.messages.servers.no_subcommand))
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
+        await ctx.send(constants.messages.servers.no_subcommand.format(
+            prefix=self.bot.command_prefix,
+            command=ctx.command
+        ))
 
     @host_group.command(
         brief=f"Prints the state of {SERVER_NAME}.",
@@ -61,9 +90,12 @@ class HostServer(
             self,
             ctx: commands.Context
     ) -> None:
-        constants = Config.from_json(os.environ["BOT_CONSTANTS"])
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
         state = await super().get_state()
-        await ctx.send(eval(constants.messages.servers.state))
+        await ctx.send(constants.messages.servers.state.format(
+            cog=self.qualified_name,
+            state=state.name
+        ))
 
     @host_group.command(
         brief="Sends a magic packet to the server.",
@@ -79,14 +111,14 @@ class HostServer(
             self,
             ctx: commands.Context
     ) -> None:
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        cog_config = Config.from_json(
+        config = Config.load(os.environ["BOT_CONFIG"])
+        cog_config = Config.load(
             os.environ["BOT_COGS"]).servers[SERVER_NAME]
         max_time = cog_config.max_start_time
         check_time = cog_config.check_start_time
         scripts_dir = config.dir.scripts
         broadcast = cog_config.broadcast
-        wakeup_server = await asyncio.create_subprocess_exec(
+        wakeup_server = await create_subprocess_exec(
             f"{scripts_dir}/wake-up.sh",
             self.qualified_name,
             broadcast,
@@ -124,14 +156,14 @@ class HostServer(
             self,
             ctx: commands.Context
     ) -> None:
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        cog_config = Config.from_json(
+        config = Config.load(os.environ["BOT_CONFIG"])
+        cog_config = Config.load(
             os.environ["BOT_COGS"]).servers[SERVER_NAME]
         scripts_dir = config.dir.scripts
         remote_user = cog_config.remote_user
         remote_webhooks = cog_config.remote_webhooks
         remote_scripts = cog_config.remote_scripts
-        await asyncio.create_subprocess_exec(
+        await create_subprocess_exec(
             f"{scripts_dir}/hibernate.sh",
             self.qualified_name,
             remote_user,
@@ -142,59 +174,8 @@ class HostServer(
             stderr=subprocess.DEVNULL
         )
 
-    @tasks.loop(seconds=CHECK_STATE_TIME)
-    async def check_state(self) -> None:
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        scripts_dir = config.dir.scripts
-        host_state = await asyncio.create_subprocess_exec(
-            f"{scripts_dir}/ping_once.sh",
-            self.qualified_name,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL
-        )
-        await host_state.wait()
-        state = await super().get_state()
-        if (state & self.State.INACTIVE and host_state.returncode == 0):
-            constants = Config.from_json(os.environ["BOT_CONSTANTS"])
-            response = eval(constants.messages.servers.response)
-            await super()._update_state(self.State.ACTIVE)
-            server_channels = await super().get_channels()
-            for channel_id in server_channels:
-                channel = await self.bot.fetch_channel(channel_id)
-                await channel.send(response)
-
-            server_users = await super().get_users()
-            for user_id in server_users:
-                user = await self.bot.fetch_user(user_id)
-                user_dm = await user.create_dm()
-                await user_dm.send(response)
-
-        elif (state & self.State.ACTIVE and host_state.returncode != 0):
-            constants = Config.from_json(os.environ["BOT_CONSTANTS"])
-            no_response = eval(constants.messages.servers.no_response)
-            await super()._update_state(self.State.INACTIVE)
-            server_channels = await super().get_channels()
-            for channel_id in server_channels:
-                channel = await self.bot.fetch_channel(channel_id)
-                await channel.send(no_response)
-
-            server_users = await super().get_users()
-            for user_id in server_users:
-                user = await self.bot.fetch_user(user_id)
-                user_dm = await user.create_dm()
-                await user_dm.send(no_response)
-
-    @check_state.before_loop
-    async def before_check_state(self):
-        await self.bot.wait_until_ready()
-
-    async def cog_load(self) -> None:
-        self.check_state.start()
-        await super().cog_load()
-
-    async def cog_unload(self) -> None:
-        self.check_state.cancel()
-        await super().cog_unload()
+    def probes(self) -> Dict[str, Probe]:
+        return {"host": Probe.icmp(self.qualified_name)}
 
 
 async def setup(bot) -> None:
@@ -4,14 +4,16 @@ import subprocess
 import discord
 import re
 from enum import IntFlag, auto
-from typing import Final
-from discord.ext import tasks, commands
-from lib.servercog import ServerCog
+from typing import Dict, Final
+from discord.ext import commands
+from lib.servercog import ServerCog, Probe
 from lib.config import Config
+from lib.templates import Template
+from lib.metrics import create_subprocess_exec
 
 SERVER_NAME: Final[str] = "minecraft-server"
 STATE_COOLDOWN: Final[float] = 60.0
-CHECK_STATE_TIME: Final[float] = 30.0
+SERVER_PORT: Final[int] = 25565
 
 
 class MinecraftServer(
@@ -37,8 +39,11 @@ class MinecraftServer(
         invoke_without_command=True
     )
     async def mc_group(self, ctx: commands.Context):
-        constants = Config.from_json(os.environ["BOT_CONSTANTS"])
-        await ctx.send(eval(constants.messages.servers.no_subcommand))
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
+        await ctx.send(constants.messages.servers.no_subcommand.format(
+            prefix=self.bot.command_prefix,
+            command=ctx.command
+        ))
 
     @mc_group.command(
         brief=f"Prints the state of {SERVER_NAME}.",
@@ -51,9 +56,12 @@ class MinecraftServer(
             self,
             ctx: commands.Context
     ) -> None:
-        constants = Config.from_json(os.environ["BOT_CONSTANTS"])
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
         state = await super().get_state()
-        await ctx.send(eval(constants.messages.servers.state))
+        await ctx.send(constants.messages.servers.state.format(
+            cog=self.qualified_name,
+            state=state.name
+        ))
 
     @mc_group.command(
         name="start",
@@ -68,20 +76,24 @@ class MinecraftServer(
     )
     @state_cooldown
     async def mc_start(self, ctx: commands.Context) -> None:
-        cog_config = Config.from_json(
+        cog_config = Config.load(
             os.environ["BOT_COGS"]).servers[SERVER_NAME]
-        constants = Config.from_json(os.environ["BOT_CONSTANTS"])
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
         host_server = cog_config.host_server
         state = await super().get_state()
         if (state & self.State.HOST_INACTIVE):
-            await ctx.send(eval(constants.messages.servers.host_inactive))
+            await ctx.send(constants.messages.servers.host_inactive.format(
+                host=host_server
+            ))
             await ctx.invoke(self.bot.get_command(f"{host_server} wakeup"))
 
-        await ctx.send(eval(constants.messages.servers.start))
-        config = Config.from_json(os.environ["BOT_CONFIG"])
+        await ctx.send(constants.messages.servers.start.format(
+            cog=self.qualified_name
+        ))
+        config = Config.load(os.environ["BOT_CONFIG"])
         scripts_dir = config.dir.scripts
         remote_user = cog_config.remote_user
-        await asyncio.create_subprocess_exec(
+        await create_subprocess_exec(
             f"{scripts_dir}/podman_up.sh",
             host_server,
             self.qualified_name,
@@ -101,15 +113,17 @@ class MinecraftServer(
     @ServerCog.assert_state(state=State.ACTIVE)
     @state_cooldown
     async def mc_stop(self, ctx: commands.Context) -> None:
-        constants = Config.from_json(os.environ["BOT_CONSTANTS"])
-        await ctx.send(eval(constants.messages.servers.stop))
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        cog_config = Config.from_json(
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
+        await ctx.send(constants.messages.servers.stop.format(
+            cog=self.qualified_name
+        ))
+        config = Config.load(os.environ["BOT_CONFIG"])
+        cog_config = Config.load(
             os.environ["BOT_COGS"]).servers[SERVER_NAME]
         scripts_dir = config.dir.scripts
         host_server = cog_config.host_server
         remote_user = cog_config.remote_user
-        await asyncio.create_subprocess_exec(
+        await create_subprocess_exec(
             f"{scripts_dir}/podman_down.sh",
             host_server,
             self.qualified_name,
@@ -128,14 +142,14 @@ class MinecraftServer(
     @ServerCog.assert_perms(user_perm=0, channel_perm=0)
     @ServerCog.assert_state(state=State.ACTIVE)
     async def mc_players(self, ctx: commands.Context) -> None:
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        cog_config = Config.from_json(
+        config = Config.load(os.environ["BOT_CONFIG"])
+        cog_config = Config.load(
             os.environ["BOT_COGS"]).servers[SERVER_NAME]
         scripts_dir = config.dir.scripts
         host_server = cog_config.host_server
         container_name1 = cog_config.container_name1
         remote_user = cog_config.remote_user
-        get_players = await asyncio.create_subprocess_exec(
+        get_players = await create_subprocess_exec(
             f"{scripts_dir}/rcon.sh",
             host_server,
             self.qualified_name,
@@ -150,88 +164,14 @@ class MinecraftServer(
         ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
         await ctx.send(ansi_escape.sub('', str(players, 'utf-8')))
 
-    @tasks.loop(seconds=CHECK_STATE_TIME)
-    async def check_state(self) -> None:
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        cog_config = Config.from_json(
+    def probes(self) -> Dict[str, Probe]:
+        cog_config = Config.load(
             os.environ["BOT_COGS"]).servers[SERVER_NAME]
-        scripts_dir = config.dir.scripts
         host_server = cog_config.host_server
-        host_state = await asyncio.create_subprocess_exec(
-            f"{scripts_dir}/ping_once.sh",
-            host_server,
-            stdout=asyncio.subprocess.DEVNULL,
-            stderr=asyncio.subprocess.DEVNULL
-        )
-        await host_state.wait()
-        server_state = await asyncio.create_subprocess_exec(
-            'nc', '-zv', '-w3', host_server, '25565',
-            stdout=asyncio.subprocess.DEVNULL,
-            stderr=asyncio.subprocess.DEVNULL
-        )
-        await server_state.wait()
-        state = await super().get_state()
-        if ((state & (self.State.INACTIVE | self.State.HOST_INACTIVE)) and
-                (not server_state.returncode)):
-            constants = Config.from_json(os.environ["BOT_CONSTANTS"])
-            response = eval(constants.messages.servers.response)
-            await super()._update_state(self.State.ACTIVE)
-            server_channels = await super().get_channels()
-            for channel_id in server_channels:
-                channel = await self.bot.fetch_channel(channel_id)
-                await channel.send(response)
-
-            server_users = await super().get_users()
-            for user_id in server_users:
-                user = await self.bot.fetch_user(user_id)
-                user_dm = await user.create_dm()
-                await user_dm.send(response)
-
-        elif ((state & (self.State.ACTIVE | self.State.INACTIVE)) and
-              host_state.returncode):
-            constants = Config.from_json(os.environ["BOT_CONSTANTS"])
-            no_response = eval(constants.messages.servers.no_response)
-            await super()._update_state(self.State.HOST_INACTIVE)
-            server_channels = await super().get_channels()
-            if (state & self.State.ACTIVE):
-                for channel_id in server_channels:
-                    channel = await self.bot.fetch_channel(channel_id)
-                    await channel.send(no_response)
-
-                server_users = await super().get_users()
-                for user_id in server_users:
-                    user = await self.bot.fetch_user(user_id)
-                    user_dm = await user.create_dm()
-                    await user_dm.send(no_response)
-
-        elif ((state & (self.State.ACTIVE | self.State.HOST_INACTIVE)) and
-              (not host_state.returncode) and server_state.returncode):
-            constants = Config.from_json(os.environ["BOT_CONSTANTS"])
-            no_response = eval(constants.messages.servers.no_response)
-            await super()._update_state(self.State.INACTIVE)
-            server_channels = await super().get_channels()
-            if (state & self.State.ACTIVE):
-                for channel_id in server_channels:
-                    channel = await self.bot.fetch_channel(channel_id)
-                    await channel.send(no_response)
-
-                server_users = await super().get_users()
-                for user_id in server_users:
-                    user = await self.bot.fetch_user(user_id)
-                    user_dm = await user.create_dm()
-                    await user_dm.send(no_response)
-
-    @check_state.before_loop
-    async def before_check_state(self):
-        await self.bot.wait_until_ready()
-
-    async def cog_load(self) -> None:
-        self.check_state.start()
-        await super().cog_load()
-
-    async def cog_unload(self) -> None:
-        self.check_state.cancel()
-        await super().cog_unload()
+        return {
+            "host": Probe.icmp(host_server),
+            "server": Probe.tcp(host_server, SERVER_PORT)
+        }
 
 
 async def setup(bot) -> None:
@@ -1,16 +1,16 @@
 import os
 import discord
-import subprocess
 import asyncio
 from enum import IntFlag, auto
-from typing import Final
-from discord.ext import tasks, commands
-from lib.servercog import ServerCog
+from typing import Dict, Final
+from discord.ext import commands
+from lib.servercog import ServerCog, Probe
 from lib.config import Config
+from lib.templates import Template
+from lib.metrics import create_subprocess_exec
 
 SERVER_NAME: Final[str] = "nas"
 STATE_COOLDOWN: Final[float] = 60.0
-CHECK_STATE_TIME: Final[float] = 30.0
 
 
 class NAS(
@@ -33,8 +33,11 @@ class NAS(
         invoke_without_command=True
     )
     async def nas_group(self, ctx: commands.Context):
-        constants = Config.from_json(os.environ["BOT_CONSTANTS"])
-        await ctx.send(eval(constants.messages.servers.no_subcommand))
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
+        await ctx.send(constants.messages.servers.no_subcommand.format(
+            prefix=self.bot.command_prefix,
+            command=ctx.command
+        ))
 
     @nas_group.command(
         brief=f"Prints the state of {SERVER_NAME}.",
@@ -48,8 +51,11 @@ class NAS(
             ctx: commands.Context
     ) -> None:
         state = await super().get_state()
-        constants = Config.from_json(os.environ["BOT_CONSTANTS"])
-        await ctx.send(eval(constants.messages.servers.state))
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
+        await ctx.send(constants.messages.servers.state.format(
+            cog=self.qualified_name,
+            state=state.name
+        ))
 
     @nas_group.command(
         name="wakeup",
@@ -66,14 +72,14 @@ class NAS(
             self,
             ctx: commands.Context
     ) -> None:
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        cog_config = Config.from_json(
+        config = Config.load(os.environ["BOT_CONFIG"])
+        cog_config = Config.load(
             os.environ["BOT_COGS"]).servers[SERVER_NAME]
         max_time = cog_config.max_start_time
         check_time = cog_config.check_start_time
         scripts_dir = config.dir.scripts
         broadcast = cog_config.broadcast
-        wakeup_server = await asyncio.create_subprocess_exec(
+        wakeup_server = await create_subprocess_exec(
             f"{scripts_dir}/wake-up.sh",
             self.qualified_name,
             broadcast,
@@ -96,59 +102,8 @@ class NAS(
                 self.qualified_name
             )
 
-    @tasks.loop(seconds=CHECK_STATE_TIME)
-    async def check_state(self) -> None:
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        scripts_dir = config.dir.scripts
-        host_state = await asyncio.create_subprocess_exec(
-            f"{scripts_dir}/ping_once.sh",
-            self.qualified_name,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL
-        )
-        await host_state.wait()
-        state = await super().get_state()
-        if (state & self.State.INACTIVE and host_state.returncode == 0):
-            constants = Config.from_json(os.environ["BOT_CONSTANTS"])
-            response = eval(constants.messages.servers.response)
-            await super()._update_state(self.State.ACTIVE)
-            server_channels = await super().get_channels()
-            for channel_id in server_channels:
-                channel = await self.bot.fetch_channel(channel_id)
-                await channel.send(response)
-
-            server_users = await super().get_users()
-            for user_id in server_users:
-                user = await self.bot.fetch_user(user_id)
-                user_dm = await user.create_dm()
-                await user_dm.send(response)
-
-        elif (state & self.State.ACTIVE and host_state.returncode != 0):
-            constants = Config.from_json(os.environ["BOT_CONSTANTS"])
-            no_response = eval(constants.messages.servers.no_response)
-            await super()._update_state(self.State.INACTIVE)
-            server_channels = await super().get_channels()
-            for channel_id in server_channels:
-                channel = await self.bot.fetch_channel(channel_id)
-                await channel.send(no_response)
-
-            server_users = await super().get_users()
-            for user_id in server_users:
-                user = await self.bot.fetch_user(user_id)
-                user_dm = await user.create_dm()
-                await user_dm.send(no_response)
-
-    @check_state.before_loop
-    async def before_check_state(self):
-        await self.bot.wait_until_ready()
-
-    async def cog_load(self) -> None:
-        self.check_state.start()
-        await super().cog_load()
-
-    async def cog_unload(self) -> None:
-        self.check_state.cancel()
-        await super().cog_unload()
+    def probes(self) -> Dict[str, Probe]:
+        return {"host": Probe.icmp(self.qualified_name)}
 
 
 async def setup(bot) -> None:
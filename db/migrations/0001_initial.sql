@@ -0,0 +1,141 @@
+CREATE TABLE IF NOT EXISTS Users
+(
+UserID  INTEGER NOT NULL PRIMARY KEY
+);
+
+CREATE TABLE IF NOT EXISTS Channels
+(
+ChannelID   INTEGER NOT NULL PRIMARY KEY
+);
+
+CREATE TABLE IF NOT EXISTS Commands 
+(
+CommandName VARCHAR(32) NOT NULL PRIMARY KEY,
+CogName	    VARCHAR(16) NOT NULL,
+FOREIGN KEY (CogName)
+    REFERENCES Cogs(CogName)
+    ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS Cogs
+(
+CogName	VARCHAR(16) NOT NULL PRIMARY KEY
+);
+
+CREATE TABLE IF NOT EXISTS UserCommands
+(
+UserID	    INTEGER NOT NULL,
+CommandName VARCHAR(32) NOT NULL,
+CogName	    VARCHAR(16) NOT NULL,
+PRIMARY KEY (UserID, CommandName),
+FOREIGN KEY (UserID)
+    REFERENCES Users(UserID)
+    ON DELETE CASCADE,
+FOREIGN KEY (CommandName)
+    REFERENCES Commands(CommandName)
+    ON DELETE CASCADE,
+FOREIGN KEY (CogName)
+    REFERENCES Cogs(CogName)
+    ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS ChannelCommands
+(
+ChannelID   INTEGER NOT NULL,
+CommandName VARCHAR(32) NOT NULL,
+CogName	    VARCHAR(16) NOT NULL,
+PRIMARY KEY (ChannelID, CommandName),
+FOREIGN KEY (ChannelID)
+    REFERENCES Channels(ChannelID)
+    ON DELETE CASCADE,
+FOREIGN KEY (CommandName)
+    REFERENCES Commands(CommandName)
+    ON DELETE CASCADE
+FOREIGN KEY (CogName)
+    REFERENCES Cogs(CogName)
+    ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS UserCogs
+(
+UserID	INTEGER NOT NULL,
+CogName	VARCHAR(16) NOT NULL,
+PRIMARY KEY (UserID, CogName),
+FOREIGN KEY (UserID)
+    REFERENCES Users(UserID)
+    ON DELETE CASCADE,
+FOREIGN KEY (CogName)
+    REFERENCES Cogs(CogName)
+    ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS ChannelCogs 
+(
+ChannelID	INTEGER NOT NULL,
+CogName		VARCHAR(16) NOT NULL,
+PRIMARY KEY (ChannelID, CogName),
+FOREIGN KEY (ChannelID)
+    REFERENCES Channels(ChannelID)
+    ON DELETE CASCADE,
+FOREIGN KEY (CogName)
+    REFERENCES Cogs(CogName)
+    ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS Admins
+(
+UserID	INTEGER NOT NULL PRIMARY KEY
+);
+
+CREATE TABLE IF NOT EXISTS UserPerms
+(
+UserID      	INTEGER NOT NULL,
+CogName  	VARCHAR(16) NOT NULL,
+Permission  	INTEGER NOT NULL,
+PRIMARY KEY (UserID, CogName),
+FOREIGN KEY (UserID)
+    REFERENCES Users(UserID)
+    ON DELETE CASCADE,
+FOREIGN KEY (CogName)
+    REFERENCES Cogs(CogName)
+    ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS ChannelPerms
+(
+ChannelID      	INTEGER NOT NULL,
+CogName  	VARCHAR(16) NOT NULL,
+Permission  	INTEGER NOT NULL,
+PRIMARY KEY (ChannelID, CogName),
+FOREIGN KEY (ChannelID)
+    REFERENCES Channels(ChannelID)
+    ON DELETE CASCADE,
+FOREIGN KEY (CogName)
+    REFERENCES Cogs(CogName)
+    ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS Servers
+(
+ServerName  VARCHAR(16) NOT NULL PRIMARY KEY,
+State       INTEGER NOT NULL,
+FOREIGN KEY (ServerName)
+	REFERENCES Cogs(CogName)
+	ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS Webhooks
+(
+ChannelID	INTEGER NOT NULL,
+CogName		VARCHAR(16) NOT NULL,
+WebhookID	INTEGER NOT NULL,
+WebhookToken	VARCHAR(80),
+WebhookURL	VARCHAR(200),
+PRIMARY KEY (ChannelID, CogName),
+FOREIGN KEY (ChannelID)
+    REFERENCES Channels(ChannelID)
+    ON DELETE CASCADE,
+FOREIGN KEY (CogName)
+    REFERENCES Cogs(CogName)
+    ON DELETE CASCADE
+);
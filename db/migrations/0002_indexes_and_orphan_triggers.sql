@@ -0,0 +1,73 @@
+CREATE INDEX IF NOT EXISTS UserCommandsByCommand
+ON UserCommands (CommandName);
+
+CREATE INDEX IF NOT EXISTS UserCommandsByCog
+ON UserCommands (CogName, UserID);
+
+CREATE INDEX IF NOT EXISTS ChannelCommandsByCommand
+ON ChannelCommands (CommandName);
+
+CREATE INDEX IF NOT EXISTS ChannelCommandsByCog
+ON ChannelCommands (CogName, ChannelID);
+
+CREATE INDEX IF NOT EXISTS UserCogsByCog
+ON UserCogs (CogName);
+
+CREATE INDEX IF NOT EXISTS ChannelCogsByCog
+ON ChannelCogs (CogName);
+
+CREATE INDEX IF NOT EXISTS UserPermsByCog
+ON UserPerms (CogName);
+
+CREATE INDEX IF NOT EXISTS ChannelPermsByCog
+ON ChannelPerms (CogName);
+
+CREATE INDEX IF NOT EXISTS CommandsByCog
+ON Commands (CogName);
+
+CREATE INDEX IF NOT EXISTS WebhooksByCog
+ON Webhooks (CogName);
+
+CREATE TRIGGER IF NOT EXISTS UserCommandsOrphans
+AFTER DELETE ON UserCommands
+BEGIN
+    DELETE FROM UserCogs
+    WHERE   (UserID = OLD.UserID) AND (CogName = OLD.CogName) AND
+	    NOT EXISTS
+	    (
+		SELECT 1
+		FROM UserCommands
+		WHERE (UserID = OLD.UserID) AND (CogName = OLD.CogName)
+	    );
+
+    DELETE FROM Users
+    WHERE   (UserID = OLD.UserID) AND
+	    NOT EXISTS
+	    (
+		SELECT 1
+		FROM UserCommands
+		WHERE UserID = OLD.UserID
+	    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS ChannelCommandsOrphans
+AFTER DELETE ON ChannelCommands
+BEGIN
+    DELETE FROM ChannelCogs
+    WHERE   (ChannelID = OLD.ChannelID) AND (CogName = OLD.CogName) AND
+	    NOT EXISTS
+	    (
+		SELECT 1
+		FROM ChannelCommands
+		WHERE (ChannelID = OLD.ChannelID) AND (CogName = OLD.CogName)
+	    );
+
+    DELETE FROM Channels
+    WHERE   (ChannelID = OLD.ChannelID) AND
+	    NOT EXISTS
+	    (
+		SELECT 1
+		FROM ChannelCommands
+		WHERE ChannelID = OLD.ChannelID
+	    );
+END;
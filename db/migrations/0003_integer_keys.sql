@@ -0,0 +1,232 @@
+CREATE TABLE CogsKeyed
+(
+CogID	INTEGER NOT NULL PRIMARY KEY,
+CogName	VARCHAR(16) NOT NULL UNIQUE
+);
+
+INSERT INTO CogsKeyed (CogName)
+SELECT CogName
+FROM Cogs;
+
+CREATE TABLE CommandsKeyed
+(
+CommandID   INTEGER NOT NULL PRIMARY KEY,
+CommandName VARCHAR(32) NOT NULL UNIQUE,
+CogID	    INTEGER NOT NULL,
+FOREIGN KEY (CogID)
+    REFERENCES Cogs(CogID)
+    ON DELETE CASCADE
+);
+
+INSERT INTO CommandsKeyed (CommandName, CogID)
+SELECT Commands.CommandName, CogsKeyed.CogID
+FROM Commands
+JOIN CogsKeyed ON CogsKeyed.CogName = Commands.CogName;
+
+CREATE TABLE UserCommandsKeyed
+(
+UserID	    INTEGER NOT NULL,
+CommandID   INTEGER NOT NULL,
+CogID	    INTEGER NOT NULL,
+PRIMARY KEY (UserID, CommandID),
+FOREIGN KEY (UserID)
+    REFERENCES Users(UserID)
+    ON DELETE CASCADE,
+FOREIGN KEY (CommandID)
+    REFERENCES Commands(CommandID)
+    ON DELETE CASCADE,
+FOREIGN KEY (CogID)
+    REFERENCES Cogs(CogID)
+    ON DELETE CASCADE
+) WITHOUT ROWID;
+
+INSERT INTO UserCommandsKeyed
+SELECT UserCommands.UserID, CommandsKeyed.CommandID, CommandsKeyed.CogID
+FROM UserCommands
+JOIN CommandsKeyed ON CommandsKeyed.CommandName = UserCommands.CommandName;
+
+CREATE TABLE ChannelCommandsKeyed
+(
+ChannelID   INTEGER NOT NULL,
+CommandID   INTEGER NOT NULL,
+CogID	    INTEGER NOT NULL,
+PRIMARY KEY (ChannelID, CommandID),
+FOREIGN KEY (ChannelID)
+    REFERENCES Channels(ChannelID)
+    ON DELETE CASCADE,
+FOREIGN KEY (CommandID)
+    REFERENCES Commands(CommandID)
+    ON DELETE CASCADE,
+FOREIGN KEY (CogID)
+    REFERENCES Cogs(CogID)
+    ON DELETE CASCADE
+) WITHOUT ROWID;
+
+INSERT INTO ChannelCommandsKeyed
+SELECT ChannelCommands.ChannelID, CommandsKeyed.CommandID, CommandsKeyed.CogID
+FROM ChannelCommands
+JOIN CommandsKeyed
+ON CommandsKeyed.CommandName = ChannelCommands.CommandName;
+
+CREATE TABLE UserCogsKeyed
+(
+UserID	INTEGER NOT NULL,
+CogID	INTEGER NOT NULL,
+PRIMARY KEY (UserID, CogID),
+FOREIGN KEY (UserID)
+    REFERENCES Users(UserID)
+    ON DELETE CASCADE,
+FOREIGN KEY (CogID)
+    REFERENCES Cogs(CogID)
+    ON DELETE CASCADE
+) WITHOUT ROWID;
+
+INSERT INTO UserCogsKeyed
+SELECT UserCogs.UserID, CogsKeyed.CogID
+FROM UserCogs
+JOIN CogsKeyed ON CogsKeyed.CogName = UserCogs.CogName;
+
+CREATE TABLE ChannelCogsKeyed
+(
+ChannelID   INTEGER NOT NULL,
+CogID	    INTEGER NOT NULL,
+PRIMARY KEY (ChannelID, CogID),
+FOREIGN KEY (ChannelID)
+    REFERENCES Channels(ChannelID)
+    ON DELETE CASCADE,
+FOREIGN KEY (CogID)
+    REFERENCES Cogs(CogID)
+    ON DELETE CASCADE
+) WITHOUT ROWID;
+
+INSERT INTO ChannelCogsKeyed
+SELECT ChannelCogs.ChannelID, CogsKeyed.CogID
+FROM ChannelCogs
+JOIN CogsKeyed ON CogsKeyed.CogName = ChannelCogs.CogName;
+
+CREATE TABLE UserPermsKeyed
+(
+UserID	    INTEGER NOT NULL,
+CogID	    INTEGER NOT NULL,
+Permission  INTEGER NOT NULL,
+PRIMARY KEY (UserID, CogID),
+FOREIGN KEY (UserID)
+    REFERENCES Users(UserID)
+    ON DELETE CASCADE,
+FOREIGN KEY (CogID)
+    REFERENCES Cogs(CogID)
+    ON DELETE CASCADE
+) WITHOUT ROWID;
+
+INSERT INTO UserPermsKeyed
+SELECT UserPerms.UserID, CogsKeyed.CogID, UserPerms.Permission
+FROM UserPerms
+JOIN CogsKeyed ON CogsKeyed.CogName = UserPerms.CogName;
+
+CREATE TABLE ChannelPermsKeyed
+(
+ChannelID   INTEGER NOT NULL,
+CogID	    INTEGER NOT NULL,
+Permission  INTEGER NOT NULL,
+PRIMARY KEY (ChannelID, CogID),
+FOREIGN KEY (ChannelID)
+    REFERENCES Channels(ChannelID)
+    ON DELETE CASCADE,
+FOREIGN KEY (CogID)
+    REFERENCES Cogs(CogID)
+    ON DELETE CASCADE
+) WITHOUT ROWID;
+
+INSERT INTO ChannelPermsKeyed
+SELECT ChannelPerms.ChannelID, CogsKeyed.CogID, ChannelPerms.Permission
+FROM ChannelPerms
+JOIN CogsKeyed ON CogsKeyed.CogName = ChannelPerms.CogName;
+
+DROP TABLE UserCommands;
+DROP TABLE ChannelCommands;
+DROP TABLE UserCogs;
+DROP TABLE ChannelCogs;
+DROP TABLE UserPerms;
+DROP TABLE ChannelPerms;
+DROP TABLE Commands;
+DROP TABLE Cogs;
+
+ALTER TABLE CogsKeyed RENAME TO Cogs;
+ALTER TABLE CommandsKeyed RENAME TO Commands;
+ALTER TABLE UserCommandsKeyed RENAME TO UserCommands;
+ALTER TABLE ChannelCommandsKeyed RENAME TO ChannelCommands;
+ALTER TABLE UserCogsKeyed RENAME TO UserCogs;
+ALTER TABLE ChannelCogsKeyed RENAME TO ChannelCogs;
+ALTER TABLE UserPermsKeyed RENAME TO UserPerms;
+ALTER TABLE ChannelPermsKeyed RENAME TO ChannelPerms;
+
+CREATE INDEX CommandsByCog
+ON Commands (CogID);
+
+CREATE INDEX UserCommandsByCommand
+ON UserCommands (CommandID);
+
+CREATE INDEX UserCommandsByCog
+ON UserCommands (CogID, UserID);
+
+CREATE INDEX ChannelCommandsByCommand
+ON ChannelCommands (CommandID);
+
+CREATE INDEX ChannelCommandsByCog
+ON ChannelCommands (CogID, ChannelID);
+
+CREATE INDEX UserCogsByCog
+ON UserCogs (CogID);
+
+CREATE INDEX ChannelCogsByCog
+ON ChannelCogs (CogID);
+
+CREATE INDEX UserPermsByCog
+ON UserPerms (CogID);
+
+CREATE INDEX ChannelPermsByCog
+ON ChannelPerms (CogID);
+
+CREATE TRIGGER UserCommandsOrphans
+AFTER DELETE ON UserCommands
+BEGIN
+    DELETE FROM UserCogs
+    WHERE   (UserID = OLD.UserID) AND (CogID = OLD.CogID) AND
+	    NOT EXISTS
+	    (
+		SELECT 1
+		FROM UserCommands
+		WHERE (UserID = OLD.UserID) AND (CogID = OLD.CogID)
+	    );
+
+    DELETE FROM Users
+    WHERE   (UserID = OLD.UserID) AND
+	    NOT EXISTS
+	    (
+		SELECT 1
+		FROM UserCommands
+		WHERE UserID = OLD.UserID
+	    );
+END;
+
+CREATE TRIGGER ChannelCommandsOrphans
+AFTER DELETE ON ChannelCommands
+BEGIN
+    DELETE FROM ChannelCogs
+    WHERE   (ChannelID = OLD.ChannelID) AND (CogID = OLD.CogID) AND
+	    NOT EXISTS
+	    (
+		SELECT 1
+		FROM ChannelCommands
+		WHERE (ChannelID = OLD.ChannelID) AND (CogID = OLD.CogID)
+	    );
+
+    DELETE FROM Channels
+    WHERE   (ChannelID = OLD.ChannelID) AND
+	    NOT EXISTS
+	    (
+		SELECT 1
+		FROM ChannelCommands
+		WHERE ChannelID = OLD.ChannelID
+	    );
+END;
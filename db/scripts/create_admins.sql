@@ -1,4 +0,0 @@
-CREATE TABLE IF NOT EXISTS Admins
-(
-UserID	INTEGER NOT NULL PRIMARY KEY
-);
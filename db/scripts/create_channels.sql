@@ -1,4 +0,0 @@
-CREATE TABLE IF NOT EXISTS Channels
-(
-ChannelID   INTEGER NOT NULL PRIMARY KEY
-);
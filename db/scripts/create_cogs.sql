@@ -1,4 +0,0 @@
-CREATE TABLE IF NOT EXISTS Cogs
-(
-CogName	VARCHAR(16) NOT NULL PRIMARY KEY
-);
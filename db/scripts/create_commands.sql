@@ -1,8 +0,0 @@
-CREATE TABLE IF NOT EXISTS Commands 
-(
-CommandName VARCHAR(32) NOT NULL PRIMARY KEY,
-CogName	    VARCHAR(16) NOT NULL,
-FOREIGN KEY (CogName)
-    REFERENCES Cogs(CogName)
-    ON DELETE CASCADE
-);
@@ -1,8 +0,0 @@
-CREATE TABLE IF NOT EXISTS Servers
-(
-ServerName  VARCHAR(16) NOT NULL PRIMARY KEY,
-State       INTEGER NOT NULL,
-FOREIGN KEY (ServerName)
-	REFERENCES Cogs(CogName)
-	ON DELETE CASCADE
-);
@@ -1,4 +0,0 @@
-CREATE TABLE IF NOT EXISTS Users
-(
-UserID  INTEGER NOT NULL PRIMARY KEY
-);
@@ -1,2 +1,2 @@
 DELETE FROM ChannelCommands
-WHERE (ChannelID = ?) AND (CogName = ?)
+WHERE (ChannelID = ?) AND (CogID = ?)
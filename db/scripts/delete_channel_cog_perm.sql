@@ -1,2 +1,2 @@
 DELETE FROM ChannelPerms
-WHERE (ChannelID = ?) AND (CogName = ?)
+WHERE (ChannelID = ?) AND (CogID = ?)
@@ -1,2 +1,2 @@
 DELETE FROM ChannelCommands
-WHERE (ChannelID = ?) AND (CommandName = ?)
+WHERE (ChannelID = ?) AND (CommandID = ?)
@@ -1,2 +1,2 @@
 DELETE FROM UserCommands
-WHERE (UserID = ?) AND (CogName = ?)
+WHERE (UserID = ?) AND (CogID = ?)
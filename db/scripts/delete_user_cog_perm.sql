@@ -1,2 +1,2 @@
 DELETE FROM UserPerms
-WHERE (UserID = ?) AND (CogName = ?)
+WHERE (UserID = ?) AND (CogID = ?)
@@ -1,2 +1,2 @@
 DELETE FROM UserCommands
-WHERE (UserID = ?) AND (CommandName = ?)
+WHERE (UserID = ?) AND (CommandID = ?)
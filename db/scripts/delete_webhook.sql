@@ -0,0 +1,2 @@
+DELETE FROM Webhooks
+WHERE (ChannelID = ?) AND (CogName = ?)
@@ -1,3 +1,3 @@
 INSERT INTO ChannelCogs
 VALUES (?, ?)
-ON CONFLICT (ChannelID, CogName) DO NOTHING
+ON CONFLICT (ChannelID, CogID) DO NOTHING
@@ -1,3 +1,3 @@
 INSERT INTO ChannelCommands 
 VALUES (?, ?, ?)
-ON CONFLICT (ChannelID, CommandName) DO NOTHING
+ON CONFLICT (ChannelID, CommandID) DO NOTHING
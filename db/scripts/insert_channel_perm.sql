@@ -1,4 +1,4 @@
 INSERT INTO ChannelPerms
 VALUES (?, ?, ?)
-ON CONFLICT (ChannelID, CogName) DO
+ON CONFLICT (ChannelID, CogID) DO
 UPDATE SET Permission = excluded.Permission
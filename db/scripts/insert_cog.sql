@@ -1,3 +1,3 @@
-INSERT INTO Cogs
+INSERT INTO Cogs (CogName)
 VALUES (?)
 ON CONFLICT (CogName) DO NOTHING
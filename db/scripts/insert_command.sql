@@ -1,3 +1,3 @@
-INSERT INTO Commands 
+INSERT INTO Commands (CommandName, CogID)
 VALUES (?, ?)
 ON CONFLICT (CommandName) DO NOTHING
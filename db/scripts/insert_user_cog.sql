@@ -1,3 +1,3 @@
 INSERT INTO UserCogs 
 VALUES (?, ?)
-ON CONFLICT (UserID, CogName) DO NOTHING
+ON CONFLICT (UserID, CogID) DO NOTHING
@@ -1,3 +1,3 @@
 INSERT INTO UserCommands 
 VALUES (?, ?, ?)
-ON CONFLICT (UserID, CommandName) DO NOTHING
+ON CONFLICT (UserID, CommandID) DO NOTHING
@@ -1,4 +1,4 @@
 INSERT INTO UserPerms
 VALUES (?, ?, ?)
-ON CONFLICT (UserID, CogName) DO
+ON CONFLICT (UserID, CogID) DO
 UPDATE SET Permission = excluded.Permission
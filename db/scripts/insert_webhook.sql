@@ -0,0 +1,6 @@
+INSERT INTO Webhooks
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (ChannelID, CogName) DO UPDATE
+SET WebhookID = excluded.WebhookID,
+    WebhookToken = excluded.WebhookToken,
+    WebhookURL = excluded.WebhookURL
@@ -0,0 +1,3 @@
+SELECT ChannelID
+FROM Channels
+WHERE ChannelID = ?
@@ -0,0 +1,4 @@
+SELECT CogName
+FROM ChannelCogs
+JOIN Cogs ON Cogs.CogID = ChannelCogs.CogID
+WHERE ChannelID = ?
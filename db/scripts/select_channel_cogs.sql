@@ -1,3 +1,4 @@
 SELECT ChannelID
 FROM ChannelCogs 
+JOIN Cogs ON Cogs.CogID = ChannelCogs.CogID
 WHERE CogName = ?
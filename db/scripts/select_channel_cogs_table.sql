@@ -1,2 +1,3 @@
-SELECT *
+SELECT ChannelID, CogName
 FROM ChannelCogs 
+JOIN Cogs ON Cogs.CogID = ChannelCogs.CogID
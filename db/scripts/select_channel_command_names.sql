@@ -0,0 +1,4 @@
+SELECT CommandName
+FROM ChannelCommands
+JOIN Commands ON Commands.CommandID = ChannelCommands.CommandID
+WHERE ChannelID = ?
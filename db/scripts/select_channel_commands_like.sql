@@ -1,3 +0,0 @@
-SELECT CommandName
-FROM ChannelCommands
-WHERE CommandName LIKE ?
@@ -1,2 +1,4 @@
-SELECT *
+SELECT ChannelID, CommandName, CogName
 FROM ChannelCommands 
+JOIN Commands ON Commands.CommandID = ChannelCommands.CommandID
+JOIN Cogs ON Cogs.CogID = ChannelCommands.CogID
@@ -1,3 +1,4 @@
 SELECT Permission
 FROM ChannelPerms
+JOIN Cogs ON Cogs.CogID = ChannelPerms.CogID
 WHERE (ChannelID = ?) AND (CogName = ?)
@@ -0,0 +1,4 @@
+SELECT CogName, Permission
+FROM ChannelPerms
+JOIN Cogs ON Cogs.CogID = ChannelPerms.CogID
+WHERE ChannelID = ?
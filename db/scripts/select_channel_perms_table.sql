@@ -1,2 +1,3 @@
-SELECT *
+SELECT ChannelID, CogName, Permission
 FROM ChannelPerms
+JOIN Cogs ON Cogs.CogID = ChannelPerms.CogID
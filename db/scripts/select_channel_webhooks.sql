@@ -0,0 +1,3 @@
+SELECT DISTINCT WebhookID, WebhookToken
+FROM Webhooks
+WHERE ChannelID = ?
@@ -1,3 +1,4 @@
-SELECT *
+SELECT ChannelID, CogName, Permission
 FROM ChannelPerms
+JOIN Cogs ON Cogs.CogID = ChannelPerms.CogID
 WHERE CogName = ?
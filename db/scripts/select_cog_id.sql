@@ -0,0 +1,3 @@
+SELECT CogID
+FROM Cogs
+WHERE CogName = ?
\ No newline at end of file
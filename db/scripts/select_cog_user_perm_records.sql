@@ -1,3 +1,4 @@
-SELECT *
+SELECT UserID, CogName, Permission
 FROM UserPerms
+JOIN Cogs ON Cogs.CogID = UserPerms.CogID
 WHERE CogName = ?
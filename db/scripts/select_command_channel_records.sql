@@ -1,3 +1,5 @@
-SELECT *
+SELECT ChannelID, CommandName, CogName
 FROM ChannelCommands 
+JOIN Commands ON Commands.CommandID = ChannelCommands.CommandID
+JOIN Cogs ON Cogs.CogID = ChannelCommands.CogID
 WHERE CommandName = ?
@@ -1,3 +1,4 @@
 SELECT ChannelID
 FROM ChannelCommands
+JOIN Commands ON Commands.CommandID = ChannelCommands.CommandID
 WHERE CommandName = ?
@@ -0,0 +1,3 @@
+SELECT CommandName
+FROM Commands
+WHERE (CommandName >= ?) AND (CommandName < ?)
@@ -0,0 +1,3 @@
+SELECT CommandID
+FROM Commands
+WHERE CommandName = ?
\ No newline at end of file
@@ -1,3 +1,4 @@
 SELECT UserID
 FROM UserCommands
+JOIN Commands ON Commands.CommandID = UserCommands.CommandID
 WHERE CommandName = ?
@@ -1,2 +1,3 @@
-SELECT *
-FROM Commands 
+SELECT CommandName, CogName
+FROM Commands
+JOIN Cogs ON Cogs.CogID = Commands.CogID
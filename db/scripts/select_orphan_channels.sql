@@ -1,5 +0,0 @@
-SELECT Channels.ChannelID
-FROM Channels
-LEFT JOIN ChannelCommands 
-ON Channels.ChannelID = ChannelCommands.ChannelID
-WHERE ChannelCommands.ChannelID IS NULL
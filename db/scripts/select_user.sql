@@ -0,0 +1,3 @@
+SELECT UserID
+FROM Users
+WHERE UserID = ?
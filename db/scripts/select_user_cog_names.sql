@@ -0,0 +1,4 @@
+SELECT CogName
+FROM UserCogs
+JOIN Cogs ON Cogs.CogID = UserCogs.CogID
+WHERE UserID = ?
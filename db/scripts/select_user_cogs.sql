@@ -1,3 +1,4 @@
 SELECT UserID
 FROM UserCogs 
+JOIN Cogs ON Cogs.CogID = UserCogs.CogID
 WHERE CogName = ?
@@ -1,2 +1,3 @@
-SELECT *
+SELECT UserID, CogName
 FROM UserCogs 
+JOIN Cogs ON Cogs.CogID = UserCogs.CogID
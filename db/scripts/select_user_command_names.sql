@@ -0,0 +1,4 @@
+SELECT CommandName
+FROM UserCommands
+JOIN Commands ON Commands.CommandID = UserCommands.CommandID
+WHERE UserID = ?
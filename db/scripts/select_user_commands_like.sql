@@ -1,3 +0,0 @@
-SELECT CommandName
-FROM UserCommands
-WHERE CommandName LIKE ?
@@ -1,2 +1,4 @@
-SELECT *
+SELECT UserID, CommandName, CogName
 FROM UserCommands 
+JOIN Commands ON Commands.CommandID = UserCommands.CommandID
+JOIN Cogs ON Cogs.CogID = UserCommands.CogID
@@ -1,3 +1,4 @@
 SELECT Permission
 FROM UserPerms
+JOIN Cogs ON Cogs.CogID = UserPerms.CogID
 WHERE (UserID = ?) AND (CogName = ?)
@@ -0,0 +1,4 @@
+SELECT CogName, Permission
+FROM UserPerms
+JOIN Cogs ON Cogs.CogID = UserPerms.CogID
+WHERE UserID = ?
@@ -1,2 +1,3 @@
-SELECT *
+SELECT UserID, CogName, Permission
 FROM UserPerms
+JOIN Cogs ON Cogs.CogID = UserPerms.CogID
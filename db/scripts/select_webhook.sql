@@ -0,0 +1,3 @@
+SELECT WebhookID, WebhookToken, WebhookURL
+FROM Webhooks
+WHERE (ChannelID = ?) AND (CogName = ?)
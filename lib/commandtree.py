@@ -0,0 +1,49 @@
+from collections import Counter
+from typing import Iterable, List, Set
+
+
+def ancestors(command_name: str) -> List[str]:
+    parts = command_name.split(" ")
+    return [" ".join(parts[:depth]) for depth in range(len(parts) - 1, 0, -1)]
+
+
+class CommandTree:
+    def __init__(self, command_names: Iterable[str] = ()) -> None:
+        self.names: Set[str] = set()
+        self.descendants: Counter[str] = Counter()
+        for command_name in command_names:
+            self.add(command_name)
+
+    def add(self, command_name: str) -> None:
+        if (command_name in self.names):
+            return
+
+        self.names.add(command_name)
+        for parent_name in ancestors(command_name):
+            self.descendants[parent_name] += 1
+
+    def remove(self, command_name: str) -> None:
+        if (command_name not in self.names):
+            return
+
+        self.names.remove(command_name)
+        for parent_name in ancestors(command_name):
+            self.descendants[parent_name] -= 1
+
+    def __contains__(self, command_name: str) -> bool:
+        return command_name in self.names
+
+    def has_descendants(self, command_name: str) -> bool:
+        return self.descendants[command_name] > 0
+
+    def prunable(self, command_name: str) -> List[str]:
+        pruned: List[str] = []
+        for parent_name in ancestors(command_name):
+            if (self.has_descendants(parent_name)):
+                break
+
+            if (parent_name in self):
+                self.remove(parent_name)
+                pruned.append(parent_name)
+
+        return pruned
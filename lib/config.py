@@ -1,7 +1,11 @@
+import os
 import json
+import time
 import pathlib
 from collections import UserDict
-from typing import Dict, Union, Any, Self
+from typing import Dict, Final, Optional, Tuple, Union, Any, Self
+
+CHECK_SECONDS: Final[float] = 1.0
 
 
 class Config(UserDict[str, Any]):
@@ -38,3 +42,42 @@ class Config(UserDict[str, Any]):
             raise ValueError(f"Invalid JSON: {e}")
 
         return cls(config)
+
+    @classmethod
+    def load(cls, config_file: str) -> Self:
+        now = time.monotonic()
+        entry = _cache.get(config_file)
+        if (entry is not None and now - entry.checked < CHECK_SECONDS):
+            return entry.config
+
+        try:
+            stat = os.stat(config_file)
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Config file not found at {config_file}."
+            )
+
+        signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if (entry is None or entry.signature != signature):
+            entry = _Entry(cls.from_json(config_file), signature)
+            _cache[config_file] = entry
+
+        entry.checked = now
+        return entry.config
+
+    @staticmethod
+    def reload(config_file: Optional[str] = None) -> None:
+        if (config_file is None):
+            _cache.clear()
+        else:
+            _cache.pop(config_file, None)
+
+
+class _Entry:
+    def __init__(self, config: Config, signature: Tuple[int, int, int]):
+        self.config = config
+        self.signature = signature
+        self.checked = 0.0
+
+
+_cache: Dict[str, _Entry] = {}
@@ -0,0 +1,21 @@
+import re
+import discord
+from typing import Final, Union
+from discord.ext import commands
+
+ROLE_MENTION: Final[re.Pattern[str]] = re.compile(r"^<@&\d+>$")
+
+
+class RoleMention(commands.RoleConverter):
+    async def convert(
+            self,
+            ctx: commands.Context,
+            argument: str
+    ) -> discord.Role:
+        if (not ROLE_MENTION.match(argument)):
+            raise commands.BadArgument(f"{argument} is not a role mention.")
+
+        return await super().convert(ctx, argument)
+
+
+Targets = commands.Greedy[Union[int, RoleMention]]
@@ -0,0 +1,1171 @@
+import os
+import re
+import sys
+import time
+import queue
+import sqlite3
+import asyncio
+import pathlib
+import threading
+import concurrent.futures
+from typing import (Any, AsyncIterator, Callable, Dict, Final, FrozenSet,
+                    List, Mapping, NamedTuple, Optional, Sequence, Tuple,
+                    TypeVar)
+from lib.statements import Statements
+from lib.permissions import PermissionIndex
+from lib.commandtree import CommandTree
+
+MIGRATION_PATTERN: Final[re.Pattern[str]] = re.compile(r"^(\d+)_[\w-]+\.sql$")
+READERS: Final[int] = 2
+BUSY_TIMEOUT: Final[float] = 5.0
+LOCK_RETRIES: Final[int] = 5
+RETRY_DELAY: Final[float] = 0.05
+WRITE_BATCH: Final[int] = 64
+VACUUM_PAGES: Final[int] = 1000
+CHUNK_ROWS: Final[int] = 500
+PROFILE: Final[Dict[str, Any]] = {
+    "journal_mode": "wal",
+    "synchronous": "normal",
+    "mmap_size": 268435456,
+    "cache_size": -16384,
+    "temp_store": "memory",
+    "auto_vacuum": "incremental"
+}
+PRAGMA_CHOICES: Final[Dict[str, FrozenSet[str]]] = {
+    "journal_mode": frozenset(
+        {"delete", "truncate", "persist", "memory", "wal", "off"}
+    ),
+    "synchronous": frozenset({"off", "normal", "full", "extra"}),
+    "temp_store": frozenset({"default", "file", "memory"}),
+    "auto_vacuum": frozenset({"none", "full", "incremental"})
+}
+INTEGER_PRAGMAS: Final[FrozenSet[str]] = frozenset({"mmap_size", "cache_size"})
+DATABASE_PRAGMAS: Final[FrozenSet[str]] = frozenset(
+    {"journal_mode", "auto_vacuum"}
+)
+AUTO_VACUUM_MODES: Final[Tuple[str, ...]] = ("none", "full", "incremental")
+
+T = TypeVar("T")
+PrincipalRecords = Tuple[bool, List[str], List[str], List[Tuple[str, int]]]
+WebhookRecord = Tuple[int, Optional[str]]
+
+
+class _Write(NamedTuple):
+    function: Callable[[Any], Any]
+    future: concurrent.futures.Future
+    transaction: bool = True
+
+
+def _pragma_value(name: str, value: Any) -> str:
+    if (name in INTEGER_PRAGMAS):
+        return str(int(value))
+
+    choices = PRAGMA_CHOICES.get(name)
+    if (choices is None):
+        raise ValueError(f"Unknown database setting {name}.")
+
+    if (str(value).lower() not in choices):
+        raise ValueError(
+            f"Invalid value {value!r} for database setting {name}. "
+            f"Expected one of {sorted(choices)}."
+        )
+
+    return str(value).lower()
+
+
+def _locked(error: sqlite3.OperationalError) -> bool:
+    message = str(error)
+    return "locked" in message or "busy" in message
+
+
+def _retry(function: Callable[[], T]) -> T:
+    attempt = 0
+    while True:
+        try:
+            return function()
+        except sqlite3.OperationalError as e:
+            if (not _locked(e) or attempt >= LOCK_RETRIES):
+                raise
+
+        time.sleep(RETRY_DELAY * 2 ** attempt)
+        attempt += 1
+
+
+class KeyMap:
+    def __init__(self, sql: str, kind: str) -> None:
+        self.sql = sql
+        self.kind = kind
+        self.ids: Dict[str, int] = {}
+        self.names: Dict[int, str] = {}
+
+    def key(self, cursor: sqlite3.Cursor, name: str) -> int:
+        key = self.ids.get(name)
+        if (key is not None):
+            return key
+
+        record = cursor.execute(self.sql, (name,)).fetchone()
+        if (record is None):
+            raise sqlite3.IntegrityError(f"Unknown {self.kind} {name}.")
+
+        self.ids[name] = record[0]
+        self.names[record[0]] = name
+        return record[0]
+
+    def name(self, key: int) -> Optional[str]:
+        return self.names.get(key)
+
+    def discard(self, name: str) -> None:
+        key = self.ids.pop(name, None)
+        if (key is not None):
+            self.names.pop(key, None)
+
+    def clear(self) -> None:
+        self.ids.clear()
+        self.names.clear()
+
+
+class RecordStream:
+    def __init__(
+            self,
+            database: "Database",
+            sql: str,
+            params: Sequence[Any],
+            chunk: int = CHUNK_ROWS
+    ) -> None:
+        self.database = database
+        self.sql = sql
+        self.params = params
+        self.chunk = chunk
+        self.columns: Tuple[str, ...] = ()
+
+    def _open(self) -> Tuple[sqlite3.Connection, sqlite3.Cursor]:
+        db = self.database._connect()
+        try:
+            db.execute("BEGIN")
+            cursor = _retry(lambda: db.execute(self.sql, self.params))
+        except BaseException:
+            db.close()
+            raise
+
+        return db, cursor
+
+    async def chunks(self) -> AsyncIterator[List[Tuple[Any, ...]]]:
+        loop = asyncio.get_running_loop()
+        readers = self.database._readers
+        db, cursor = await loop.run_in_executor(readers, self._open)
+        self.columns = tuple(
+            column[0] for column in cursor.description or ()
+        )
+        try:
+            while (True):
+                rows = await loop.run_in_executor(
+                    readers,
+                    cursor.fetchmany,
+                    self.chunk
+                )
+                if (not rows):
+                    break
+
+                yield rows
+        finally:
+            db.close()
+
+
+class Database:
+    def __init__(
+            self,
+            db_path: str,
+            sql_dir: str,
+            readers: int = READERS,
+            busy_timeout: float = BUSY_TIMEOUT,
+            profile: Optional[Mapping[str, Any]] = None
+    ) -> None:
+        self.db_path = db_path
+        self.statements = Statements(sql_dir)
+        self.busy_timeout = busy_timeout
+        self.profile = {
+            name: _pragma_value(name, value)
+            for name, value in {**PROFILE, **(profile or {})}.items()
+        }
+        self.permissions = PermissionIndex()
+        self.cog_keys = KeyMap(self._script("select_cog_id"), "cog")
+        self.command_keys = KeyMap(
+            self._script("select_command_id"),
+            "command"
+        )
+        self._readers = concurrent.futures.ThreadPoolExecutor(
+            max_workers=readers,
+            thread_name_prefix="db-reader"
+        )
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._writes: queue.SimpleQueue[Optional[_Write]] = (
+            queue.SimpleQueue()
+        )
+        self._writer: Optional[threading.Thread] = None
+        self._closed = False
+        self._index_lock = asyncio.Lock()
+        self._generation = 0
+        self._data_version: Optional[int] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        db = sqlite3.connect(
+            self.db_path,
+            timeout=self.busy_timeout,
+            isolation_level=None,
+            check_same_thread=False
+        )
+        db.execute("PRAGMA FOREIGN_KEYS = ON")
+        for name, value in self.profile.items():
+            if (name not in DATABASE_PRAGMAS):
+                db.execute(f"PRAGMA {name} = {value}")
+
+        return db
+
+    def configure(self) -> Dict[str, Any]:
+        db = self._connect()
+        try:
+            db.execute(
+                f"PRAGMA journal_mode = {self.profile['journal_mode']}"
+            )
+            auto_vacuum = db.execute("PRAGMA auto_vacuum").fetchone()[0]
+            if (AUTO_VACUUM_MODES[auto_vacuum] != self.profile["auto_vacuum"]):
+                db.execute(
+                    f"PRAGMA auto_vacuum = {self.profile['auto_vacuum']}"
+                )
+                db.execute("VACUUM")
+
+            return {
+                name: db.execute(f"PRAGMA {name}").fetchone()[0]
+                for name in self.profile
+            }
+        finally:
+            db.close()
+
+    def _script(self, name: str) -> str:
+        return self.statements[name]
+
+    def _reader(self) -> sqlite3.Connection:
+        db = getattr(self._local, "db", None)
+        if (db is None):
+            db = self._local.db = self._connect()
+            with self._lock:
+                self._connections.append(db)
+
+        return db
+
+    def _run_read(self, function: Callable[[sqlite3.Connection], T]) -> T:
+        db = self._reader()
+
+        def snapshot() -> T:
+            db.execute("BEGIN")
+            try:
+                return function(db)
+            finally:
+                db.execute("COMMIT")
+
+        return _retry(snapshot)
+
+    async def _read(self, function: Callable[[sqlite3.Connection], T]) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._readers,
+            self._run_read,
+            function
+        )
+
+    def _write_loop(self) -> None:
+        db = self._connect()
+        self._data_version = db.execute("PRAGMA data_version").fetchone()[0]
+        running = True
+        while (running):
+            batch = [self._writes.get()]
+            while (len(batch) < WRITE_BATCH):
+                try:
+                    batch.append(self._writes.get_nowait())
+                except queue.Empty:
+                    break
+
+            pending: List[_Write] = []
+            for job in batch:
+                if (job is None):
+                    running = False
+                elif (job.transaction):
+                    pending.append(job)
+                else:
+                    self._commit(db, pending)
+                    pending = []
+                    self._run(db, job)
+
+            self._commit(db, pending)
+
+        db.execute("PRAGMA optimize")
+        db.close()
+
+    def _run(self, db: sqlite3.Connection, job: _Write) -> None:
+        if (not job.future.set_running_or_notify_cancel()):
+            return
+
+        try:
+            result = _retry(lambda: job.function(db))
+        except Exception as e:
+            job.future.set_exception(e)
+        else:
+            job.future.set_result(result)
+
+    def _commit(self, db: sqlite3.Connection, batch: List[_Write]) -> None:
+        jobs = [
+            job for job in batch
+            if job.future.set_running_or_notify_cancel()
+        ]
+        if (not jobs):
+            return
+
+        results: List[Tuple[_Write, Any, Optional[Exception]]] = []
+        try:
+            _retry(lambda: db.execute("BEGIN IMMEDIATE"))
+            cursor = db.cursor()
+            for job in jobs:
+                cursor.execute("SAVEPOINT job")
+                try:
+                    result = job.function(cursor)
+                except Exception as e:
+                    cursor.execute("ROLLBACK TO job")
+                    cursor.execute("RELEASE job")
+                    exc_type, exc_obj, exc_tb = sys.exc_info()
+                    fname = os.path.split(
+                        exc_tb.tb_frame.f_code.co_filename
+                    )[1]
+                    print(exc_type, fname, exc_tb.tb_lineno)
+                    results.append((job, None, e))
+                else:
+                    cursor.execute("RELEASE job")
+                    results.append((job, result, None))
+
+            _retry(lambda: db.execute("COMMIT"))
+        except Exception as e:
+            if (db.in_transaction):
+                db.execute("ROLLBACK")
+
+            self.cog_keys.clear()
+            self.command_keys.clear()
+            for job in jobs:
+                job.future.set_exception(e)
+
+            return
+
+        for job, result, error in results:
+            if (error is None):
+                job.future.set_result(result)
+            else:
+                job.future.set_exception(error)
+
+    def _submit(
+            self,
+            function: Callable[[Any], T],
+            transaction: bool = True
+    ) -> concurrent.futures.Future:
+        with self._lock:
+            if (self._closed):
+                raise RuntimeError("Database is closed.")
+
+            if (self._writer is None):
+                self._writer = threading.Thread(
+                    target=self._write_loop,
+                    name="db-writer",
+                    daemon=True
+                )
+                self._writer.start()
+
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        self._writes.put(_Write(function, future, transaction))
+        return future
+
+    def pending_writes(self) -> int:
+        return self._writes.qsize()
+
+    async def _write(self, function: Callable[[sqlite3.Cursor], T]) -> T:
+        try:
+            return await asyncio.wrap_future(self._submit(function))
+        finally:
+            self._generation += 1
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            writer = self._writer
+
+        if (writer is not None):
+            self._writes.put(None)
+            writer.join()
+
+        self._readers.shutdown(wait=True)
+        with self._lock:
+            while (self._connections):
+                self._connections.pop().close()
+
+    def _maintain(
+            self,
+            db: sqlite3.Connection,
+            vacuum_pages: int
+    ) -> Dict[str, float]:
+        timings: Dict[str, float] = {}
+        start = time.perf_counter()
+        db.execute("PRAGMA optimize")
+        timings["optimize"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        db.execute(
+            f"PRAGMA incremental_vacuum({int(vacuum_pages)})"
+        ).fetchall()
+        timings["incremental_vacuum"] = time.perf_counter() - start
+
+        if (self.profile["journal_mode"] == "wal"):
+            start = time.perf_counter()
+            db.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+            timings["wal_checkpoint"] = time.perf_counter() - start
+
+        return timings
+
+    async def maintain(
+            self,
+            vacuum_pages: int = VACUUM_PAGES
+    ) -> Dict[str, float]:
+        return await asyncio.wrap_future(self._submit(
+            lambda db: self._maintain(db, vacuum_pages),
+            transaction=False
+        ))
+
+    def invalidate(self) -> None:
+        self._generation += 1
+        self.permissions.invalidate()
+        self.cog_keys.clear()
+        self.command_keys.clear()
+
+    async def sync_permissions(self) -> bool:
+        version = await asyncio.wrap_future(self._submit(
+            lambda db: db.execute("PRAGMA data_version").fetchone()[0],
+            transaction=False
+        ))
+        changed = version != self._data_version
+        self._data_version = version
+        if (not changed or not self.permissions.loaded):
+            return False
+
+        self.invalidate()
+        return True
+
+    def _optional_records(
+            self,
+            db: sqlite3.Connection,
+            script: str
+    ) -> List[Tuple[Any, ...]]:
+        try:
+            return db.execute(self._script(script)).fetchall()
+        except sqlite3.OperationalError as e:
+            if ("no such table" not in str(e)):
+                raise
+
+            return []
+
+    def _index_records(self, db: sqlite3.Connection) -> Dict[str, Any]:
+        records: Dict[str, Any] = {
+            "admins": [
+                record[0] for record in
+                self._optional_records(db, "select_admins_table")
+            ]
+        }
+        for table in ("user", "channel"):
+            records[table] = (
+                [record[0] for record in
+                 self._optional_records(db, f"select_{table}s_table")],
+                [record[:2] for record in self._optional_records(
+                    db, f"select_{table}_commands_table")],
+                [record[:2] for record in self._optional_records(
+                    db, f"select_{table}_cogs_table")],
+                [record[:3] for record in self._optional_records(
+                    db, f"select_{table}_perms_table")]
+            )
+
+        return records
+
+    async def _index(self) -> PermissionIndex:
+        index = self.permissions
+        if (index.loaded):
+            return index
+
+        async with self._index_lock:
+            while (not index.loaded):
+                generation = self._generation
+                records = await self._read(self._index_records)
+                if (generation != self._generation):
+                    continue
+
+                index.admins = set(records["admins"])
+                index.users.load(*records["user"])
+                index.channels.load(*records["channel"])
+                index.loaded = True
+
+        return index
+
+    def _principal_records(
+            self,
+            cursor: sqlite3.Cursor,
+            table: str,
+            principal_id: int
+    ) -> PrincipalRecords:
+        params = (principal_id,)
+        cursor.execute(self._script(f"select_{table}"), params)
+        member = cursor.fetchone() is not None
+        cursor.execute(self._script(f"select_{table}_command_names"), params)
+        command_names = [record[0] for record in cursor.fetchall()]
+        cursor.execute(self._script(f"select_{table}_cog_names"), params)
+        cog_names = [record[0] for record in cursor.fetchall()]
+        cursor.execute(self._script(f"select_{table}_perm_records"), params)
+        perms = cursor.fetchall()
+        return member, command_names, cog_names, perms
+
+    async def _fetchall(
+            self,
+            script: str,
+            params: Sequence[Any] = ()
+    ) -> List[Tuple[Any, ...]]:
+        sql = self._script(script)
+        return await self._read(lambda db: db.execute(sql, params).fetchall())
+
+    async def _fetchone(
+            self,
+            script: str,
+            params: Sequence[Any] = ()
+    ) -> Optional[Tuple[Any, ...]]:
+        sql = self._script(script)
+        return await self._read(lambda db: db.execute(sql, params).fetchone())
+
+    def _orphan_channels(
+            self,
+            cursor: sqlite3.Cursor,
+            channel_ids: Sequence[int]
+    ) -> Tuple[int, ...]:
+        sql = self._script("select_channel")
+        return tuple(
+            channel_id for channel_id in channel_ids
+            if cursor.execute(sql, (channel_id,)).fetchone() is None
+        )
+
+    def _channel_webhooks(
+            self,
+            cursor: sqlite3.Cursor,
+            channel_ids: Sequence[int]
+    ) -> Dict[int, List[WebhookRecord]]:
+        sql = self._script("select_channel_webhooks")
+        return {
+            channel_id: cursor.execute(sql, (channel_id,)).fetchall()
+            for channel_id in channel_ids
+        }
+
+    def _orphan_webhooks(
+            self,
+            cursor: sqlite3.Cursor,
+            webhooks: Dict[int, List[WebhookRecord]]
+    ) -> Tuple[WebhookRecord, ...]:
+        return tuple(
+            webhook
+            for channel_id in self._orphan_channels(cursor, list(webhooks))
+            for webhook in webhooks[channel_id]
+        )
+
+    @staticmethod
+    def migrations(migrations_dir: str) -> List[Tuple[int, pathlib.Path]]:
+        migrations: Dict[int, pathlib.Path] = {}
+        for path in sorted(pathlib.Path(migrations_dir).glob("*.sql")):
+            match = MIGRATION_PATTERN.match(path.name)
+            if (match is None):
+                raise ValueError(f"Invalid migration file name {path}.")
+
+            version = int(match.group(1))
+            if (version in migrations):
+                raise ValueError(
+                    f"Duplicate migration version {version}: "
+                    f"{migrations[version]} and {path}."
+                )
+
+            migrations[version] = path
+
+        return sorted(migrations.items())
+
+    def migrate(self, migrations_dir: str) -> List[str]:
+        applied: List[str] = []
+        db = self._connect()
+        db.execute("PRAGMA FOREIGN_KEYS = OFF")
+        try:
+            version = db.execute("PRAGMA user_version").fetchone()[0]
+            for target, path in self.migrations(migrations_dir):
+                if (target <= version):
+                    continue
+
+                with open(path, "r") as migration:
+                    sql = migration.read()
+
+                try:
+                    db.executescript(
+                        f"BEGIN;\n{sql}\n"
+                        f"PRAGMA user_version = {target};"
+                    )
+                    violation = db.execute(
+                        "PRAGMA foreign_key_check"
+                    ).fetchone()
+                    if (violation is not None):
+                        raise sqlite3.IntegrityError(
+                            f"Foreign key violation in {violation[0]}"
+                        )
+
+                    db.execute("COMMIT")
+                except sqlite3.Error as e:
+                    if (db.in_transaction):
+                        db.execute("ROLLBACK")
+
+                    raise RuntimeError(
+                        f"Migration {path.name} failed: {e}"
+                    ) from e
+
+                version = target
+                applied.append(path.name)
+        finally:
+            db.close()
+
+        self.invalidate()
+        return applied
+
+    async def insert_rows(
+            self,
+            statements: Sequence[Tuple[str, Tuple[Any, ...]]]
+    ) -> None:
+        def write(cursor: sqlite3.Cursor) -> None:
+            for script, params in statements:
+                cursor.execute(self._script(script), params)
+
+        await self._write(write)
+
+    async def insert_commands(
+            self,
+            commands: Sequence[Tuple[str, str]]
+    ) -> None:
+        def write(cursor: sqlite3.Cursor) -> None:
+            cursor.executemany(
+                self._script("insert_command"),
+                [
+                    (command_name, self.cog_keys.key(cursor, cog_name))
+                    for command_name, cog_name in commands
+                ]
+            )
+
+        await self._write(write)
+
+    async def get_records(
+            self,
+            script: str,
+            *params: Any
+    ) -> List[Tuple[Any, ...]]:
+        return await self._fetchall(script, params)
+
+    def stream_records(
+            self,
+            script: str,
+            *params: Any,
+            chunk: int = CHUNK_ROWS
+    ) -> RecordStream:
+        return RecordStream(self, self._script(script), params, chunk)
+
+    async def get_users(self, cog_name: str) -> Tuple[int, ...]:
+        return tuple((await self._index()).users.cog_holders(cog_name))
+
+    def channels_version(self) -> int:
+        return self.permissions.channels.version
+
+    async def get_channels(self, cog_name: str) -> Tuple[int, ...]:
+        return tuple((await self._index()).channels.cog_holders(cog_name))
+
+    async def get_command_users(self, command_name: str) -> Tuple[int, ...]:
+        index = await self._index()
+        return tuple(index.users.command_holders(command_name))
+
+    async def get_command_channels(
+            self,
+            command_name: str
+    ) -> Tuple[int, ...]:
+        index = await self._index()
+        return tuple(index.channels.command_holders(command_name))
+
+    async def get_admins(self) -> Tuple[int, ...]:
+        return tuple((await self._index()).admins)
+
+    async def get_all_users(self) -> Tuple[int, ...]:
+        return tuple((await self._index()).users.members)
+
+    async def get_all_channels(self) -> Tuple[int, ...]:
+        return tuple((await self._index()).channels.members)
+
+    async def is_admin(self, user_id: int) -> bool:
+        return user_id in (await self._index()).admins
+
+    async def is_user(self, user_id: int) -> bool:
+        return user_id in (await self._index()).users.members
+
+    async def is_channel(self, channel_id: int) -> bool:
+        return channel_id in (await self._index()).channels.members
+
+    async def is_command_user(self, command_name: str, user_id: int) -> bool:
+        index = await self._index()
+        return index.users.has_command(user_id, command_name)
+
+    async def is_command_channel(
+            self,
+            command_name: str,
+            channel_id: int
+    ) -> bool:
+        index = await self._index()
+        return index.channels.has_command(channel_id, command_name)
+
+    async def get_user_perm(
+            self,
+            user_id: int,
+            cog_name: str
+    ) -> Optional[int]:
+        return (await self._index()).users.perm(user_id, cog_name)
+
+    async def get_channel_perm(
+            self,
+            channel_id: int,
+            cog_name: str
+    ) -> Optional[int]:
+        return (await self._index()).channels.perm(channel_id, cog_name)
+
+    async def get_webhook(
+            self,
+            channel_id: int,
+            cog_name: str
+    ) -> Optional[Tuple[int, Optional[str], Optional[str]]]:
+        return await self._fetchone("select_webhook", (channel_id, cog_name))
+
+    async def set_webhook(
+            self,
+            channel_id: int,
+            cog_name: str,
+            webhook_id: int,
+            token: Optional[str],
+            url: Optional[str]
+    ) -> None:
+        sql = self._script("insert_webhook")
+        await self._write(lambda cursor: cursor.execute(
+            sql,
+            (channel_id, cog_name, webhook_id, token, url)
+        ))
+
+    async def delete_webhook(self, channel_id: int, cog_name: str) -> None:
+        sql = self._script("delete_webhook")
+        await self._write(
+            lambda cursor: cursor.execute(sql, (channel_id, cog_name))
+        )
+
+    async def get_state(self, server_name: str) -> int:
+        return (await self._fetchone("select_server_state", (server_name,)))[0]
+
+    async def update_state(self, server_name: str, state: int) -> None:
+        sql = self._script("update_server_state")
+        await self._write(
+            lambda cursor: cursor.execute(sql, (state, server_name))
+        )
+
+    async def insert_admin(self, user_id: int) -> None:
+        sql = self._script("insert_admin")
+        await self._write(lambda cursor: cursor.execute(sql, (user_id,)))
+        if (self.permissions.loaded):
+            self.permissions.admins.add(user_id)
+
+    async def permit_user_commands(
+            self,
+            user_id: int,
+            cog_name: str,
+            command_names: Sequence[str]
+    ) -> bool:
+        return bool(await self._permit_many(
+            "user",
+            (user_id,),
+            {cog_name: command_names}
+        ))
+
+    async def permit_channel_commands(
+            self,
+            channel_id: int,
+            cog_name: str,
+            command_names: Sequence[str]
+    ) -> bool:
+        return bool(await self._permit_many(
+            "channel",
+            (channel_id,),
+            {cog_name: command_names}
+        ))
+
+    async def set_user_perm(
+            self,
+            user_id: int,
+            cog_name: str,
+            permission: int
+    ) -> bool:
+        return bool(await self._set_perms(
+            "user",
+            (user_id,),
+            (cog_name,),
+            permission
+        ))
+
+    async def set_channel_perm(
+            self,
+            channel_id: int,
+            cog_name: str,
+            permission: int
+    ) -> bool:
+        return bool(await self._set_perms(
+            "channel",
+            (channel_id,),
+            (cog_name,),
+            permission
+        ))
+
+    def _insert_principals(
+            self,
+            cursor: sqlite3.Cursor,
+            table: str,
+            principal_ids: Sequence[int]
+    ) -> Tuple[int, ...]:
+        sql = self._script(f"select_{table}")
+        new_ids = tuple(
+            principal_id for principal_id in principal_ids
+            if cursor.execute(sql, (principal_id,)).fetchone() is None
+        )
+        cursor.executemany(
+            self._script(f"insert_{table}"),
+            [(principal_id,) for principal_id in new_ids]
+        )
+        return new_ids
+
+    async def _permit_many(
+            self,
+            table: str,
+            principal_ids: Sequence[int],
+            grants: Mapping[str, Sequence[str]]
+    ) -> Tuple[int, ...]:
+        def write(cursor: sqlite3.Cursor) -> Tuple[int, ...]:
+            keys = [
+                (
+                    self.cog_keys.key(cursor, cog_name),
+                    [
+                        self.command_keys.key(cursor, name)
+                        for name in command_names
+                    ]
+                )
+                for cog_name, command_names in grants.items()
+            ]
+            new_ids = self._insert_principals(cursor, table, principal_ids)
+            cursor.executemany(
+                self._script(f"insert_{table}_command"),
+                [
+                    (principal_id, command_id, cog_id)
+                    for principal_id in principal_ids
+                    for cog_id, command_ids in keys
+                    for command_id in command_ids
+                ]
+            )
+            cursor.executemany(
+                self._script(f"insert_{table}_cog"),
+                [
+                    (principal_id, cog_id)
+                    for principal_id in principal_ids
+                    for cog_id, _ in keys
+                ]
+            )
+            return new_ids
+
+        new_ids = await self._write(write)
+        if (self.permissions.loaded):
+            index = getattr(self.permissions, f"{table}s")
+            for principal_id in principal_ids:
+                for cog_name, command_names in grants.items():
+                    index.grant(principal_id, cog_name, command_names)
+
+        return new_ids
+
+    async def permit_users_commands(
+            self,
+            user_ids: Sequence[int],
+            grants: Mapping[str, Sequence[str]]
+    ) -> Tuple[int, ...]:
+        return await self._permit_many("user", user_ids, grants)
+
+    async def permit_channels_commands(
+            self,
+            channel_ids: Sequence[int],
+            grants: Mapping[str, Sequence[str]]
+    ) -> Tuple[int, ...]:
+        return await self._permit_many("channel", channel_ids, grants)
+
+    async def _set_perms(
+            self,
+            table: str,
+            principal_ids: Sequence[int],
+            cog_names: Sequence[str],
+            permission: int
+    ) -> Tuple[int, ...]:
+        def write(cursor: sqlite3.Cursor) -> Tuple[int, ...]:
+            cog_ids = [
+                self.cog_keys.key(cursor, cog_name) for cog_name in cog_names
+            ]
+            new_ids = self._insert_principals(cursor, table, principal_ids)
+            cursor.executemany(
+                self._script(f"insert_{table}_perm"),
+                [
+                    (principal_id, cog_id, permission)
+                    for principal_id in principal_ids
+                    for cog_id in cog_ids
+                ]
+            )
+            return new_ids
+
+        new_ids = await self._write(write)
+        if (self.permissions.loaded):
+            index = getattr(self.permissions, f"{table}s")
+            for principal_id in principal_ids:
+                for cog_name in cog_names:
+                    index.set_perm(principal_id, cog_name, permission)
+
+        return new_ids
+
+    async def set_users_perm(
+            self,
+            user_ids: Sequence[int],
+            cog_names: Sequence[str],
+            permission: int
+    ) -> Tuple[int, ...]:
+        return await self._set_perms("user", user_ids, cog_names, permission)
+
+    async def set_channels_perm(
+            self,
+            channel_ids: Sequence[int],
+            cog_names: Sequence[str],
+            permission: int
+    ) -> Tuple[int, ...]:
+        return await self._set_perms(
+            "channel",
+            channel_ids,
+            cog_names,
+            permission
+        )
+
+    async def remove_user_perm(self, user_id: int, cog_name: str) -> None:
+        sql = self._script("delete_user_cog_perm")
+        await self._write(lambda cursor: cursor.execute(
+            sql,
+            (user_id, self.cog_keys.key(cursor, cog_name))
+        ))
+        if (self.permissions.loaded):
+            self.permissions.users.remove_perm(user_id, cog_name)
+
+    async def remove_channel_perm(
+            self,
+            channel_id: int,
+            cog_name: str
+    ) -> None:
+        sql = self._script("delete_channel_cog_perm")
+        await self._write(lambda cursor: cursor.execute(
+            sql,
+            (channel_id, self.cog_keys.key(cursor, cog_name))
+        ))
+        if (self.permissions.loaded):
+            self.permissions.channels.remove_perm(channel_id, cog_name)
+
+    async def delete_user(self, user_id: int) -> None:
+        sql = self._script("delete_user")
+        await self._write(lambda cursor: cursor.execute(sql, (user_id,)))
+        if (self.permissions.loaded):
+            self.permissions.users.discard(user_id)
+
+    async def delete_channel(
+            self,
+            channel_id: int
+    ) -> Tuple[WebhookRecord, ...]:
+        def write(cursor: sqlite3.Cursor) -> Tuple[WebhookRecord, ...]:
+            webhooks = self._channel_webhooks(cursor, (channel_id,))
+            cursor.execute(self._script("delete_channel"), (channel_id,))
+            return tuple(webhooks[channel_id])
+
+        webhooks = await self._write(write)
+        if (self.permissions.loaded):
+            self.permissions.channels.discard(channel_id)
+
+        return webhooks
+
+    async def delete_cog(self, cog_name: str) -> None:
+        sql = self._script("delete_cog")
+        await self._write(lambda cursor: cursor.execute(sql, (cog_name,)))
+        self.invalidate()
+
+    async def delete_server(self, server_name: str) -> None:
+        sql = self._script("delete_server")
+        await self._write(lambda cursor: cursor.execute(sql, (server_name,)))
+
+    def _delete_command_grants(
+            self,
+            cursor: sqlite3.Cursor,
+            table: str,
+            principal_id: int,
+            command_names: Sequence[str]
+    ) -> None:
+        cursor.execute(
+            self._script(f"select_{table}_command_names"),
+            (principal_id,)
+        )
+        tree = CommandTree(record[0] for record in cursor.fetchall())
+        for command_name in command_names:
+            tree.remove(command_name)
+
+        pruned = [
+            parent_name
+            for command_name in command_names
+            for parent_name in tree.prunable(command_name)
+        ]
+        cursor.executemany(
+            self._script(f"delete_{table}_command"),
+            [
+                (principal_id, self.command_keys.key(cursor, name))
+                for name in (*command_names, *pruned)
+            ]
+        )
+
+    async def delete_user_command(
+            self,
+            user_id: int,
+            command_name: str
+    ) -> None:
+        def write(cursor: sqlite3.Cursor) -> PrincipalRecords:
+            self._delete_command_grants(
+                cursor,
+                "user",
+                user_id,
+                (command_name,)
+            )
+            return self._principal_records(cursor, "user", user_id)
+
+        records = await self._write(write)
+        if (self.permissions.loaded):
+            self.permissions.users.replace(user_id, *records)
+
+    async def delete_channel_command(
+            self,
+            channel_id: int,
+            command_name: str
+    ) -> Tuple[WebhookRecord, ...]:
+        def write(
+                cursor: sqlite3.Cursor
+        ) -> Tuple[Tuple[WebhookRecord, ...], PrincipalRecords]:
+            webhooks = self._channel_webhooks(cursor, (channel_id,))
+            self._delete_command_grants(
+                cursor,
+                "channel",
+                channel_id,
+                (command_name,)
+            )
+            orphans = self._orphan_webhooks(cursor, webhooks)
+            return orphans, self._principal_records(
+                cursor,
+                "channel",
+                channel_id
+            )
+
+        orphans, records = await self._write(write)
+        if (self.permissions.loaded):
+            self.permissions.channels.replace(channel_id, *records)
+
+        return orphans
+
+    async def delete_user_cog(self, user_id: int, cog_name: str) -> None:
+        def write(cursor: sqlite3.Cursor) -> PrincipalRecords:
+            cursor.execute(
+                self._script("delete_user_cog"),
+                (user_id, self.cog_keys.key(cursor, cog_name))
+            )
+            return self._principal_records(cursor, "user", user_id)
+
+        records = await self._write(write)
+        if (self.permissions.loaded):
+            self.permissions.users.replace(user_id, *records)
+
+    async def delete_channel_cog(
+            self,
+            channel_id: int,
+            cog_name: str
+    ) -> Tuple[WebhookRecord, ...]:
+        def write(
+                cursor: sqlite3.Cursor
+        ) -> Tuple[Tuple[WebhookRecord, ...], PrincipalRecords]:
+            webhooks = self._channel_webhooks(cursor, (channel_id,))
+            cursor.execute(
+                self._script("delete_channel_cog"),
+                (channel_id, self.cog_keys.key(cursor, cog_name))
+            )
+            orphans = self._orphan_webhooks(cursor, webhooks)
+            return orphans, self._principal_records(
+                cursor,
+                "channel",
+                channel_id
+            )
+
+        orphans, records = await self._write(write)
+        if (self.permissions.loaded):
+            self.permissions.channels.replace(channel_id, *records)
+
+        return orphans
+
+    async def delete_command(
+            self,
+            command_name: str
+    ) -> Tuple[WebhookRecord, ...]:
+        def write(cursor: sqlite3.Cursor) -> Tuple[WebhookRecord, ...]:
+            cursor.execute(
+                self._script("select_command_descendants"),
+                (f"{command_name} ", f"{command_name}!")
+            )
+            command_names = [
+                command_name,
+                *(record[0] for record in cursor.fetchall())
+            ]
+            holders: Dict[str, Dict[int, List[str]]] = {}
+            for table in ("user", "channel"):
+                holders[table] = {}
+                for name in command_names:
+                    cursor.execute(
+                        self._script(f"select_command_{table}s"),
+                        (name,)
+                    )
+                    for record in cursor.fetchall():
+                        holders[table].setdefault(record[0], []).append(name)
+
+            webhooks = self._channel_webhooks(cursor, list(holders["channel"]))
+            for table, principals in holders.items():
+                for principal_id, names in principals.items():
+                    self._delete_command_grants(
+                        cursor,
+                        table,
+                        principal_id,
+                        names
+                    )
+
+            cursor.executemany(
+                self._script("delete_command"),
+                [(name,) for name in command_names]
+            )
+            return self._orphan_webhooks(cursor, webhooks)
+
+        orphans = await self._write(write)
+        self.invalidate()
+        return orphans
@@ -0,0 +1,203 @@
+import os
+import csv
+import json
+import asyncio
+import tempfile
+import contextlib
+import discord
+from typing import Any, Dict, Final, Iterable, List, Optional, Tuple
+from discord.ext import commands
+from lib.config import Config
+from lib.database import RecordStream
+from lib.templates import Template
+
+ATTACH_ROWS: Final[int] = 250
+CONCURRENCY: Final[int] = 8
+FORMATS: Final[Tuple[str, ...]] = ("csv", "json")
+
+Row = Tuple[Any, ...]
+
+
+class Converter:
+    def columns(self, columns: Tuple[str, ...]) -> Tuple[str, ...]:
+        return columns
+
+    async def __call__(self, rows: List[Row]) -> List[Row]:
+        return rows
+
+
+class Names:
+    def __init__(
+            self,
+            bot: commands.Bot,
+            concurrency: int = CONCURRENCY
+    ) -> None:
+        self.bot = bot
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._names: Dict[Tuple[str, int], str] = {}
+
+    async def _resolve(self, kind: str, object_id: int) -> None:
+        async with self._semaphore:
+            try:
+                if (kind == "user"):
+                    user = await self.bot.resolver.user(object_id)
+                    name = user.name
+                else:
+                    channel = await self.bot.resolver.channel(object_id)
+                    name = '#' + channel.name
+            except discord.HTTPException:
+                name = str(object_id)
+
+        self._names[(kind, object_id)] = name
+
+    async def resolve(self, kind: str, object_ids: Iterable[int]) -> None:
+        missing = {
+            object_id for object_id in object_ids
+            if (kind, object_id) not in self._names
+        }
+        await asyncio.gather(*(
+            self._resolve(kind, object_id) for object_id in missing
+        ))
+
+    def name(self, kind: str, object_id: int) -> str:
+        return self._names[(kind, object_id)]
+
+    def users(self, keep_id: bool = False) -> "NameConverter":
+        return NameConverter(self, "user", keep_id)
+
+    def channels(self, keep_id: bool = False) -> "NameConverter":
+        return NameConverter(self, "channel", keep_id)
+
+
+class NameConverter(Converter):
+    def __init__(self, names: Names, kind: str, keep_id: bool) -> None:
+        self.names = names
+        self.kind = kind
+        self.keep_id = keep_id
+
+    def columns(self, columns: Tuple[str, ...]) -> Tuple[str, ...]:
+        if (self.keep_id):
+            return ("name", *columns)
+
+        return (self.kind, *columns[1:])
+
+    async def __call__(self, rows: List[Row]) -> List[Row]:
+        await self.names.resolve(self.kind, (row[0] for row in rows))
+        if (self.keep_id):
+            return [
+                (self.names.name(self.kind, row[0]), *row) for row in rows
+            ]
+
+        return [
+            (self.names.name(self.kind, row[0]), *row[1:]) for row in rows
+        ]
+
+
+class _Attachment:
+    def __init__(self, file_format: str, columns: Tuple[str, ...]) -> None:
+        if (file_format not in FORMATS):
+            raise ValueError(
+                f"Invalid export format {file_format}, "
+                f"expected one of {', '.join(FORMATS)}."
+            )
+
+        self.format = file_format
+        self.columns = columns
+        self.file = tempfile.TemporaryFile(
+            "w+",
+            encoding="utf-8",
+            newline=""
+        )
+        self._first = True
+        if (file_format == "csv"):
+            self._writer = csv.writer(self.file)
+            self._writer.writerow(columns)
+        else:
+            self.file.write("[")
+
+    def write(self, rows: List[Row]) -> None:
+        if (self.format == "csv"):
+            self._writer.writerows(rows)
+            return
+
+        for row in rows:
+            self.file.write(("\n" if self._first else ",\n") + json.dumps(
+                dict(zip(self.columns, row)),
+                default=str
+            ))
+            self._first = False
+
+    def discord_file(self, name: str) -> discord.File:
+        if (self.format == "json"):
+            self.file.write("\n]\n")
+
+        self.file.flush()
+        self.file.seek(0)
+        return discord.File(self.file.buffer, f"{name}.{self.format}")
+
+    def close(self) -> None:
+        self.file.close()
+
+
+async def _send_pages(
+        ctx: commands.Context,
+        rows: List[Row],
+        limit: int
+) -> None:
+    paginator = commands.Paginator(prefix=None, suffix=None, max_size=limit)
+    for row in rows:
+        paginator.add_line(str(row)[:limit - 2])
+
+    for page in paginator.pages:
+        await ctx.send(page)
+
+
+async def send_records(
+        ctx: commands.Context,
+        name: str,
+        stream: RecordStream,
+        converter: Optional[Converter] = None
+) -> int:
+    config = Config.load(os.environ["BOT_CONFIG"])
+    constants = Template.load(os.environ["BOT_CONSTANTS"])
+    limit = int(config.settings.message_limit)
+    attach_rows = int(config.export.attach_rows)
+    if (converter is None):
+        converter = Converter()
+
+    rows: List[Row] = []
+    count = 0
+    attachment: Optional[_Attachment] = None
+    try:
+        async with contextlib.aclosing(stream.chunks()) as chunks:
+            async for chunk in chunks:
+                converted = await converter(chunk)
+                count += len(converted)
+                if (attachment is None and count <= attach_rows):
+                    rows.extend(converted)
+                    continue
+
+                if (attachment is None):
+                    attachment = _Attachment(
+                        config.export.format,
+                        converter.columns(stream.columns)
+                    )
+                    attachment.write(rows)
+                    rows = []
+
+                attachment.write(converted)
+
+        if (attachment is not None):
+            await ctx.send(
+                constants.messages.exported.format(rows=count),
+                file=attachment.discord_file(name)
+            )
+        elif (rows):
+            await _send_pages(ctx, rows, limit)
+        else:
+            await ctx.send(constants.messages.no_records)
+    finally:
+        if (attachment is not None):
+            attachment.close()
+
+    return count
@@ -0,0 +1,137 @@
+import ast
+import time
+import asyncio
+import pathlib
+from typing import Dict, Final, List, Optional, Set, Tuple
+from discord.ext import commands
+
+DEPENDENCIES: Final[Dict[str, Tuple[str, ...]]] = {
+    "lib.basecog": ("cogs._db-base",),
+    "lib.orderedcog": ("cogs._db-base", "cogs._db-ordered"),
+    "lib.servercog": (
+        "cogs._db-base",
+        "cogs._db-ordered",
+        "cogs._db-server"
+    ),
+}
+
+Result = Tuple[float, Optional[Exception]]
+
+
+class ExtensionLoader:
+    def __init__(self, bot: commands.Bot, ext_dir: pathlib.Path) -> None:
+        self.bot = bot
+        self.ext_dir = ext_dir
+        self.results: Dict[str, Result] = {}
+        self.elapsed = 0.0
+
+    @staticmethod
+    def extension_name(file: pathlib.Path) -> str:
+        return ".".join(file.with_suffix("").parts)
+
+    @staticmethod
+    def extension_file(name: str) -> pathlib.Path:
+        return pathlib.Path(*name.split(".")).with_suffix(".py")
+
+    def dependencies(self, file: pathlib.Path) -> Set[str]:
+        name = self.extension_name(file)
+        tree = ast.parse(file.read_text(), str(file))
+        imported: Set[str] = set()
+        for node in ast.walk(tree):
+            if (isinstance(node, ast.ImportFrom) and node.module):
+                imported.add(node.module)
+            elif (isinstance(node, ast.Import)):
+                imported.update(alias.name for alias in node.names)
+
+        dependencies: Set[str] = set()
+        for module in imported:
+            dependencies.update(DEPENDENCIES.get(module, ()))
+            if (module.startswith(f"{self.ext_dir.name}.")):
+                dependencies.add(module)
+
+        dependencies.discard(name)
+        return dependencies
+
+    def graph(self) -> Dict[str, Set[str]]:
+        graph: Dict[str, Set[str]] = {}
+        pending = [
+            file for file in self.ext_dir.rglob("*.py")
+            if not file.stem.startswith("_")
+        ]
+        while (pending):
+            file = pending.pop()
+            name = self.extension_name(file)
+            if (name in graph):
+                continue
+
+            try:
+                graph[name] = self.dependencies(file)
+            except (OSError, SyntaxError) as e:
+                print(f"Failed to read dependencies of {file}: {e}")
+                graph[name] = set()
+                continue
+
+            for dependency in graph[name]:
+                dependency_file = self.extension_file(dependency)
+                if (dependency not in graph and dependency_file.exists()):
+                    pending.append(dependency_file)
+
+        for name in graph:
+            graph[name] &= graph.keys()
+
+        return graph
+
+    @staticmethod
+    def levels(graph: Dict[str, Set[str]]) -> List[List[str]]:
+        remaining = {name: set(deps) for name, deps in graph.items()}
+        levels: List[List[str]] = []
+        while (remaining):
+            ready = sorted(
+                name for name, deps in remaining.items() if not deps
+            )
+            if (not ready):
+                print(f"Dependency cycle between extensions: "
+                      f"{sorted(remaining)}")
+                ready = sorted(remaining)
+
+            levels.append(ready)
+            for name in ready:
+                del remaining[name]
+
+            for deps in remaining.values():
+                deps.difference_update(ready)
+
+        return levels
+
+    async def _load(self, name: str) -> None:
+        start = time.perf_counter()
+        error: Optional[Exception] = None
+        try:
+            await self.bot.load_extension(name)
+        except commands.ExtensionAlreadyLoaded:
+            pass
+        except commands.ExtensionError as e:
+            error = e
+
+        self.results[name] = (time.perf_counter() - start, error)
+
+    async def load_all(self) -> Dict[str, Result]:
+        start = time.perf_counter()
+        for level in self.levels(self.graph()):
+            await asyncio.gather(*(self._load(name) for name in level))
+
+        self.elapsed = time.perf_counter() - start
+        return self.results
+
+    def report(self) -> str:
+        lines = [f"Loaded {len(self.results)} extensions in "
+                 f"{self.elapsed:.3f}s:"]
+        for name, (duration, error) in sorted(
+                self.results.items(),
+                key=lambda item: item[1][0],
+                reverse=True
+        ):
+            status = "ok" if error is None else f"failed ({error})"
+            lines.append(f"  {duration:8.3f}s  {name}  {status}")
+
+        return "\n".join(lines)
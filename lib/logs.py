@@ -0,0 +1,173 @@
+import os
+import sys
+import gzip
+import time
+import queue
+import shutil
+import logging
+import logging.handlers
+from typing import Final, List
+
+COMMANDS_LOGGER: Final[str] = "bot.commands"
+ERRORS_LOGGER: Final[str] = "bot.errors"
+LOG_FORMAT: Final[str] = "[%(asctime)s] %(message)s"
+MAX_BYTES: Final[int] = 10 * 1024 * 1024
+ROTATE_SECONDS: Final[float] = 24 * 60 * 60.0
+BACKUPS: Final[int] = 5
+FLUSH_SECONDS: Final[float] = 1.0
+BATCH_RECORDS: Final[int] = 256
+
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    with open(source, "rb") as log, gzip.open(dest, "wb") as archive:
+        shutil.copyfileobj(log, archive)
+
+    os.remove(source)
+
+
+class RotatingLogHandler(logging.handlers.RotatingFileHandler):
+    def __init__(
+            self,
+            filename: str,
+            max_bytes: int = MAX_BYTES,
+            rotate_seconds: float = ROTATE_SECONDS,
+            backups: int = BACKUPS,
+            batch: int = BATCH_RECORDS
+    ) -> None:
+        os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+        super().__init__(
+            filename,
+            maxBytes=max_bytes,
+            backupCount=max(backups, 1),
+            encoding="utf-8",
+            delay=True
+        )
+        self.rotate_seconds = rotate_seconds
+        self.batch = batch
+        self.rollover_at = time.time() + rotate_seconds
+        self.namer = lambda name: name + ".gz"
+        self.rotator = _gzip_rotator
+        self._size = 0
+        self._pending = 0
+
+    def _rollover_due(self, size: int) -> bool:
+        if (not self._size):
+            return False
+
+        if (self.rotate_seconds and time.time() >= self.rollover_at):
+            return True
+
+        return self.maxBytes > 0 and self._size + size > self.maxBytes
+
+    def doRollover(self) -> None:
+        self.flush()
+        super().doRollover()
+        self._size = 0
+        self.rollover_at = time.time() + self.rotate_seconds
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            message = self.format(record) + self.terminator
+            size = len(message.encode("utf-8"))
+            if (self.stream is None):
+                self.stream = self._open()
+                self._size = os.fstat(self.stream.fileno()).st_size
+
+            if (self._rollover_due(size)):
+                self.doRollover()
+                self.stream = self._open()
+
+            self.stream.write(message)
+            self._size += size
+            self._pending += 1
+            if (self._pending >= self.batch):
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        self._pending = 0
+        super().flush()
+
+
+class LogListener(logging.handlers.QueueListener):
+    def __init__(
+            self,
+            log_queue: queue.SimpleQueue,
+            flush_interval: float = FLUSH_SECONDS
+    ) -> None:
+        super().__init__(log_queue, respect_handler_level=True)
+        self.flush_interval = flush_interval
+
+    def flush(self) -> None:
+        for handler in self.handlers:
+            handler.flush()
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            pass
+
+        try:
+            return self.queue.get(timeout=self.flush_interval)
+        except queue.Empty:
+            self.flush()
+
+        return self.queue.get(block)
+
+
+class LogPipeline:
+    def __init__(self, flush_interval: float = FLUSH_SECONDS) -> None:
+        self.queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.listener = LogListener(self.queue, flush_interval)
+        self._handlers: List[logging.Handler] = []
+
+    def handler(
+            self,
+            name: str,
+            filename: str,
+            console: bool = False,
+            **rotation: float
+    ) -> logging.handlers.QueueHandler:
+        targets: List[logging.Handler] = [
+            RotatingLogHandler(filename, **rotation)
+        ]
+        if (console):
+            targets.append(logging.StreamHandler(sys.stdout))
+
+        for target in targets:
+            target.addFilter(logging.Filter(name))
+            target.setFormatter(logging.Formatter("%(message)s"))
+
+        self._handlers.extend(targets)
+        self.listener.handlers = tuple(self._handlers)
+        return logging.handlers.QueueHandler(self.queue)
+
+    def logger(
+            self,
+            name: str,
+            filename: str,
+            console: bool = True,
+            level: int = logging.INFO,
+            **rotation: float
+    ) -> logging.Logger:
+        queue_handler = self.handler(name, filename, console, **rotation)
+        queue_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        logger = logging.getLogger(name)
+        logger.addHandler(queue_handler)
+        logger.setLevel(level)
+        logger.propagate = False
+        return logger
+
+    def start(self) -> None:
+        if (self.listener._thread is None):
+            self.listener.start()
+
+    def stop(self) -> None:
+        if (self.listener._thread is not None):
+            self.listener.stop()
+
+        for handler in self._handlers:
+            handler.close()
+
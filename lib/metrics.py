@@ -0,0 +1,304 @@
+import time
+import bisect
+import asyncio
+import functools
+import contextlib
+from collections import defaultdict
+from typing import (Any, Awaitable, Callable, DefaultDict, Dict, Final,
+                    Iterator, List, Optional, Tuple, TypeVar)
+
+PREFIX: Final[str] = "bot_"
+BUCKETS: Final[Tuple[float, ...]] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+CONTENT_TYPE: Final[str] = "text/plain; version=0.0.4; charset=utf-8"
+REQUEST_TIMEOUT: Final[float] = 5.0
+HEALTH_LAG_SECONDS: Final[float] = 5.0
+
+T = TypeVar("T")
+Labels = Tuple[Tuple[str, str], ...]
+Key = Tuple[str, Labels]
+
+
+class Histogram:
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(BUCKETS, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        if (not self.count):
+            return 0.0
+
+        rank = q * self.count
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            if (cumulative + count >= rank and count):
+                if (index == len(BUCKETS)):
+                    return BUCKETS[-1]
+
+                lower = BUCKETS[index - 1] if index else 0.0
+                fraction = (rank - cumulative) / count
+                return lower + (BUCKETS[index] - lower) * fraction
+
+            cumulative += count
+
+        return BUCKETS[-1]
+
+
+def _labels(labels: Dict[str, Any]) -> Labels:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return (value.replace("\\", "\\\\").replace("\n", "\\n")
+            .replace('"', '\\"'))
+
+
+def _format_labels(labels: Labels, *extra: Tuple[str, str]) -> str:
+    pairs = [*labels, *extra]
+    if (not pairs):
+        return ""
+
+    return "{" + ",".join(
+        f'{name}="{_escape(value)}"' for name, value in pairs
+    ) + "}"
+
+
+def _title(name: str, labels: Labels) -> str:
+    if (not labels):
+        return name
+
+    return f"{name}[{','.join(value for _, value in labels)}]"
+
+
+def _format_value(value: float) -> str:
+    if (float(value).is_integer()):
+        return str(int(value))
+
+    return repr(float(value))
+
+
+class Metrics:
+    def __init__(self) -> None:
+        self.started = time.time()
+        self.counters: DefaultDict[Key, float] = defaultdict(float)
+        self.gauges: Dict[Key, float] = {}
+        self.histograms: Dict[Key, Histogram] = {}
+        self.collectors: Dict[str, Callable[[], float]] = {}
+
+    def inc(self, name: str, value: float = 1.0, **labels: Any) -> None:
+        self.counters[(name, _labels(labels))] += value
+
+    def set(self, name: str, value: float, **labels: Any) -> None:
+        self.gauges[(name, _labels(labels))] = value
+
+    def observe(self, name: str, seconds: float, **labels: Any) -> None:
+        key = (name, _labels(labels))
+        histogram = self.histograms.get(key)
+        if (histogram is None):
+            histogram = self.histograms[key] = Histogram()
+
+        histogram.observe(seconds)
+
+    def collect(self, name: str, function: Callable[[], float]) -> None:
+        self.collectors[name] = function
+
+    def discard(self, name: str) -> None:
+        self.collectors.pop(name, None)
+
+    @contextlib.contextmanager
+    def timer(self, name: str, **labels: Any) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def collected(self) -> Dict[Key, float]:
+        gauges = dict(self.gauges)
+        gauges[("uptime_seconds", ())] = time.time() - self.started
+        for name, function in list(self.collectors.items()):
+            try:
+                gauges[(name, ())] = float(function())
+            except Exception:
+                continue
+
+        return gauges
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for kind, values in (
+                ("counter", self.counters),
+                ("gauge", self.collected())
+        ):
+            seen = set()
+            for (name, labels), value in sorted(values.items()):
+                if (name not in seen):
+                    lines.append(f"# TYPE {PREFIX}{name} {kind}")
+                    seen.add(name)
+
+                lines.append(f"{PREFIX}{name}{_format_labels(labels)} "
+                             f"{_format_value(value)}")
+
+        seen = set()
+        for (name, labels), histogram in sorted(
+                self.histograms.items(),
+                key=lambda item: item[0]
+        ):
+            if (name not in seen):
+                lines.append(f"# TYPE {PREFIX}{name} histogram")
+                seen.add(name)
+
+            cumulative = 0
+            for bound, count in zip(BUCKETS, histogram.counts):
+                cumulative += count
+                lines.append(
+                    f"{PREFIX}{name}_bucket"
+                    f"{_format_labels(labels, ('le', str(bound)))} "
+                    f"{cumulative}"
+                )
+
+            lines.append(f"{PREFIX}{name}_bucket"
+                         f"{_format_labels(labels, ('le', '+Inf'))} "
+                         f"{histogram.count}")
+            lines.append(f"{PREFIX}{name}_sum{_format_labels(labels)} "
+                         f"{_format_value(histogram.total)}")
+            lines.append(f"{PREFIX}{name}_count{_format_labels(labels)} "
+                         f"{histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+    def summary(self, limit: int = 15) -> List[str]:
+        lines = ["name                                  count     p50      "
+                 "p99     mean"]
+        for (name, labels), histogram in sorted(
+                self.histograms.items(),
+                key=lambda item: item[1].total,
+                reverse=True
+        )[:limit]:
+            lines.append(
+                f"{_title(name, labels)[:36]:<36} {histogram.count:>7} "
+                f"{histogram.quantile(0.5) * 1000:>6.1f}ms "
+                f"{histogram.quantile(0.99) * 1000:>6.1f}ms "
+                f"{histogram.total / histogram.count * 1000:>6.1f}ms"
+            )
+
+        lines.append("")
+        for (name, labels), value in sorted(self.counters.items()):
+            lines.append(f"{_title(name, labels)[:56]:<56} "
+                         f"{_format_value(value):>8}")
+
+        lines.append("")
+        for (name, labels), value in sorted(self.collected().items()):
+            lines.append(f"{_title(name, labels)[:48]:<48} {value:>16.4f}")
+
+        return lines
+
+
+metrics = Metrics()
+
+
+def timed(
+        name: str,
+        **labels: Any
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    def decorator(
+            function: Callable[..., Awaitable[T]]
+    ) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(function)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            with metrics.timer(name, method=function.__name__, **labels):
+                return await function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+async def create_subprocess_exec(
+        program: str,
+        *args: Any,
+        **kwargs: Any
+) -> asyncio.subprocess.Process:
+    name = program.rsplit("/", 1)[-1]
+    metrics.inc("subprocesses_total", program=name)
+    with metrics.timer("subprocess_spawn_seconds", program=name):
+        return await asyncio.create_subprocess_exec(program, *args, **kwargs)
+
+
+class MetricsServer:
+    def __init__(
+            self,
+            health: Callable[[], bool],
+            host: str,
+            port: int
+    ) -> None:
+        self.health = health
+        self.host = host
+        self.port = port
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(
+            self._handle,
+            self.host,
+            self.port
+        )
+
+    def close(self) -> None:
+        if (self._server is not None):
+            self._server.close()
+            self._server = None
+
+    def _response(self, path: str) -> Tuple[str, str, str]:
+        match path:
+            case "/metrics":
+                return "200 OK", CONTENT_TYPE, metrics.render()
+            case "/health":
+                if (self.health()):
+                    return "200 OK", "text/plain", "ok\n"
+
+                return "503 Service Unavailable", "text/plain", "unhealthy\n"
+            case _:
+                return "404 Not Found", "text/plain", "not found\n"
+
+    async def _handle(
+            self,
+            reader: asyncio.StreamReader,
+            writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            request = await asyncio.wait_for(
+                reader.readline(),
+                REQUEST_TIMEOUT
+            )
+            while (await asyncio.wait_for(
+                    reader.readline(),
+                    REQUEST_TIMEOUT
+            ) not in (b"\r\n", b"\n", b"")):
+                pass
+
+            parts = request.decode("latin-1").split()
+            path = parts[1].split("?")[0] if len(parts) > 1 else ""
+            status, content_type, body = self._response(path)
+            payload = body.encode("utf-8")
+            writer.write(
+                f"HTTP/1.1 {status}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                f"Connection: close\r\n\r\n".encode("latin-1") + payload
+            )
+            await writer.drain()
+        except (OSError, asyncio.TimeoutError):
+            pass
+        finally:
+            writer.close()
@@ -1,91 +1,24 @@
 import os
-import sys
-import sqlite3
-import discord
 from typing import Callable, Optional
 from discord.ext import commands
 from lib.basecog import BaseCog
-from lib.config import Config
+from lib.templates import Template
+from lib.metrics import timed
 
 
 class OrderedCog(BaseCog):
     instances = 0
 
-    def __init__(self, bot: commands.Bot) -> None:
-        super().__init__(bot)
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        with (
-            open(f"{sql_dir}/create_user_perms.sql", "r")
-            as sql_create_user_perms,
-            open(f"{sql_dir}/create_channel_perms.sql", "r")
-            as sql_create_channel_perms,
-        ):
-            create_user_perms_table = sql_create_user_perms.read()
-            create_channel_perms_table = sql_create_channel_perms.read()
-
-        db_path = os.environ["BOT_DB"]
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        db.execute("PRAGMA FOREIGN_KEYS = ON")
-        cursor = db.cursor()
-        try:
-            cursor.execute(create_user_perms_table)
-            cursor.execute(create_channel_perms_table)
-        except Exception as e:
-            exc_type, exc_obj, exc_tb = sys.exc_info()
-            fname = os.path.split(exc_tb.tb_frame.f_code.co_filename)[1]
-            print(exc_type, fname, exc_tb.tb_lineno)
-
-        db.commit()
-        db.close()
-
+    @timed("db_seconds")
     async def get_user_perm(self, user_id: int) -> Optional[int]:
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        with (
-            open(f"{sql_dir}/select_user_perm.sql", "r")
-                as sql_select_user_perm,
-        ):
-            fetch_user_perm = sql_select_user_perm.read()
-
-        db_path = os.environ["BOT_DB"]
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        db.execute("PRAGMA FOREIGN_KEYS = ON")
-        cursor = db.cursor()
-        cursor.execute(
-            fetch_user_perm,
-            (user_id, self.qualified_name)
-        )
-        user_perm = cursor.fetchone()
-        db.close()
-        if (user_perm is None):
-            return user_perm
-        else:
-            return user_perm[0]
+        return await self.bot.db.get_user_perm(user_id, self.qualified_name)
 
+    @timed("db_seconds")
     async def get_channel_perm(self, channel_id: int) -> Optional[int]:
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        with (
-            open(f"{sql_dir}/select_channel_perm.sql", "r")
-                as sql_select_channel_perm,
-        ):
-            fetch_channel_perm = sql_select_channel_perm.read()
-
-        db_path = os.environ["BOT_DB"]
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        db.execute("PRAGMA FOREIGN_KEYS = ON")
-        cursor = db.cursor()
-        cursor.execute(
-            fetch_channel_perm,
-            (channel_id, self.qualified_name)
+        return await self.bot.db.get_channel_perm(
+            channel_id,
+            self.qualified_name
         )
-        channel_perm = cursor.fetchone()
-        db.close()
-        if (channel_perm is None):
-            return channel_perm
-        else:
-            return channel_perm[0]
 
     class PermissionError(commands.CommandError):
         def __init__(self, message: str) -> None:
@@ -101,8 +34,7 @@ class OrderedCog(BaseCog):
 
         async def predicate(ctx: commands.Context) -> bool:
             cog = ctx.cog
-            admins = await cog.get_admins()
-            if (ctx.author.id in admins):
+            if (await ctx.bot.db.is_admin(ctx.author.id)):
                 return True
 
             cog_user_perm = await cog.get_user_perm(ctx.author.id)
@@ -138,7 +70,7 @@ class OrderedCog(BaseCog):
     ) -> None:
         match error:
             case self.PermissionError():
-                constants = Config.from_json(os.environ["BOT_CONSTANTS"])
+                constants = Template.load(os.environ["BOT_CONSTANTS"])
                 await ctx.send(constants.messages.no_permission)
             case _:
                 await super().cog_command_error(ctx, error)
@@ -0,0 +1,147 @@
+from collections import defaultdict
+from typing import DefaultDict, Dict, FrozenSet, Iterable, Optional, Set, Tuple
+
+
+class Principals:
+    def __init__(self) -> None:
+        self.version = 0
+        self.members: Set[int] = set()
+        self.commands: DefaultDict[str, Set[int]] = defaultdict(set)
+        self.cogs: DefaultDict[str, Set[int]] = defaultdict(set)
+        self.perms: Dict[Tuple[int, str], int] = {}
+        self._commands_of: DefaultDict[int, Set[str]] = defaultdict(set)
+        self._cogs_of: DefaultDict[int, Set[str]] = defaultdict(set)
+        self._perms_of: DefaultDict[int, Set[str]] = defaultdict(set)
+
+    def clear(self) -> None:
+        self.version += 1
+        self.members.clear()
+        self.commands.clear()
+        self.cogs.clear()
+        self.perms.clear()
+        self._commands_of.clear()
+        self._cogs_of.clear()
+        self._perms_of.clear()
+
+    def has_command(self, principal_id: int, command_name: str) -> bool:
+        holders = self.commands.get(command_name)
+        return holders is not None and principal_id in holders
+
+    def command_holders(self, command_name: str) -> FrozenSet[int]:
+        return frozenset(self.commands.get(command_name, ()))
+
+    def cog_holders(self, cog_name: str) -> FrozenSet[int]:
+        return frozenset(self.cogs.get(cog_name, ()))
+
+    def commands_of(self, principal_id: int) -> FrozenSet[str]:
+        return frozenset(self._commands_of.get(principal_id, ()))
+
+    def perm(self, principal_id: int, cog_name: str) -> Optional[int]:
+        return self.perms.get((principal_id, cog_name))
+
+    def add(self, principal_id: int) -> None:
+        self.version += 1
+        self.members.add(principal_id)
+
+    def _link_command(self, principal_id: int, command_name: str) -> None:
+        self.commands[command_name].add(principal_id)
+        self._commands_of[principal_id].add(command_name)
+
+    def _link_cog(self, principal_id: int, cog_name: str) -> None:
+        self.cogs[cog_name].add(principal_id)
+        self._cogs_of[principal_id].add(cog_name)
+
+    def grant(
+            self,
+            principal_id: int,
+            cog_name: str,
+            command_names: Iterable[str]
+    ) -> None:
+        self.version += 1
+        self.members.add(principal_id)
+        for command_name in command_names:
+            self._link_command(principal_id, command_name)
+
+        self._link_cog(principal_id, cog_name)
+
+    def set_perm(
+            self,
+            principal_id: int,
+            cog_name: str,
+            permission: int
+    ) -> None:
+        self.version += 1
+        self.members.add(principal_id)
+        self.perms[(principal_id, cog_name)] = permission
+        self._perms_of[principal_id].add(cog_name)
+
+    def remove_perm(self, principal_id: int, cog_name: str) -> None:
+        self.version += 1
+        self.perms.pop((principal_id, cog_name), None)
+        self._perms_of[principal_id].discard(cog_name)
+
+    def discard(self, principal_id: int) -> None:
+        self.version += 1
+        self.members.discard(principal_id)
+        for command_name in self._commands_of.pop(principal_id, ()):
+            self.commands[command_name].discard(principal_id)
+
+        for cog_name in self._cogs_of.pop(principal_id, ()):
+            self.cogs[cog_name].discard(principal_id)
+
+        for cog_name in self._perms_of.pop(principal_id, ()):
+            self.perms.pop((principal_id, cog_name), None)
+
+    def replace(
+            self,
+            principal_id: int,
+            member: bool,
+            command_names: Iterable[str],
+            cog_names: Iterable[str],
+            perms: Iterable[Tuple[str, int]]
+    ) -> None:
+        self.discard(principal_id)
+        if (not member):
+            return
+
+        self.members.add(principal_id)
+        for command_name in command_names:
+            self._link_command(principal_id, command_name)
+
+        for cog_name in cog_names:
+            self._link_cog(principal_id, cog_name)
+
+        for cog_name, permission in perms:
+            self.set_perm(principal_id, cog_name, permission)
+
+    def load(
+            self,
+            members: Iterable[int],
+            command_records: Iterable[Tuple[int, str]],
+            cog_records: Iterable[Tuple[int, str]],
+            perm_records: Iterable[Tuple[int, str, int]]
+    ) -> None:
+        self.clear()
+        self.members.update(members)
+        for principal_id, command_name in command_records:
+            self._link_command(principal_id, command_name)
+
+        for principal_id, cog_name in cog_records:
+            self._link_cog(principal_id, cog_name)
+
+        for principal_id, cog_name, permission in perm_records:
+            self.set_perm(principal_id, cog_name, permission)
+
+
+class PermissionIndex:
+    def __init__(self) -> None:
+        self.loaded = False
+        self.admins: Set[int] = set()
+        self.users = Principals()
+        self.channels = Principals()
+
+    def invalidate(self) -> None:
+        self.loaded = False
+        self.admins.clear()
+        self.users.clear()
+        self.channels.clear()
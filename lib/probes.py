@@ -0,0 +1,206 @@
+import os
+import socket
+import struct
+import asyncio
+import itertools
+from typing import Final, NamedTuple, Optional, Tuple
+
+ICMP_TIMEOUT: Final[float] = 1.0
+TCP_TIMEOUT: Final[float] = 3.0
+UDP_TIMEOUT: Final[float] = 3.0
+ICMP_ECHO_REQUEST: Final[int] = 8
+ICMP_ECHO_REPLY: Final[int] = 0
+ECHO_PORT: Final[int] = 7
+
+_sequence = itertools.count(1)
+
+
+class Probe(NamedTuple):
+    kind: str
+    host: str
+    port: Optional[int] = None
+    timeout: float = TCP_TIMEOUT
+
+    @classmethod
+    def icmp(cls, host: str, timeout: float = ICMP_TIMEOUT) -> 'Probe':
+        return cls("icmp", host, None, timeout)
+
+    @classmethod
+    def tcp(
+            cls,
+            host: str,
+            port: int,
+            timeout: float = TCP_TIMEOUT
+    ) -> 'Probe':
+        return cls("tcp", host, port, timeout)
+
+    @classmethod
+    def udp(
+            cls,
+            host: str,
+            port: int,
+            timeout: float = UDP_TIMEOUT
+    ) -> 'Probe':
+        return cls("udp", host, port, timeout)
+
+    async def check(self) -> bool:
+        match self.kind:
+            case "icmp":
+                return await ping(self.host, self.timeout)
+            case "tcp":
+                return await tcp_open(self.host, self.port, self.timeout)
+            case "udp":
+                return await udp_open(self.host, self.port, self.timeout)
+            case _:
+                raise ValueError(f"Unknown probe kind {self.kind}.")
+
+
+async def tcp_open(host: str, port: int, timeout: float) -> bool:
+    try:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port),
+            timeout
+        )
+    except (OSError, asyncio.TimeoutError):
+        return False
+
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+
+    return True
+
+
+class _UDPCheck(asyncio.DatagramProtocol):
+    def __init__(self) -> None:
+        self.result: asyncio.Future[bool] = (
+            asyncio.get_running_loop().create_future()
+        )
+
+    def _resolve(self, result: bool) -> None:
+        if (not self.result.done()):
+            self.result.set_result(result)
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]) -> None:
+        self._resolve(True)
+
+    def error_received(self, exc: Exception) -> None:
+        self._resolve(False)
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self._resolve(exc is None)
+
+
+async def udp_open(host: str, port: int, timeout: float) -> bool:
+    loop = asyncio.get_running_loop()
+    try:
+        transport, protocol = await loop.create_datagram_endpoint(
+            _UDPCheck,
+            remote_addr=(host, port)
+        )
+    except OSError:
+        return False
+
+    try:
+        transport.sendto(b"\x00")
+        return await asyncio.wait_for(protocol.result, timeout)
+    except asyncio.TimeoutError:
+        return True
+    finally:
+        transport.close()
+
+
+def _checksum(data: bytes) -> int:
+    if (len(data) % 2):
+        data += b"\x00"
+
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xffff)
+    total += total >> 16
+    return ~total & 0xffff
+
+
+def _echo_request(identifier: int, sequence: int) -> bytes:
+    payload = b"discord-server-cogs"
+    header = struct.pack("!BBHHH", ICMP_ECHO_REQUEST, 0, 0,
+                         identifier, sequence)
+    checksum = _checksum(header + payload)
+    header = struct.pack("!BBHHH", ICMP_ECHO_REQUEST, 0, checksum,
+                         identifier, sequence)
+    return header + payload
+
+
+def _icmp_socket() -> Optional[socket.socket]:
+    for sock_type in (socket.SOCK_DGRAM, socket.SOCK_RAW):
+        try:
+            sock = socket.socket(
+                socket.AF_INET,
+                sock_type,
+                socket.IPPROTO_ICMP
+            )
+        except (PermissionError, OSError):
+            continue
+
+        sock.setblocking(False)
+        return sock
+
+    return None
+
+
+async def _echo(sock: socket.socket, address: str) -> bool:
+    loop = asyncio.get_running_loop()
+    identifier = os.getpid() & 0xffff
+    sequence = next(_sequence) & 0xffff
+    await loop.sock_sendto(
+        sock,
+        _echo_request(identifier, sequence),
+        (address, 0)
+    )
+    while True:
+        packet, (source, _) = await loop.sock_recvfrom(sock, 1024)
+        if (sock.type == socket.SOCK_RAW):
+            packet = packet[(packet[0] & 0x0f) * 4:]
+
+        if (len(packet) < 8 or source != address):
+            continue
+
+        kind, _, _, _, reply_sequence = struct.unpack("!BBHHH", packet[:8])
+        if (kind == ICMP_ECHO_REPLY and reply_sequence == sequence):
+            return True
+
+
+async def ping(host: str, timeout: float = ICMP_TIMEOUT) -> bool:
+    loop = asyncio.get_running_loop()
+    try:
+        addresses = await loop.getaddrinfo(host, None, family=socket.AF_INET)
+    except OSError:
+        return False
+
+    address = addresses[0][4][0]
+    sock = _icmp_socket()
+    if (sock is None):
+        return await _connect_ping(address, timeout)
+
+    try:
+        return await asyncio.wait_for(_echo(sock, address), timeout)
+    except (OSError, asyncio.TimeoutError):
+        return False
+    finally:
+        sock.close()
+
+
+async def _connect_ping(address: str, timeout: float) -> bool:
+    try:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(address, ECHO_PORT),
+            timeout
+        )
+    except ConnectionRefusedError:
+        return True
+    except (OSError, asyncio.TimeoutError):
+        return False
+
+    writer.close()
+    return True
@@ -0,0 +1,116 @@
+import time
+import discord
+from collections import Counter, OrderedDict
+from typing import Any, Dict, Final, Optional, Tuple
+from discord.ext import commands
+
+CACHE_SIZE: Final[int] = 512
+CACHE_SECONDS: Final[float] = 600.0
+
+Key = Tuple[str, int]
+
+
+class Resolver:
+    def __init__(
+            self,
+            bot: commands.Bot,
+            size: int = CACHE_SIZE,
+            ttl: float = CACHE_SECONDS
+    ) -> None:
+        self.bot = bot
+        self.size = size
+        self.ttl = ttl
+        self.counters: Counter[str] = Counter()
+        self._cache: OrderedDict[Key, Tuple[float, Any]] = OrderedDict()
+
+    def _get(self, key: Key) -> Optional[Any]:
+        entry = self._cache.get(key)
+        if (entry is None):
+            return None
+
+        expires, obj = entry
+        if (time.monotonic() >= expires):
+            del self._cache[key]
+            return None
+
+        self._cache.move_to_end(key)
+        return obj
+
+    def _put(self, key: Key, obj: Any) -> Any:
+        self._cache[key] = (time.monotonic() + self.ttl, obj)
+        self._cache.move_to_end(key)
+        while (len(self._cache) > self.size):
+            self._cache.popitem(last=False)
+
+        return obj
+
+    def _hit(self, source: str, kind: str) -> None:
+        self.counters[source] += 1
+        self.counters[f"{kind}_{source}"] += 1
+
+    async def channel(self, channel_id: int) -> discord.abc.Messageable:
+        channel = self.bot.get_channel(channel_id)
+        if (channel is not None):
+            self._hit("gateway", "channel")
+            return channel
+
+        channel = self._get(("channel", channel_id))
+        if (channel is not None):
+            self._hit("cache", "channel")
+            return channel
+
+        self._hit("rest", "channel")
+        return self._put(
+            ("channel", channel_id),
+            await self.bot.fetch_channel(channel_id)
+        )
+
+    async def user(self, user_id: int) -> discord.User:
+        user = self.bot.get_user(user_id)
+        if (user is not None):
+            self._hit("gateway", "user")
+            return user
+
+        user = self._get(("user", user_id))
+        if (user is not None):
+            self._hit("cache", "user")
+            return user
+
+        self._hit("rest", "user")
+        return self._put(
+            ("user", user_id),
+            await self.bot.fetch_user(user_id)
+        )
+
+    async def dm(self, user_id: int) -> discord.DMChannel:
+        user = await self.user(user_id)
+        if (user.dm_channel is not None):
+            self._hit("gateway", "dm")
+            return user.dm_channel
+
+        dm_channel = self._get(("dm", user_id))
+        if (dm_channel is not None):
+            self._hit("cache", "dm")
+            return dm_channel
+
+        self._hit("rest", "dm")
+        return self._put(("dm", user_id), await user.create_dm())
+
+    def invalidate(
+            self,
+            kind: Optional[str] = None,
+            object_id: int = 0
+    ) -> None:
+        if (kind is None):
+            self._cache.clear()
+        else:
+            self._cache.pop((kind, object_id), None)
+
+    def stats(self) -> Dict[str, int]:
+        hits = self.counters["gateway"] + self.counters["cache"]
+        return {
+            "hits": hits,
+            "misses": self.counters["rest"],
+            "cached": len(self._cache),
+            **self.counters
+        }
@@ -1,19 +1,83 @@
 import os
-import sys
-import sqlite3
+import asyncio
 import discord
 from enum import IntFlag
-from typing import Callable
-from discord.ext import commands
+from typing import (
+    Any, Awaitable, Callable, Dict, Final, List, Optional, Tuple
+)
+from discord.ext import commands, tasks
 from lib.orderedcog import OrderedCog
-from lib.config import Config
+from lib.templates import Template
+from lib.probes import Probe
+from lib.metrics import metrics, timed
+
+CHECK_STATE_SECONDS: Final[float] = 30.0
+NOTIFY_CONCURRENCY: Final[int] = 5
+
+
+class ProbeScheduler:
+    def __init__(self, bot: commands.Bot) -> None:
+        self.bot = bot
+        self.cogs: Dict[str, 'ServerCog'] = {}
+        self.check_states = tasks.loop(seconds=CHECK_STATE_SECONDS)(
+            self.run_once
+        )
+        self.check_states.before_loop(self.bot.wait_until_ready)
+
+    def register(self, cog: 'ServerCog') -> None:
+        self.cogs[cog.qualified_name] = cog
+        if (not self.check_states.is_running()):
+            self.check_states.start()
+
+    def unregister(self, cog: 'ServerCog') -> None:
+        self.cogs.pop(cog.qualified_name, None)
+
+    def cancel(self) -> None:
+        self.check_states.cancel()
+
+    @staticmethod
+    async def _check(probe: Probe) -> bool:
+        try:
+            with metrics.timer("probe_seconds", kind=probe.kind):
+                return await probe.check()
+        except Exception as e:
+            print(f"Probe {probe} failed: {e}")
+            return False
+
+    async def run_once(self) -> None:
+        cog_probes = {
+            name: cog.probes() for name, cog in self.cogs.items()
+        }
+        targets = list({
+            probe
+            for probes in cog_probes.values()
+            for probe in probes.values()
+        })
+        results = dict(zip(
+            targets,
+            await asyncio.gather(*(self._check(probe) for probe in targets))
+        ))
+        names = [name for name in cog_probes if name in self.cogs]
+        errors = await asyncio.gather(
+            *(
+                self.cogs[name]._apply_probes({
+                    key: results[probe]
+                    for key, probe in cog_probes[name].items()
+                })
+                for name in names
+            ),
+            return_exceptions=True
+        )
+        for name, error in zip(names, errors):
+            if (isinstance(error, Exception)):
+                print(f"Failed to update state of {name}: {error}")
 
 
 class ServerCog(OrderedCog):
     instances = 0
+    scheduler: Optional[ProbeScheduler] = None
 
     def __init__(self, bot: commands.Bot) -> None:
-        super().__init__(bot)
         if (not issubclass(self.State, IntFlag)):
             raise NotImplementedError("State not a subclass of IntFlag")
 
@@ -23,72 +87,103 @@ class ServerCog(OrderedCog):
         except AttributeError as e:
             raise NotImplementedError(f"No state {e} detected")
 
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        with (
-            open(f"{sql_dir}/create_servers.sql", "r")
-            as sql_create_server,
-            open(f"{sql_dir}/insert_server.sql", "r")
-            as sql_insert_server,
-        ):
-            create_servers_table = sql_create_server.read()
-            insert_server = sql_insert_server.read()
-
-        db_path = os.environ["BOT_DB"]
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        db.execute("PRAGMA FOREIGN_KEYS = ON")
-        cursor = db.cursor()
-        try:
-            cursor.execute(create_servers_table)
-            cursor.execute(
-                insert_server,
-                (self.qualified_name, self.State.INACTIVE.value)
-            )
-        except Exception as e:
-            exc_type, exc_obj, exc_tb = sys.exc_info()
-            fname = os.path.split(exc_tb.tb_frame.f_code.co_filename)[1]
-            print(exc_type, fname, exc_tb.tb_lineno)
+        super().__init__(bot)
 
-        db.commit()
-        db.close()
+    def db_rows(self) -> List[Tuple[str, Tuple[Any, ...]]]:
+        server_row = (self.qualified_name, self.State.INACTIVE.value)
+        return super().db_rows() + [("insert_server", server_row)]
 
+    @timed("db_seconds")
     async def _update_state(self, state: 'State') -> None:
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        with (
-            open(f"{sql_dir}/update_server_state.sql", "r")
-                as sql_update_server_state,
-        ):
-            update_server = sql_update_server_state.read()
-
-        db_path = os.environ["BOT_DB"]
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        db.execute("PRAGMA FOREIGN_KEYS = ON")
-        cursor = db.cursor()
-        cursor.execute(
-            update_server,
-            (state.value, self.qualified_name)
-        )
-        db.commit()
-        db.close()
+        await self.bot.db.update_state(self.qualified_name, state.value)
 
+    @timed("db_seconds")
     async def get_state(self) -> 'State':
-        config = Config.from_json(os.environ["BOT_CONFIG"])
-        sql_dir = config.dir.sql
-        with (
-            open(f"{sql_dir}/select_server_state.sql", "r")
-                as sql_select_server_state,
-        ):
-            get_state = sql_select_server_state.read()
-
-        db_path = os.environ["BOT_DB"]
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        db.execute("PRAGMA FOREIGN_KEYS = ON")
-        cursor = db.cursor()
-        cursor.execute(get_state, (self.qualified_name,))
-        state = self.State(cursor.fetchone()[0])
-        db.close()
-        return state
+        return self.State(await self.bot.db.get_state(self.qualified_name))
+
+    def probes(self) -> Dict[str, Probe]:
+        raise NotImplementedError("No probes declared")
+
+    def probed_state(self, results: Dict[str, bool]) -> 'State':
+        if (all(results.values())):
+            return self.State.ACTIVE
+
+        if (not results.get("host", True)):
+            try:
+                return self.State.HOST_INACTIVE
+            except AttributeError:
+                pass
+
+        return self.State.INACTIVE
+
+    async def _notify_channel(self, channel_id: int, message: str) -> None:
+        channel = await self.bot.resolver.channel(channel_id)
+        await channel.send(message)
+
+    async def _notify_user(self, user_id: int, message: str) -> None:
+        user_dm = await self.bot.resolver.dm(user_id)
+        await user_dm.send(message)
+
+    async def notify(
+            self,
+            message: str,
+            channels: bool = True,
+            users: bool = True
+    ) -> Dict[str, Exception]:
+        semaphore = asyncio.Semaphore(NOTIFY_CONCURRENCY)
+
+        async def send(
+                send_to: Callable[[int, str], Awaitable[None]],
+                target_id: int
+        ) -> None:
+            async with semaphore:
+                await send_to(target_id, message)
+
+        targets = []
+        if (channels):
+            targets += [
+                (f"channel {channel_id}", self._notify_channel, channel_id)
+                for channel_id in await self.get_channels()
+            ]
+
+        if (users):
+            targets += [
+                (f"user {user_id}", self._notify_user, user_id)
+                for user_id in await self.get_users()
+            ]
+
+        results = await asyncio.gather(
+            *(send(send_to, target_id) for _, send_to, target_id in targets),
+            return_exceptions=True
+        )
+        failures = {
+            target: result
+            for (target, _, _), result in zip(targets, results)
+            if isinstance(result, Exception)
+        }
+        for target, error in failures.items():
+            print(f"{self.qualified_name}: failed to notify {target}: "
+                  f"{error}")
+
+        return failures
+
+    async def _apply_probes(self, results: Dict[str, bool]) -> None:
+        state = await self.get_state()
+        new_state = self.probed_state(results)
+        if (new_state == state):
+            return
+
+        await self._update_state(new_state)
+        if (not (state ^ new_state) & self.State.ACTIVE):
+            return
+
+        constants = Template.load(os.environ["BOT_CONSTANTS"])
+        if (new_state & self.State.ACTIVE):
+            message = constants.messages.servers.response
+        else:
+            message = constants.messages.servers.no_response
+
+        await self.notify(message.format(cog=self.qualified_name))
 
     class ServerError(commands.CommandError):
         def __init__(self, message: str, server: str) -> None:
@@ -143,10 +238,17 @@ class ServerCog(OrderedCog):
             pass
 
         ServerCog.instances += 1
+        if (ServerCog.scheduler is None):
+            ServerCog.scheduler = ProbeScheduler(self.bot)
+
+        ServerCog.scheduler.register(self)
 
     async def cog_unload(self) -> None:
+        ServerCog.scheduler.unregister(self)
         ServerCog.instances -= 1
         if (ServerCog.instances == 0):
+            ServerCog.scheduler.cancel()
+            ServerCog.scheduler = None
             await self.bot.unload_extension("cogs._db-server")
 
         await super().cog_unload()
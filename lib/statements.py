@@ -0,0 +1,78 @@
+import os
+import time
+import sqlite3
+import pathlib
+from typing import Dict, Final, Iterator, Optional, Tuple
+
+RELOAD_SECONDS: Final[float] = 1.0
+
+
+class Statements:
+    def __init__(self, sql_dir: str) -> None:
+        self.sql_dir = pathlib.Path(sql_dir)
+        self._statements: Dict[str, str] = {}
+        self._directory: Optional[Tuple[int, int]] = None
+        self._checked = time.monotonic()
+        self.load()
+
+    def _stat(self) -> Tuple[int, int]:
+        stat = os.stat(self.sql_dir)
+        return (stat.st_ino, stat.st_mtime_ns)
+
+    @staticmethod
+    def validate(sql: str) -> bool:
+        sql = sql.strip()
+        if (not sql):
+            return False
+
+        if (not sql.endswith(";")):
+            sql += ";"
+
+        return sqlite3.complete_statement(sql)
+
+    def load(self) -> None:
+        directory = self._stat()
+        statements: Dict[str, str] = {}
+        for path in sorted(self.sql_dir.glob("*.sql")):
+            with open(path, "r") as sql_script:
+                sql = sql_script.read()
+
+            if (not self.validate(sql)):
+                raise ValueError(f"Incomplete SQL statement in {path}.")
+
+            statements[path.stem] = sql
+
+        self._statements = statements
+        self._directory = directory
+
+    def refresh(self) -> bool:
+        self._checked = time.monotonic()
+        try:
+            if (self._stat() == self._directory):
+                return False
+
+            self.load()
+        except (OSError, ValueError) as e:
+            print(f"Failed to reload SQL scripts: {e}")
+            return False
+
+        print(f"Reloaded SQL scripts from {self.sql_dir}")
+        return True
+
+    def __getitem__(self, name: str) -> str:
+        if (time.monotonic() - self._checked >= RELOAD_SECONDS):
+            self.refresh()
+
+        try:
+            return self._statements[name]
+        except KeyError:
+            raise KeyError(f"No SQL script {name}.sql in {self.sql_dir}.")
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._statements
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._statements)
+
+    def __len__(self) -> int:
+        return len(self._statements)
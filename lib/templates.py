@@ -0,0 +1,132 @@
+import re
+import string
+from typing import Any, Dict, Final, FrozenSet, List, Optional, Tuple, Self
+from lib.config import Config
+
+PLACEHOLDERS: Final[FrozenSet[str]] = frozenset(
+    {"cog", "prefix", "command", "state", "host", "rows"}
+)
+LEGACY_FIELDS: Final[Dict[str, str]] = {
+    "self.qualified_name": "cog",
+    "self.bot.command_prefix": "prefix",
+    "ctx.command": "command",
+    "state.name": "state",
+    "host_server": "host"
+}
+LEGACY_PATTERN: Final[re.Pattern[str]] = re.compile(r"^f([\"'])(.*)\1$", re.S)
+
+Part = Tuple[str, Optional[str], Optional[str], str]
+
+
+class Template(str):
+    __slots__ = ("parts", "fields")
+
+    def __new__(cls, text: str) -> Self:
+        match = LEGACY_PATTERN.match(text)
+        if (match is not None):
+            text = cls.translate(match.group(2))
+
+        template = super().__new__(cls, text)
+        template.parts = cls.compile(text)
+        template.fields = frozenset(
+            part[1] for part in template.parts if part[1] is not None
+        )
+        return template
+
+    @staticmethod
+    def translate(source: str) -> str:
+        text = ""
+        for literal, field, spec, conversion in (
+                string.Formatter().parse(source)
+        ):
+            text += literal.replace("{", "{{").replace("}", "}}")
+            if (field is None):
+                continue
+
+            try:
+                text += "{" + LEGACY_FIELDS[field]
+            except KeyError:
+                raise ValueError(f"Unsupported expression {{{field}}}.")
+
+            if (conversion):
+                text += "!" + conversion
+
+            if (spec):
+                text += ":" + spec
+
+            text += "}"
+
+        return text
+
+    @staticmethod
+    def compile(text: str) -> List[Part]:
+        parts: List[Part] = []
+        try:
+            parsed = list(string.Formatter().parse(text))
+        except ValueError as e:
+            raise ValueError(f"Malformed template {text!r}: {e}")
+
+        for literal, field, spec, conversion in parsed:
+            if (field is not None and field not in PLACEHOLDERS):
+                raise ValueError(
+                    f"Unknown placeholder {{{field}}} in {text!r}. "
+                    f"Expected one of {sorted(PLACEHOLDERS)}."
+                )
+
+            parts.append((literal, field, conversion, spec or ""))
+
+        return parts
+
+    def format(self, **values: Any) -> str:  # type: ignore[override]
+        text = ""
+        for literal, field, conversion, spec in self.parts:
+            text += literal
+            if (field is None):
+                continue
+
+            value = values[field]
+            match conversion:
+                case "r":
+                    value = repr(value)
+                case "s":
+                    value = str(value)
+                case "a":
+                    value = ascii(value)
+
+            text += format(value, spec)
+
+        return text
+
+    @classmethod
+    def compile_config(cls, config: Config, key: str = "") -> Config:
+        compiled = Config()
+        for name, value in config.data.items():
+            path = f"{key}.{name}" if key else name
+            if (isinstance(value, (dict, Config))):
+                compiled.data[name] = cls.compile_config(Config(value), path)
+            elif (isinstance(value, str)):
+                try:
+                    compiled.data[name] = cls(value)
+                except ValueError as e:
+                    raise ValueError(f"Invalid message {path}: {e}")
+            else:
+                compiled.data[name] = value
+
+        return compiled
+
+    @classmethod
+    def load(cls, constants_file: str) -> Config:
+        constants = Config.load(constants_file)
+        entry = _cache.get(constants_file)
+        if (entry is None or entry[0] is not constants):
+            try:
+                entry = (constants, cls.compile_config(constants))
+            except ValueError as e:
+                raise ValueError(f"{constants_file}: {e}")
+
+            _cache[constants_file] = entry
+
+        return entry[1]
+
+
+_cache: Dict[str, Tuple[Config, Config]] = {}
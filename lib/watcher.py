@@ -0,0 +1,201 @@
+import os
+import struct
+import ctypes
+import ctypes.util
+import asyncio
+import pathlib
+from typing import AsyncIterator, Dict, Final, Optional, Set, Tuple
+
+IN_MODIFY: Final[int] = 0x00000002
+IN_CLOSE_WRITE: Final[int] = 0x00000008
+IN_MOVED_FROM: Final[int] = 0x00000040
+IN_MOVED_TO: Final[int] = 0x00000080
+IN_CREATE: Final[int] = 0x00000100
+IN_DELETE: Final[int] = 0x00000200
+IN_DELETE_SELF: Final[int] = 0x00000400
+IN_IGNORED: Final[int] = 0x00008000
+IN_ISDIR: Final[int] = 0x40000000
+IN_NONBLOCK: Final[int] = 0o4000
+IN_CLOEXEC: Final[int] = 0o2000000
+WATCH_MASK: Final[int] = (IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM |
+                          IN_MOVED_TO | IN_CREATE | IN_DELETE |
+                          IN_DELETE_SELF)
+EVENT_HEADER: Final[struct.Struct] = struct.Struct("iIII")
+
+Snapshot = Dict[pathlib.Path, Tuple[int, int]]
+
+
+class Inotify:
+    def __init__(self) -> None:
+        library = ctypes.util.find_library("c")
+        if (library is None):
+            raise OSError("libc not found")
+
+        self._libc = ctypes.CDLL(library, use_errno=True)
+        self.fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if (self.fd < 0):
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+        self.dirs: Dict[int, pathlib.Path] = {}
+
+    def add_watch(self, path: pathlib.Path) -> None:
+        wd = self._libc.inotify_add_watch(
+            self.fd,
+            os.fsencode(path),
+            WATCH_MASK
+        )
+        if (wd < 0):
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), str(path))
+
+        self.dirs[wd] = path
+
+    def read(self) -> Tuple[Set[pathlib.Path], Set[pathlib.Path]]:
+        files: Set[pathlib.Path] = set()
+        new_dirs: Set[pathlib.Path] = set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return files, new_dirs
+
+        offset = 0
+        while (offset < len(data)):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            if (mask & IN_IGNORED):
+                self.dirs.pop(wd, None)
+                continue
+
+            directory = self.dirs.get(wd)
+            if (directory is None or not name):
+                continue
+
+            path = directory / os.fsdecode(name)
+            if (mask & IN_ISDIR):
+                if (mask & (IN_CREATE | IN_MOVED_TO)):
+                    new_dirs.add(path)
+            elif (path.suffix == ".py"):
+                files.add(path)
+
+        return files, new_dirs
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class ExtensionWatcher:
+    def __init__(
+            self,
+            root: pathlib.Path,
+            debounce: float,
+            poll_interval: float
+    ) -> None:
+        self.root = root
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.mode = "polling"
+        self._changes: asyncio.Queue[pathlib.Path] = asyncio.Queue()
+        self._inotify: Optional[Inotify] = None
+        self._poller: Optional[asyncio.Task] = None
+
+    def _watch_tree(self, directory: pathlib.Path) -> None:
+        for path in [directory, *directory.rglob("*")]:
+            if (path.is_dir() and path.name != "__pycache__"):
+                self._inotify.add_watch(path)
+                for file in path.glob("*.py"):
+                    self._changes.put_nowait(file)
+
+    def _on_readable(self) -> None:
+        files, new_dirs = self._inotify.read()
+        for directory in new_dirs:
+            try:
+                self._watch_tree(directory)
+            except OSError as e:
+                print(f"Failed to watch {directory}: {e}")
+
+        for file in files:
+            self._changes.put_nowait(file)
+
+    def _snapshot(self) -> Snapshot:
+        snapshot: Snapshot = {}
+        for path in self.root.rglob("*.py"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+
+        return snapshot
+
+    async def _poll(self) -> None:
+        previous = await asyncio.to_thread(self._snapshot)
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            current = await asyncio.to_thread(self._snapshot)
+            for path in previous.keys() | current.keys():
+                if (previous.get(path) != current.get(path)):
+                    self._changes.put_nowait(path)
+
+            previous = current
+
+    def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            self._inotify = Inotify()
+            for directory in [self.root, *self.root.rglob("*")]:
+                if (directory.is_dir() and directory.name != "__pycache__"):
+                    self._inotify.add_watch(directory)
+
+            loop.add_reader(self._inotify.fd, self._on_readable)
+            self.mode = "inotify"
+        except (OSError, AttributeError, NotImplementedError) as e:
+            print(f"inotify unavailable, polling for changes instead: {e}")
+            if (self._inotify is not None):
+                self._inotify.close()
+                self._inotify = None
+
+            self._poller = loop.create_task(self._poll())
+
+    def stop(self) -> None:
+        if (self._inotify is not None):
+            asyncio.get_running_loop().remove_reader(self._inotify.fd)
+            self._inotify.close()
+            self._inotify = None
+
+        if (self._poller is not None):
+            self._poller.cancel()
+            self._poller = None
+
+    async def changes(self) -> AsyncIterator[Set[pathlib.Path]]:
+        loop = asyncio.get_running_loop()
+        pending: Dict[pathlib.Path, float] = {}
+        while True:
+            timeout = None
+            if (pending):
+                timeout = max(
+                    min(pending.values()) + self.debounce - loop.time(),
+                    0
+                )
+
+            try:
+                path = await asyncio.wait_for(self._changes.get(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            else:
+                pending[path] = loop.time()
+                continue
+
+            now = loop.time()
+            paths = {
+                path for path, changed in pending.items()
+                if changed + self.debounce <= now
+            }
+            for path in paths:
+                del pending[path]
+
+            if (paths):
+                yield paths
@@ -7,20 +7,33 @@ import logging
 import discord
 import typing
 import traceback
-import sqlite3
-from typing import Any, Tuple, Mapping, Dict
-from datetime import datetime
+from typing import Any, Tuple, Mapping, Dict, DefaultDict, Optional
+from collections import defaultdict
 from discord.ext import commands, tasks
 from lib.config import Config
+from lib.templates import Template
+from lib.database import Database
+from lib.resolver import Resolver
+from lib.watcher import ExtensionWatcher
+from lib.loader import ExtensionLoader
+from lib.logs import COMMANDS_LOGGER, ERRORS_LOGGER, LogPipeline
+from lib.metrics import HEALTH_LAG_SECONDS, MetricsServer, metrics
 
-config = Config.from_json(os.environ["BOT_CONFIG"])
-constants = Config.from_json(os.environ["BOT_CONSTANTS"])
-os.makedirs(os.path.dirname(config.logs.handler), exist_ok=True)
-handler = logging.FileHandler(
-    filename=config.logs.handler,
-    encoding='utf-8',
-    mode='w'
+config = Config.load(os.environ["BOT_CONFIG"])
+constants = Template.load(os.environ["BOT_CONSTANTS"])
+rotation = {
+    "max_bytes": config.logs.rotation.max_bytes,
+    "rotate_seconds": config.logs.rotation.hours * 60 * 60,
+    "backups": config.logs.rotation.backups
+}
+log_pipeline = LogPipeline(config.logs.flush_seconds)
+handler = log_pipeline.handler("discord", config.logs.handler, **rotation)
+commands_log = log_pipeline.logger(
+    COMMANDS_LOGGER,
+    config.logs.commands,
+    **rotation
 )
+errors_log = log_pipeline.logger(ERRORS_LOGGER, config.logs.errors, **rotation)
 
 intents = discord.Intents.default()
 intents.message_content = True
@@ -40,51 +53,75 @@ class DiscordServerCogs(commands.Bot):
         super().__init__(*args, **kwargs)
         self.logger = logging.getLogger(self.__class__.__name__)
         self.ext_dir = pathlib.Path(ext_dir)
+        self.db = Database(
+            os.environ["BOT_DB"],
+            config.dir.sql,
+            readers=int(os.getenv("BOT_DB_READERS", 2)),
+            busy_timeout=float(os.getenv("BOT_DB_BUSY_SECONDS", 5.0)),
+            profile=config.database.profile
+        )
+        self.resolver = Resolver(self)
+        self._extension_locks: DefaultDict[str, asyncio.Lock] = (
+            defaultdict(asyncio.Lock)
+        )
+        self.metrics_server: Optional[MetricsServer] = None
+        self.before_invoke(self.before_command)
+        self.after_invoke(self.after_command)
+
+    async def load_extension(
+            self,
+            name: str,
+            *,
+            package: Optional[str] = None
+    ) -> None:
+        async with self._extension_locks[name]:
+            await super().load_extension(name, package=package)
 
     async def _load_extensions(self) -> None:
         print("Loading extensions...")
-        for file in self.ext_dir.rglob("*.py"):
-            if (file.stem.startswith("_")):
+        loader = ExtensionLoader(self, self.ext_dir)
+        results = await loader.load_all()
+        for name, (_, error) in results.items():
+            if (error is None):
                 continue
 
-            try:
-                await self.load_extension(".".join(file.with_suffix("").parts))
-                print(f"Loaded extension {file}")
-            except commands.ExtensionError as e:
-                print(f"Failed to load extension {file}: {e}")
-                log = ('[' + str(datetime.now()) + ']' + " " +
-                       traceback.format_exc())
-                os.makedirs(
-                    os.path.dirname(config.logs.errors),
-                    exist_ok=True
-                )
-                with open(config.logs.errors, "a") as file:
-                    print(log, file=file)
+            errors_log.error(
+                f"Failed to load extension {name}: {error}",
+                exc_info=error
+            )
+
+        print(loader.report())
+
+    async def _sync_extension(self, file: pathlib.Path) -> None:
+        ext = ".".join(file.with_suffix("").parts)
+        try:
+            if (not file.exists()):
+                if (ext in self.extensions):
+                    await self.unload_extension(ext)
+                    print(f"Unloaded extension {ext}")
+            elif (ext in self.extensions):
+                await self.reload_extension(ext)
+                print(f"Reloaded extension {ext}")
+            elif (not file.stem.startswith("_")):
+                await self.load_extension(ext)
+                print(f"Loaded extension {ext}")
+        except commands.ExtensionError as e:
+            print(f"Failed to sync extension {ext}: {e}")
 
     async def _cog_watcher(self) -> None:
-        print("Watching for changes...")
-        last = time.time()
-        while True:
-            extensions: set[str] = set()
-            for name, module in self.extensions.items():
-                try:
-                    if (module.__file__ and
-                            os.stat(module.__file__).st_mtime > last):
-                        extensions.add(name)
-                except FileNotFoundError as e:
-                    print(f"Failed to find module {module.__file__}: {e}")
-                    continue
-
-            for ext in extensions:
-                try:
-                    await self.reload_extension(ext)
-                    print(f"Reloaded extension {ext}")
-                except commands.ExtensionError as e:
-                    print(f"Failed to reload extension {ext}: {e}")
-
-            last = time.time()
-            sleep_time = float(os.getenv("BOT_WATCHER_SECONDS", 1))
-            await asyncio.sleep(sleep_time)
+        watcher = ExtensionWatcher(
+            self.ext_dir,
+            float(os.getenv("BOT_WATCHER_DEBOUNCE_SECONDS", 1.0)),
+            float(os.getenv("BOT_WATCHER_SECONDS", 1.0))
+        )
+        watcher.start()
+        print(f"Watching for changes ({watcher.mode})...")
+        try:
+            async for files in watcher.changes():
+                for file in sorted(files):
+                    await self._sync_extension(file)
+        finally:
+            watcher.stop()
 
     async def on_error(
             self,
@@ -107,53 +144,118 @@ class DiscordServerCogs(commands.Bot):
 
         print(f'Logged in as {self.user}.')
         self.check_name.start()
-        sql_dir = config.dir.sql
-        with (
-            open(f"{sql_dir}/select_users_table.sql", "r")
-            as sql_select_users_table,
-            open(f"{sql_dir}/select_channels_table.sql", "r")
-            as sql_select_channels_table,
-        ):
-            get_users_table = sql_select_users_table.read()
-            get_channels_table = sql_select_channels_table.read()
-
-        db_path = os.environ["BOT_DB"]
-        db = sqlite3.connect(db_path, check_same_thread=False)
-        db.execute("PRAGMA FOREIGN_KEYS = ON")
-        cursor = db.cursor()
-        cursor.execute(get_users_table)
-        user_records = cursor.fetchall()
-        cursor.execute(get_channels_table)
-        channel_records = cursor.fetchall()
-        db.close()
+        user_ids = await self.db.get_all_users()
+        channel_ids = await self.db.get_all_channels()
         enable_start_message = config.settings.enable_start_message
         if (enable_start_message):
-            msg_startup = eval(constants.messages.startup)
-            for record in user_records:
-                user = await self.fetch_user(record[0])
-                user_dm = await user.create_dm()
+            msg_startup = constants.messages.startup.format(
+                prefix=self.command_prefix
+            )
+            for user_id in user_ids:
+                user_dm = await self.resolver.dm(user_id)
                 await user_dm.send(msg_startup)
 
-            for record in channel_records:
-                channel = await self.fetch_channel(record[0])
+            for channel_id in channel_ids:
+                channel = await self.resolver.channel(channel_id)
                 await channel.send(msg_startup)
 
     async def on_command(self, ctx: commands.Context) -> None:
-        log = ('[' + str(datetime.now()) + ']' + " " + ctx.author.name +
-               " issued_command " + ctx.message.content + " in ")
         if isinstance(ctx.channel, discord.channel.DMChannel):
-            log += "private DMs."
+            where = "private DMs"
         else:
-            log += "#" + ctx.channel.name + "."
+            where = "#" + ctx.channel.name
+
+        commands_log.info(
+            "%s issued_command %s in %s.",
+            ctx.author.name,
+            ctx.message.content,
+            where
+        )
+
+    async def invoke(self, ctx: commands.Context) -> None:
+        if (ctx.command is None):
+            await super().invoke(ctx)
+            return
+
+        ctx.metrics_started = time.perf_counter()
+        await super().invoke(ctx)
+        command = ctx.command.qualified_name
+        metrics.observe(
+            "command_seconds",
+            time.perf_counter() - ctx.metrics_started,
+            command=command
+        )
+        metrics.inc(
+            "commands_total",
+            command=command,
+            status="failed" if ctx.command_failed else "ok"
+        )
+
+    async def before_command(self, ctx: commands.Context) -> None:
+        ctx.metrics_invoked = time.perf_counter()
+        started = getattr(ctx, "metrics_started", None)
+        if (started is not None):
+            metrics.observe(
+                "command_checks_seconds",
+                ctx.metrics_invoked - started,
+                command=ctx.command.qualified_name
+            )
 
-        print(log)
-        os.makedirs(os.path.dirname(config.logs.commands), exist_ok=True)
-        with open(config.logs.commands, "a") as file:
-            print(log, file=file)
+    async def after_command(self, ctx: commands.Context) -> None:
+        invoked = getattr(ctx, "metrics_invoked", None)
+        if (invoked is not None):
+            metrics.observe(
+                "command_callback_seconds",
+                time.perf_counter() - invoked,
+                command=ctx.command.qualified_name
+            )
+
+    def healthy(self) -> bool:
+        lag = metrics.gauges.get(("event_loop_lag_seconds", ()), 0.0)
+        return (self.is_ready() and not self.is_closed() and
+                lag < HEALTH_LAG_SECONDS)
+
+    async def _start_metrics(self) -> None:
+        metrics.collect("voice_clients", lambda: len(self.voice_clients))
+        metrics.collect("guilds", lambda: len(self.guilds))
+        metrics.collect("extensions_loaded", lambda: len(self.extensions))
+        metrics.collect("gateway_latency_seconds", lambda: self.latency)
+        metrics.collect("db_pending_writes", self.db.pending_writes)
+        metrics.collect(
+            "resolver_cached",
+            lambda: self.resolver.stats()["cached"]
+        )
+        self.measure_loop_lag.start()
+        port = int(os.getenv("BOT_METRICS_PORT", 0))
+        if (port):
+            host = os.getenv("BOT_METRICS_HOST", "127.0.0.1")
+            self.metrics_server = MetricsServer(self.healthy, host, port)
+            await self.metrics_server.start()
+            print(f"Serving metrics on http://{host}:{port}/metrics")
+
+    async def close(self) -> None:
+        if (self.metrics_server is not None):
+            self.metrics_server.close()
+
+        await super().close()
+        self.db.close()
 
     async def setup_hook(self) -> None:
+        await self._start_metrics()
+        profile = self.db.configure()
+        print("Database profile: " + ", ".join(
+            f"{name}={value}" for name, value in profile.items()
+        ))
+        for migration in self.db.migrate(config.dir.migrations):
+            print(f"Applied migration {migration}")
+
         await self._load_extensions()
         self._watcher = self.loop.create_task(self._cog_watcher())
+        self.sync_permissions.start()
+        self.maintain_db.change_interval(
+            minutes=config.database.maintenance.minutes
+        )
+        self.maintain_db.start()
 
     @tasks.loop(minutes=float(os.getenv("BOT_NAME_MINUTES", 10.0)))
     async def check_name(self) -> None:
@@ -161,6 +263,27 @@ class DiscordServerCogs(commands.Bot):
         if (bot_name != "" and self.user.name != bot_name):
             await self.user.edit(username=bot_name)
 
+    @tasks.loop(seconds=float(os.getenv("BOT_PERMISSIONS_SECONDS", 5.0)))
+    async def sync_permissions(self) -> None:
+        if (await self.db.sync_permissions()):
+            print("Permissions changed externally; reloading.")
+
+    @tasks.loop(seconds=float(os.getenv("BOT_LOOP_LAG_SECONDS", 1.0)))
+    async def measure_loop_lag(self) -> None:
+        loop = asyncio.get_running_loop()
+        expected = loop.time() + 0.1
+        await asyncio.sleep(0.1)
+        metrics.set("event_loop_lag_seconds", max(loop.time() - expected, 0.0))
+
+    @tasks.loop(minutes=60.0)
+    async def maintain_db(self) -> None:
+        bot_config = Config.load(os.environ["BOT_CONFIG"])
+        maintenance = bot_config.database.maintenance
+        timings = await self.db.maintain(maintenance.vacuum_pages)
+        print("Database maintenance: " + ", ".join(
+            f"{name} {seconds:.3f}s" for name, seconds in timings.items()
+        ))
+
 
 command_prefix = os.environ["BOT_PREFIX"]
 bot = DiscordServerCogs(
@@ -168,8 +291,12 @@ bot = DiscordServerCogs(
     command_prefix=command_prefix,
     intents=intents)
 bot_token = os.environ["BOT_TOKEN"]
-bot.run(
-    bot_token,
-    log_handler=handler,
-    log_level=logging.DEBUG
-)
+log_pipeline.start()
+try:
+    bot.run(
+        bot_token,
+        log_handler=handler,
+        log_level=logging.DEBUG
+    )
+finally:
+    log_pipeline.stop()